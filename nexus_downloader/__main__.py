@@ -16,6 +16,8 @@ def main():
     apply_theme(app)
 
     window = MainWindow()
+    app.aboutToQuit.connect(window.download_manager.close)
+    app.aboutToQuit.connect(window.history_service.close)
     window.show()
     sys.exit(app.exec())
 
@@ -3,11 +3,11 @@ This module contains the data models for the application.
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Optional
 import uuid
 
-class DownloadStatus(Enum):
+class DownloadStatus(IntEnum):
     """
     Represents the status of a download.
     """
@@ -20,7 +20,10 @@ class DownloadStatus(Enum):
     CANCELLED = auto()
     ERROR = auto()
 
-@dataclass
+# Statuses after which a download row no longer changes
+FINISHED_STATES = frozenset({DownloadStatus.COMPLETED, DownloadStatus.CANCELLED, DownloadStatus.ERROR})
+
+@dataclass(slots=True)
 class DownloadItem:
     """
     Represents a single video that can be downloaded.
@@ -36,7 +39,7 @@ class DownloadItem:
     selected: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoryEntry:
     """Represents a single download history record."""
     url: str
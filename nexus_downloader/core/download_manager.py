@@ -1,36 +1,177 @@
 """
 This module provides a download manager to handle video fetching and downloading.
 """
-from PySide6.QtCore import QObject, QThread, Signal, QThreadPool, QRunnable
-from nexus_downloader.core.yt_dlp_service import YtDlpService
-import yt_dlp
+from PySide6.QtCore import QObject, Signal, QThreadPool, QRunnable
+from nexus_downloader.core.yt_dlp_service import YtDlpService, VideoInfoError, detect_platform
 from nexus_downloader.services.settings_service import SettingsService, AppSettings # Import SettingsService and AppSettings
+import functools
+import hashlib
+import itertools
 import os
+import logging
+import pathlib
+import shutil
 import threading
-from collections import deque
+import time
 
-class FetchWorker(QObject):
+logger = logging.getLogger(__name__)
+
+# Temp dir cleanup retries with exponential backoff while yt-dlp/ffmpeg release handles
+CLEANUP_INITIAL_DELAY = 0.05  # seconds
+CLEANUP_MAX_WAIT = 5.0  # seconds
+# Prefix of the per-URL temp dirs created inside the download folder
+TEMP_DIR_PREFIX = 'ndl_'
+# Temp dirs untouched for this long are removed at startup; younger ones are kept for resuming
+STALE_TEMP_DIR_AGE = 7 * 24 * 60 * 60  # seconds
+# Leftovers of an interrupted download that must not be moved to the download folder
+INCOMPLETE_SUFFIXES = ('.part', '.ytdl')
+
+# Minimum time between progress signals of one download
+PROGRESS_EMIT_INTERVAL = 0.1  # seconds
+# Fields of yt-dlp's progress dictionary forwarded with the progress signal
+PROGRESS_FIELDS = ('status', 'downloaded_bytes', 'total_bytes', 'total_bytes_estimate', 'speed', 'eta',
+                   '_percent_str')
+
+# Number of playlist entries a fetch collects before handing them to the UI
+FETCH_BATCH_SIZE = 50
+
+# Platform display name -> AppSettings attribute holding its cookies file
+COOKIES_SETTING_BY_PLATFORM = {
+    "Bilibili": "bilibili_cookies_path",
+    "Xiaohongshu": "xiaohongshu_cookies_path",
+    "Facebook": "facebook_cookies_path",
+}
+
+class FetchWorker(QRunnable):
     """
-    A worker that fetches video information in a separate thread.
+    A worker that fetches video information in a separate thread, designed for QThreadPool.
     """
-    finished = Signal(list)
-    error = Signal(str)
+    # QRunnable does not support signals directly, so we'll use a QObject for signals
+    class Signals(QObject):
+        entries_found = Signal(list)  # Emit a batch of video info dictionaries while fetching
+        finished = Signal(list)       # Emit the remaining video info dictionaries
+        error = Signal(str)           # Emit the error message
 
-    def __init__(self, url, cookies_file=None):
+    def __init__(self, url, cookies_file=None, yt_dlp_service=None):
         super().__init__()
         self.url = url
         self.cookies_file = cookies_file
-        self.yt_dlp_service = YtDlpService()
+        self.yt_dlp_service = yt_dlp_service or YtDlpService()
+        self.signals = self.Signals()
 
     def run(self):
         """
         Fetches video information and emits the finished signal.
+
+        Playlist entries are emitted in batches of FETCH_BATCH_SIZE through
+        entries_found while the playlist is read; finished carries the rest.
+        """
+        batch = []
+        try:
+            for video in self.yt_dlp_service.iter_video_info(self.url, self.cookies_file):
+                batch.append(video)
+                if len(batch) >= FETCH_BATCH_SIZE:
+                    self.signals.entries_found.emit(batch)
+                    batch = []
+        except VideoInfoError as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(batch)
+
+class EntryDetailsWorker(QRunnable):
+    """
+    A worker that fetches the full metadata of one flat playlist entry, designed for QThreadPool.
+    """
+    # QRunnable does not support signals directly, so we'll use a QObject for signals
+    class Signals(QObject):
+        finished = Signal(str, dict)  # Emit the entry URL and its video info dictionary
+
+    def __init__(self, url, cookies_file=None, yt_dlp_service=None):
+        super().__init__()
+        self.url = url
+        self.cookies_file = cookies_file
+        self.yt_dlp_service = yt_dlp_service or YtDlpService()
+        self.signals = self.Signals()
+
+    def run(self):
         """
-        videos, error = self.yt_dlp_service.get_video_info(self.url, self.cookies_file)
-        if error:
-            self.error.emit(error)
-        else:
-            self.finished.emit(videos)
+        Fetches the entry's metadata and emits the finished signal.
+
+        Failures are not reported; the entry keeps its flat information.
+        """
+        info, _ = self.yt_dlp_service.get_single_video_info(self.url, self.cookies_file)
+        if info:
+            self.signals.finished.emit(self.url, info)
+
+def temp_dir_name(video_url: str, download_id: int = None) -> str:
+    """Returns the name of the temp dir a video is downloaded in.
+
+    Without a download id the name only depends on the URL, so a download that
+    failed or was cancelled finds its partial files again when it is retried.
+
+    Args:
+        video_url (str): The URL of the video.
+        download_id (int, optional): Makes the name unique to one download, for a
+            URL that is already being downloaded into the same folder.
+
+    Returns:
+        str: The directory name, starting with TEMP_DIR_PREFIX.
+    """
+    name = TEMP_DIR_PREFIX + hashlib.sha1(video_url.encode('utf-8')).hexdigest()[:16]
+    if download_id is not None:
+        name += f"_{download_id}"
+    return name
+
+
+def _unique_path(folder: pathlib.Path, name: str) -> pathlib.Path:
+    """Returns a path in folder for name that does not exist yet.
+
+    Args:
+        folder (pathlib.Path): The target folder.
+        name (str): The preferred file name.
+
+    Returns:
+        pathlib.Path: folder/name, or folder/"stem (n).suffix" for the first free n.
+    """
+    path = folder / name
+    counter = 1
+    while path.exists():
+        path = folder / f"{pathlib.Path(name).stem} ({counter}){pathlib.Path(name).suffix}"
+        counter += 1
+    return path
+
+
+def remove_stale_temp_dirs(folder_path: str, max_age: float = STALE_TEMP_DIR_AGE,
+                           keep=frozenset()) -> None:
+    """Removes download temp dirs nothing was written to for max_age seconds.
+
+    Temp dirs of failed or cancelled downloads are kept so the download can
+    resume; this drops the ones that were never retried.
+
+    Args:
+        folder_path (str): The download folder to scan.
+        max_age (float): Age in seconds after which a temp dir is removed.
+        keep (collections.abc.Container): Names of temp dirs to leave alone, such as
+            those of downloads about to resume from them.
+    """
+    cutoff = time.time() - max_age
+    try:
+        with os.scandir(folder_path) as entries:
+            temp_dirs = [entry.path for entry in entries
+                         if entry.name.startswith(TEMP_DIR_PREFIX) and entry.name not in keep
+                         and entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return
+    for temp_dir in temp_dirs:
+        try:
+            with os.scandir(temp_dir) as entries:
+                newest = max([entry.stat().st_mtime for entry in entries] + [os.stat(temp_dir).st_mtime])
+        except OSError:
+            continue
+        if newest < cutoff:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            logger.info(f"Removed stale temp dir: {temp_dir}")
+
 
 class DownloadWorker(QRunnable):
     """
@@ -42,13 +183,18 @@ class DownloadWorker(QRunnable):
         finished = Signal(str, str)  # Emit video_url and subtitle_status
         error = Signal(str, str)     # Emit video_url and error message
         cancelled = Signal(str)      # Emit video_url when cancelled
+        done = Signal(int)           # Emit download_id right before finished, error or cancelled
 
     def __init__(self, video_url, download_folder_path, video_resolution, video_format, audio_format,
                  cookies_file, yt_dlp_service, cancellation_event=None,
-                 subtitles_enabled=False, subtitle_language="en", embed_subtitles=False):
+                 subtitles_enabled=False, subtitle_language="en", embed_subtitles=False,
+                 download_id=0, resumable=True):
         super().__init__()
         self.video_url = video_url
+        # Identifies this download to the manager, also when the same URL is queued twice
+        self.download_id = download_id
         self.download_folder_path = download_folder_path
+        self._download_dir = pathlib.Path(download_folder_path)
         self.video_resolution = video_resolution
         self.video_format = video_format
         self.audio_format = audio_format
@@ -59,32 +205,70 @@ class DownloadWorker(QRunnable):
         self.subtitle_language = subtitle_language
         self.embed_subtitles = embed_subtitles
         self.signals = self.Signals()
+        # Set once the pool starts running this worker
+        self.started = False
+        self._last_progress_emit = 0.0
+        # Working directory of this download inside the download folder. It is stable per
+        # URL for resuming, unless the URL is already downloading and owns that directory
+        self._resumable = resumable
+        self._temp_dir = str(self._download_dir / temp_dir_name(video_url, None if resumable else download_id))
+        # Temp dir paths of the finished files of this run, as reported by yt-dlp's MoveFiles step
+        self._produced_files = []
 
     def progress_hook(self, d):
         """Progress hook called by yt-dlp during download.
         
-        Checks for cancellation and raises exception to interrupt yt-dlp.
+        Checks for cancellation and raises DownloadCancelled, which yt-dlp
+        propagates without retrying or wrapping, to interrupt the download.
+        Progress is forwarded at most every PROGRESS_EMIT_INTERVAL seconds,
+        reduced to PROGRESS_FIELDS.
         """
         # Check for cancellation during download
-        if self.cancellation_event and self.cancellation_event.is_set():
-            raise Exception("Download cancelled by user")
+        cancellation_event = self.cancellation_event
+        if cancellation_event and cancellation_event.is_set():
+            from yt_dlp.utils import DownloadCancelled
+            raise DownloadCancelled("Download cancelled by user")
         
-        if d['status'] == 'downloading':
-            self.signals.progress.emit(self.video_url, d)
+        if d['status'] != 'downloading':
+            return
+
+        now = time.monotonic()
+        total_bytes = d.get('total_bytes')
+        is_last_chunk = total_bytes is not None and d.get('downloaded_bytes') == total_bytes
+        if now - self._last_progress_emit < PROGRESS_EMIT_INTERVAL and not is_last_chunk:
+            return
+        self._last_progress_emit = now
+        self.signals.progress.emit(self.video_url, {key: d[key] for key in PROGRESS_FIELDS if key in d})
+
+    def postprocessor_hook(self, d):
+        """Postprocessor hook called by yt-dlp, noting the finished files of this run.
+
+        yt-dlp's MoveFiles step lists every file it moves out of the temp dir,
+        keyed by its temp path, including the ones it had to leave behind.
+        """
+        if d['postprocessor'] == 'MoveFiles' and d['status'] == 'finished':
+            self._produced_files.extend(d['info_dict'].get('__files_to_move') or ())
 
     def run(self):
         """
         Downloads the video and emits progress and finished signals.
         
-        Checks for cancellation before starting download and handles cleanup if cancelled.
+        Intermediate files live in the URL's temp dir inside the download folder.
+        It is removed after a successful download and kept after a failure or
+        cancellation, so retrying the download resumes from its partial files.
+        A download with a temp dir of its own (not resumable) removes it anyway.
+        Checks for cancellation before starting download.
         """
-        # Check for cancellation before starting
+        self.started = True
+
+        # Check for cancellation before starting; nothing has been written yet
         if self.cancellation_event and self.cancellation_event.is_set():
-            self._cleanup_incomplete_files()
-            self.signals.cancelled.emit(self.video_url)
+            self._finish(self.signals.cancelled, self.video_url)
             return
         
         try:
+            os.makedirs(self._temp_dir, exist_ok=True)
+
             success, subtitle_status, message = self.yt_dlp_service.download_video(
                 self.video_url, 
                 self.download_folder_path,
@@ -92,80 +276,96 @@ class DownloadWorker(QRunnable):
                 self.video_format,
                 self.audio_format,
                 progress_hook=self.progress_hook,
+                postprocessor_hook=self.postprocessor_hook,
                 cookies_file=self.cookies_file,
                 subtitles_enabled=self.subtitles_enabled,
                 subtitle_language=self.subtitle_language,
-                embed_subtitles=self.embed_subtitles
+                embed_subtitles=self.embed_subtitles,
+                temp_dir=self._temp_dir
             )
             
             # Check for cancellation after download attempt
             if self.cancellation_event and self.cancellation_event.is_set():
-                self._cleanup_incomplete_files()
-                self.signals.cancelled.emit(self.video_url)
+                self._release_temp_dir()
+                self._finish(self.signals.cancelled, self.video_url)
                 return
             
             if success:
-                self.signals.finished.emit(self.video_url, subtitle_status or "")
+                self._finalize_download()
+                self._remove_temp_dir()
+                self._finish(self.signals.finished, self.video_url, subtitle_status or "")
             else:
-                self.signals.error.emit(self.video_url, message)
+                self._release_temp_dir()
+                self._finish(self.signals.error, self.video_url, message)
                 
         except Exception as e:
+            self._release_temp_dir()
             # Check if this was a cancellation
             if self.cancellation_event and self.cancellation_event.is_set():
-                self._cleanup_incomplete_files()
-                self.signals.cancelled.emit(self.video_url)
+                self._finish(self.signals.cancelled, self.video_url)
             else:
                 # Real error
-                self.signals.error.emit(self.video_url, str(e))
+                self._finish(self.signals.error, self.video_url, str(e))
+
+    def _finish(self, signal, *args) -> None:
+        """Emits done and then the final signal of this download.
+
+        Args:
+            signal (SignalInstance): The finished, error or cancelled signal.
+            *args: The arguments of the final signal.
+        """
+        self.signals.done.emit(self.download_id)
+        signal.emit(*args)
+
+    def _finalize_download(self) -> None:
+        """Moves finished files yt-dlp left in the temp dir into the download folder.
+
+        yt-dlp moves finished files itself but leaves them in place when the
+        target name was taken meanwhile. They get a free name instead, so no
+        existing file is replaced. Only files this run produced are moved; what
+        earlier attempts left behind goes with the temp dir.
+        """
+        temp_dir = os.path.abspath(self._temp_dir)
+        for path in self._produced_files:
+            if os.path.dirname(os.path.abspath(path)) == temp_dir and os.path.isfile(path):
+                os.replace(path, _unique_path(self._download_dir, os.path.basename(path)))
     
-    def _cleanup_incomplete_files(self) -> None:
-        """Cleans up incomplete download files (both regular and .part files).
+    def _release_temp_dir(self) -> None:
+        """Removes the temp dir after a failure or cancellation unless a retry resumes from it."""
+        if not self._resumable:
+            self._remove_temp_dir()
+
+    def _remove_temp_dir(self) -> None:
+        """Deletes the temp dir of this download and any leftovers in it.
         
-        Uses robust retry logic to handle persistent file locks from yt-dlp/ffmpeg.
-        Only deletes .part files modified in the last 60 seconds.
+        Tries the deletion immediately and retries with exponential backoff to
+        handle file locks that yt-dlp/ffmpeg release asynchronously.
         """
-        import logging
-        import glob
-        import time
-        logger = logging.getLogger(__name__)
-        
-        try:
-            # Initial delay to let yt-dlp/ffmpeg close file handles
-            time.sleep(5.0)
-            
-            pattern = os.path.join(self.download_folder_path, '*')
-            part_files = glob.glob(pattern + '.part')
-            current_time = time.time()
-            
-            for part_file in part_files:
-                try:
-                    if os.path.exists(part_file):
-                        file_mtime = os.path.getmtime(part_file)
-                        if current_time - file_mtime < 60:  # Modified in last 60 seconds
-                            # Retry deletion up to 10 times with 1s delays (10s total)
-                            max_retries = 10
-                            for attempt in range(max_retries):
-                                try:
-                                    os.remove(part_file)
-                                    logger.info(f"Deleted partial file: {part_file}")
-                                    break
-                                except OSError as e:
-                                    if attempt < max_retries - 1:
-                                        time.sleep(1.0)  # Wait 1s between retries
-                                    else:
-                                        logger.warning(f"Failed to delete {part_file} after {max_retries} attempts: {e}")
-                except Exception as e:
-                    logger.warning(f"Error checking partial file {part_file}: {e}")
-            
-        except Exception as e:
-            logger.warning(f"Error during file cleanup for {self.video_url}: {e}")
+        delay = CLEANUP_INITIAL_DELAY
+        waited = 0.0
+        while True:
+            try:
+                shutil.rmtree(self._temp_dir)
+                logger.info(f"Deleted temp dir: {self._temp_dir}")
+                break
+            except FileNotFoundError:
+                break
+            except OSError as e:
+                if waited >= CLEANUP_MAX_WAIT:
+                    logger.warning(f"Failed to delete {self._temp_dir} after {waited:.1f}s: {e}")
+                    break
+                time.sleep(delay)
+                waited += delay
+                delay = min(delay * 2, CLEANUP_MAX_WAIT - waited)
 
 class DownloadManager(QObject):
     """
     Manages the fetching and downloading of videos.
     """
+    fetch_entries = Signal(list)  # Emit a batch of entries while a fetch is running
     fetch_finished = Signal(list)
     fetch_error = Signal(str)
+    entry_details_ready = Signal(str, dict)  # Emit entry URL and its full video info
     download_progress = Signal(str, dict) # Emit video_url and progress data
     download_finished = Signal(str, str)  # Emit video_url and subtitle_status
     download_error = Signal(str, str)     # Emit video_url and error message
@@ -173,16 +373,25 @@ class DownloadManager(QObject):
 
     def __init__(self):
         super().__init__()
-        self.fetch_thread = None
-        self.fetch_worker = None
-        
         self.settings_service = SettingsService()
         self.app_settings = self._load_initial_settings()
         self.yt_dlp_service = YtDlpService()
 
-        self.download_queue = deque()
         self.thread_pool = QThreadPool()
+        # Fetches get their own pool so they never hold a download slot or affect is_idle()
+        self.fetch_pool = QThreadPool()
+        # Fetch threads keep their YoutubeDL instances, so they must never expire and be
+        # replaced by new threads building new instances; the thread count stays bounded
+        self.fetch_pool.setExpiryTimeout(-1)
         self.set_concurrent_downloads(self.app_settings.concurrent_downloads_limit) # Use limit from settings
+        # Download folders already scanned for stale temp dirs in this session
+        self._swept_folders = set()
+        # Temp dirs of downloads never retried would otherwise stay in their folder for good.
+        # Downloads also run in recent and preset folders, and in organized subfolders,
+        # which are scanned once a download runs there
+        self._sweep_stale_temp_dirs(
+            [self.app_settings.download_folder_path, *self.app_settings.recent_folders,
+             *self.app_settings.folder_presets.values()])
         self.video_resolution = "best"  # Default value
         self.video_format = "mp4"  # Default video format
         self.audio_format = "m4a"  # Default audio format
@@ -190,8 +399,16 @@ class DownloadManager(QObject):
         self.subtitle_language = "en"  # Default subtitle language code
         self.embed_subtitles = False  # Default embed setting
         
-        # Thread-safe cancellation event for download workers
-        self._cancellation_event = threading.Event()
+        # Per-download cancellation events keyed by download id
+        self._cancellation_events = {}
+        # Workers handed to the pool, keyed by download id, until their final signal arrives
+        self._workers = {}
+        # Source of the download ids, which stay unique when a URL is queued more than once
+        self._download_ids = itertools.count()
+        # (download folder, URL) -> id of the download using the URL's stable temp dir
+        self._temp_dir_owners = {}
+        # Downloads handed to the pool whose finished/error/cancelled signal hasn't arrived yet
+        self._active_downloads = 0
 
     def _load_initial_settings(self) -> AppSettings:
         """Loads settings on application startup, handling potential errors."""
@@ -202,14 +419,31 @@ class DownloadManager(QObject):
             return AppSettings() # Return default settings on error
 
     def set_concurrent_downloads(self, limit):
-        """Sets the maximum number of concurrent downloads."""
+        """Sets the maximum number of concurrent downloads and fetches."""
         self.thread_pool.setMaxThreadCount(max(1, limit))
+        self.fetch_pool.setMaxThreadCount(max(1, limit))
+
+    def close(self) -> None:
+        """Releases the yt-dlp resources held for fetching; call on application exit."""
+        self.yt_dlp_service.close()
 
     def update_settings(self, settings: AppSettings):
         """Updates the settings used by the download manager."""
         self.app_settings = settings
         self.set_concurrent_downloads(settings.concurrent_downloads_limit)
 
+    def _sweep_stale_temp_dirs(self, folder_paths, keep=frozenset()) -> None:
+        """Removes stale temp dirs in the pool from folders not scanned yet in this session.
+
+        Args:
+            folder_paths (list): The download folders to scan.
+            keep (collections.abc.Container): Names of temp dirs to leave alone.
+        """
+        for folder_path in folder_paths:
+            if folder_path and folder_path not in self._swept_folders:
+                self._swept_folders.add(folder_path)
+                self.fetch_pool.start(functools.partial(remove_stale_temp_dirs, folder_path, keep=keep))
+
     def _get_cookies_path_for_url(self, url: str) -> str:
         """Returns the appropriate cookies file path based on the URL.
 
@@ -219,14 +453,10 @@ class DownloadManager(QObject):
         Returns:
             str: Path to the cookies file, or empty string if not configured.
         """
-        url_lower = url.lower()
-        if 'bilibili.com' in url_lower or 'b23.tv' in url_lower:
-            return self.app_settings.bilibili_cookies_path
-        elif 'xiaohongshu.com' in url_lower or 'xhslink.com' in url_lower:
-            return self.app_settings.xiaohongshu_cookies_path
-        elif 'facebook.com' in url_lower or 'fb.watch' in url_lower:
-            return self.app_settings.facebook_cookies_path
-        return ""
+        setting_name = COOKIES_SETTING_BY_PLATFORM.get(detect_platform(url))
+        if setting_name is None:
+            return ""
+        return getattr(self.app_settings, setting_name)
 
     def is_idle(self) -> bool:
         """Checks if the download manager is currently idle.
@@ -234,44 +464,87 @@ class DownloadManager(QObject):
         Returns:
             bool: True if no downloads are active or queued.
         """
-        return self.thread_pool.activeThreadCount() == 0 and not self.download_queue
+        return self._active_downloads == 0
     
     def stop_all_downloads(self) -> None:
         """Stops all active and queued downloads.
         
-        Sets the cancellation event to signal all workers to stop.
-        Clears the download queue to prevent new downloads from starting.
+        Sets every cancellation event to signal all workers to stop.
+        Takes downloads that haven't started yet back out of the thread pool
+        and reports them as cancelled, since they never run to say so themselves.
         """
         # Set cancellation flag for all active workers
-        self._cancellation_event.set()
+        for event in self._cancellation_events.values():
+            event.set()
         
-        # Clear the queue to prevent new downloads
-        self.download_queue.clear()
+        # Drop queued downloads so they never start
+        for download_id, worker in list(self._workers.items()):
+            if self._take_queued_worker(worker):
+                self._on_download_done(download_id)
+                self.download_cancelled.emit(worker.video_url)
+
+    def cancel_download(self, video_url: str) -> None:
+        """Cancels the active or queued downloads of a video.
+
+        Args:
+            video_url (str): The URL of the download to cancel.
+        """
+        for download_id, worker in list(self._workers.items()):
+            if worker.video_url != video_url:
+                continue
+            self._cancellation_events[download_id].set()
+
+            # A queued download never runs, so report it as cancelled here
+            if self._take_queued_worker(worker):
+                self._on_download_done(download_id)
+                self.download_cancelled.emit(video_url)
+
+    def _take_queued_worker(self, worker) -> bool:
+        """Removes a worker from the thread pool queue if it hasn't started.
+
+        Args:
+            worker (DownloadWorker): The worker to remove.
+
+        Returns:
+            bool: True if the worker was still queued and has been removed.
+        """
+        # A started worker may already be deleted by the pool, so only touch queued ones
+        if worker.started:
+            return False
+        return self.thread_pool.tryTake(worker)
 
     def start_fetch_job(self, url, cookies_file=None):
         """
-        Starts a new thread to fetch video information.
+        Starts a pooled worker to fetch video information.
 
         Args:
             url (str): The URL of the video.
             cookies_file (str, optional): Path to a cookies file. Defaults to None.
         """
-        self.fetch_thread = QThread()
-        self.fetch_worker = FetchWorker(url, cookies_file)
-        self.fetch_worker.moveToThread(self.fetch_thread)
-        self.fetch_thread.started.connect(self.fetch_worker.run)
-        self.fetch_worker.finished.connect(self.fetch_thread.quit)
-        self.fetch_worker.finished.connect(self.fetch_worker.deleteLater)
-        self.fetch_thread.finished.connect(self.fetch_thread.deleteLater)
-        self.fetch_worker.finished.connect(self.fetch_finished)
-        self.fetch_worker.error.connect(self.fetch_error)
-        self.fetch_thread.start()
+        worker = FetchWorker(url, cookies_file, self.yt_dlp_service)
+        worker.signals.entries_found.connect(self.fetch_entries)
+        worker.signals.finished.connect(self.fetch_finished)
+        worker.signals.error.connect(self.fetch_error)
+        self.fetch_pool.start(worker)
+
+    def start_details_job(self, url, cookies_file=None):
+        """
+        Starts a pooled worker to fetch the full metadata of a flat playlist entry.
+
+        Args:
+            url (str): The URL of the entry.
+            cookies_file (str, optional): Path to a cookies file. Defaults to None.
+        """
+        worker = EntryDetailsWorker(url, cookies_file, self.yt_dlp_service)
+        worker.signals.finished.connect(self.entry_details_ready)
+        self.fetch_pool.start(worker)
 
     def start_download_job(self, video_urls, video_resolution="best", video_format="mp4", audio_format="m4a",
                            subtitles_enabled=False, subtitle_language="en", embed_subtitles=False,
                            output_folder=None):
         """
-        Adds video URLs to the download queue and starts downloads if threads are available.
+        Hands a worker per video URL to the download thread pool, which runs up to the
+        concurrency limit at once and queues the rest.
 
         Args:
             video_urls (list): A list of video URLs to download.
@@ -283,29 +556,26 @@ class DownloadManager(QObject):
             embed_subtitles (bool): Whether to embed subtitles in the video. Defaults to False.
             output_folder (str, optional): Custom output folder. If None, uses default from settings.
         """
-        # Clear cancellation event for new download session
-        self._cancellation_event.clear()
-        
         self.video_resolution = video_resolution
         self.video_format = video_format
         self.audio_format = audio_format
         self.subtitles_enabled = subtitles_enabled
         self.subtitle_language = subtitle_language
         self.embed_subtitles = embed_subtitles
-        self._output_folder = output_folder  # Store custom output folder
-        for url in video_urls:
-            self.download_queue.append(url)
-        self._start_next_download()
-
-    def _start_next_download(self):
-        """
-        Starts the next download from the queue if the thread pool has capacity.
-        """
-        while self.download_queue and self.thread_pool.activeThreadCount() < self.thread_pool.maxThreadCount():
-            video_url = self.download_queue.popleft()
+        # Use custom output folder if set, otherwise use default from settings
+        download_folder = output_folder or self.app_settings.download_folder_path
+        # Failed downloads keep their temp dirs in whatever folder they ran in; the ones
+        # about to start may resume from theirs
+        self._sweep_stale_temp_dirs(
+            [download_folder], keep=frozenset(temp_dir_name(video_url) for video_url in video_urls))
+        # The pool queues workers beyond its thread limit and starts them as slots free up
+        for video_url in video_urls:
+            download_id = next(self._download_ids)
+            self._cancellation_events[download_id] = threading.Event()
             cookies_path = self._get_cookies_path_for_url(video_url)
-            # Use custom output folder if set, otherwise use default from settings
-            download_folder = self._output_folder if hasattr(self, '_output_folder') and self._output_folder else self.app_settings.download_folder_path
+            # A URL already downloading into the folder owns its stable temp dir; sharing it
+            # would let the first download to finish move or delete the other one's files
+            resumable = self._temp_dir_owners.setdefault((download_folder, video_url), download_id) == download_id
             worker = DownloadWorker(
                 video_url, 
                 download_folder, 
@@ -314,17 +584,34 @@ class DownloadManager(QObject):
                 self.audio_format,
                 cookies_path,
                 self.yt_dlp_service,
-                self._cancellation_event,  # Pass cancellation event
+                self._cancellation_events[download_id],
                 self.subtitles_enabled,
                 self.subtitle_language,
-                self.embed_subtitles
+                self.embed_subtitles,
+                download_id,
+                resumable
             )
+            # done arrives before the final signal, so is_idle() is already up to date when the UI is notified
+            worker.signals.done.connect(self._on_download_done)
             worker.signals.progress.connect(self.download_progress)
             worker.signals.finished.connect(self.download_finished)
             worker.signals.error.connect(self.download_error)
             worker.signals.cancelled.connect(self.download_cancelled)  # Connect cancelled signal
-            # Ensure the next download is triggered regardless of success or failure
-            worker.signals.finished.connect(lambda url, status: self._start_next_download())
-            worker.signals.error.connect(self._start_next_download)
-            worker.signals.cancelled.connect(self._start_next_download)  # Also trigger on cancellation
+            self._workers[download_id] = worker
+            self._active_downloads += 1
             self.thread_pool.start(worker)
+
+    def _on_download_done(self, download_id):
+        """Releases the bookkeeping of a finished, failed or cancelled download.
+
+        Args:
+            download_id (int): The id of the download.
+        """
+        worker = self._workers.pop(download_id, None)
+        if worker is None:
+            return
+        temp_dir_key = (worker.download_folder_path, worker.video_url)
+        if self._temp_dir_owners.get(temp_dir_key) == download_id:
+            del self._temp_dir_owners[temp_dir_key]
+        self._active_downloads = max(0, self._active_downloads - 1)
+        self._cancellation_events.pop(download_id, None)
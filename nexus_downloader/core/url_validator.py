@@ -24,6 +24,20 @@ class URLValidator:
     YOUTUBE_PATTERN = r'https?://(?:www\.)?(?:youtube\.com|youtu\.be)/.+'
     TIKTOK_PATTERN = r'https?://(?:www\.)?(?:tiktok\.com|vm\.tiktok\.com)/.+'
     FACEBOOK_PATTERN = r'https?://(?:www\.)?(?:facebook\.com|fb\.watch)/.+'
+    YOUTUBE_PLAYLIST_PATTERN = r'https?://(?:www\.|m\.)?youtube\.com/(?:playlist|watch)\?(?:.*&)?list='
+
+    # Compiled alternations so each check is a single regex call
+    _BILIBILI_RE = re.compile('|'.join((
+        BILIBILI_VIDEO_PATTERN, BILIBILI_SHORT_PATTERN, BILIBILI_SPACE_PATTERN, BILIBILI_COLLECTION_PATTERN,
+    )))
+    _XIAOHONGSHU_RE = re.compile('|'.join((
+        XIAOHONGSHU_EXPLORE_PATTERN, XIAOHONGSHU_DISCOVERY_PATTERN, XIAOHONGSHU_SHORT_PATTERN,
+        XIAOHONGSHU_USER_PATTERN,
+    )))
+    _COMBINED_RE = re.compile('|'.join((_BILIBILI_RE.pattern, _XIAOHONGSHU_RE.pattern)))
+    _PLAYLIST_RE = re.compile('|'.join((
+        BILIBILI_SPACE_PATTERN, BILIBILI_COLLECTION_PATTERN, XIAOHONGSHU_USER_PATTERN, YOUTUBE_PLAYLIST_PATTERN,
+    )))
 
     @staticmethod
     def is_bilibili_url(url: str) -> bool:
@@ -36,12 +50,7 @@ class URLValidator:
         Returns:
             bool: True if the URL matches Bilibili patterns, False otherwise.
         """
-        if re.match(URLValidator.BILIBILI_VIDEO_PATTERN, url) or \
-           re.match(URLValidator.BILIBILI_SHORT_PATTERN, url) or \
-           re.match(URLValidator.BILIBILI_SPACE_PATTERN, url) or \
-           re.match(URLValidator.BILIBILI_COLLECTION_PATTERN, url):
-            return True
-        return False
+        return bool(URLValidator._BILIBILI_RE.match(url))
 
     @staticmethod
     def is_xiaohongshu_url(url: str) -> bool:
@@ -54,13 +63,20 @@ class URLValidator:
         Returns:
             bool: True if the URL matches Xiaohongshu patterns, False otherwise.
         """
-        if re.match(URLValidator.XIAOHONGSHU_EXPLORE_PATTERN, url) or \
-           re.match(URLValidator.XIAOHONGSHU_DISCOVERY_PATTERN, url) or \
-           re.match(URLValidator.XIAOHONGSHU_DISCOVERY_PATTERN, url) or \
-           re.match(URLValidator.XIAOHONGSHU_SHORT_PATTERN, url) or \
-           re.match(URLValidator.XIAOHONGSHU_USER_PATTERN, url):
-            return True
-        return False
+        return bool(URLValidator._XIAOHONGSHU_RE.match(url))
+
+    @staticmethod
+    def is_playlist_url(url: str) -> bool:
+        """
+        Checks if the URL points to a known playlist, collection or user page.
+
+        Args:
+            url (str): The URL to check.
+
+        Returns:
+            bool: True if the URL matches a playlist pattern, False otherwise.
+        """
+        return bool(URLValidator._PLAYLIST_RE.match(url))
 
     @staticmethod
     def is_valid_url(url: str) -> bool:
@@ -73,7 +89,7 @@ class URLValidator:
         Returns:
             bool: True if the URL is supported, False otherwise.
         """
-        if URLValidator.is_bilibili_url(url) or URLValidator.is_xiaohongshu_url(url):
+        if URLValidator._COMBINED_RE.match(url):
             return True
             
         # Fallback for other platforms (YouTube, TikTok, Facebook)
@@ -1,11 +1,22 @@
 """
 This module provides a service to interact with the yt-dlp library.
 """
+import copy
+import functools
+import os
+import pathlib
 import re
-import yt_dlp
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from urllib.parse import urlsplit
+from nexus_downloader.core.url_validator import URLValidator
+
+# The option tables below are read-only so no caller can alter them at runtime
 
 # Quality display name -> yt-dlp format string
-QUALITY_OPTIONS = {
+QUALITY_OPTIONS = MappingProxyType({
     "Best": "bestvideo+bestaudio/best",
     "4K": "bestvideo[height<=2160]+bestaudio/best[height<=2160]",
     "1440p": "bestvideo[height<=1440]+bestaudio/best[height<=1440]",
@@ -14,32 +25,39 @@ QUALITY_OPTIONS = {
     "480p": "bestvideo[height<=480]+bestaudio/best[height<=480]",
     "360p": "bestvideo[height<=360]+bestaudio/best[height<=360]",
     "Audio Only": "bestaudio/best",
-}
+})
 
 # Ordered list for UI display (highest to lowest quality)
 QUALITY_OPTIONS_LIST = ["Best", "4K", "1440p", "1080p", "720p", "480p", "360p", "Audio Only"]
+# Companion sets of the option lists, for membership checks
+QUALITY_OPTIONS_SET = frozenset(QUALITY_OPTIONS_LIST)
 
 # Video container formats
-VIDEO_FORMAT_OPTIONS = {
+VIDEO_FORMAT_OPTIONS = MappingProxyType({
     "MP4": "mp4",
     "WebM": "webm",
     "MKV": "mkv",
-}
+})
 
 VIDEO_FORMAT_OPTIONS_LIST = ["MP4", "WebM", "MKV"]
+VIDEO_FORMAT_OPTIONS_SET = frozenset(VIDEO_FORMAT_OPTIONS_LIST)
 
 # Audio formats (used when "Audio Only" quality is selected)
-AUDIO_FORMAT_OPTIONS = {
+AUDIO_FORMAT_OPTIONS = MappingProxyType({
     "M4A": "m4a",
     "MP3": "mp3",
     "OGG": "ogg",
-}
+})
 
 AUDIO_FORMAT_OPTIONS_LIST = ["M4A", "MP3", "OGG"]
+AUDIO_FORMAT_OPTIONS_SET = frozenset(AUDIO_FORMAT_OPTIONS_LIST)
+
+# Audio format -> FFmpegExtractAudio codec
+AUDIO_CODEC_MAP = MappingProxyType({'mp3': 'mp3', 'm4a': 'aac', 'ogg': 'vorbis'})
 
 # Subtitle language options
 # Key: Display name, Value: yt-dlp language code
-SUBTITLE_LANGUAGE_OPTIONS = {
+SUBTITLE_LANGUAGE_OPTIONS = MappingProxyType({
     "Auto (All Available)": "all",
     "English": "en",
     "Chinese (Simplified)": "zh-Hans",
@@ -51,44 +69,151 @@ SUBTITLE_LANGUAGE_OPTIONS = {
     "Korean": "ko",
     "Portuguese": "pt",
     "Russian": "ru",
-}
+})
 
 SUBTITLE_LANGUAGE_OPTIONS_LIST = [
     "Auto (All Available)", "English", "Chinese (Simplified)", "Chinese (Traditional)",
     "Spanish", "French", "German", "Japanese", "Korean", "Portuguese", "Russian"
 ]
+SUBTITLE_LANGUAGE_OPTIONS_SET = frozenset(SUBTITLE_LANGUAGE_OPTIONS_LIST)
 
 # Download preset configurations
 # Key: Preset display name
 # Value: dict with 'quality' and 'format' keys
-DOWNLOAD_PRESETS = {
+DOWNLOAD_PRESETS = MappingProxyType({
     "High Quality": {"quality": "Best", "format": "MP4"},
     "Balanced": {"quality": "1080p", "format": "MP4"},
     "Fast Download": {"quality": "720p", "format": "MP4"},
     "Audio Only": {"quality": "Audio Only", "format": "M4A"},
     "Custom": {"quality": None, "format": None},
-}
+})
 
 DOWNLOAD_PRESETS_LIST = ["High Quality", "Balanced", "Fast Download", "Audio Only", "Custom"]
+DOWNLOAD_PRESETS_SET = frozenset(DOWNLOAD_PRESETS_LIST)
+
+# (quality, format) -> preset name, for detecting the preset of the current settings
+_PRESET_BY_SETTINGS = {
+    (config["quality"], config["format"]): preset_name
+    for preset_name, config in DOWNLOAD_PRESETS.items()
+    if preset_name != "Custom"
+}
+
+# (subtitles available, subtitles requested, embed) -> subtitle status of a download
+_SUBTITLE_STATUS = MappingProxyType({
+    (False, False, False): "no_subs",
+    (False, False, True): "no_subs",
+    (True, False, False): "with_subs",
+    (True, False, True): "with_subs",
+    (False, True, False): "with_subs",
+    (False, True, True): "subs_embedded",
+    (True, True, False): "with_subs",
+    (True, True, True): "subs_embedded",
+})
+
+# Platform error patterns, matched case-insensitively against the error message. The
+# alternatives are tried in order and the named group of the first one that
+# matches selects the message shown to the user.
+_BILIBILI_ERROR_RE = re.compile(
+    r'(?=.*?(?:geo-restrict|not available in your region))(?P<geo>)'
+    r'|(?=.*?deleted)(?P<deleted>)'
+    r'|(?=.*?(?:private|members-only))(?P<private>)'
+    r'|(?=.*?(?:too many requests|412))(?P<rate_limited>)'
+    r'|(?=.*?empty)(?=.*?playlist)(?P<empty>)',
+    re.S | re.I,
+)
+_BILIBILI_ERROR_MESSAGES = {
+    'geo': "This Bilibili video is not available in your region. You may need to use a VPN or proxy.",
+    'deleted': "This Bilibili video may have been deleted or is no longer available.",
+    'private': ("This Bilibili video or collection requires authentication. "
+                "Please refer to the documentation for cookie setup."),
+    'rate_limited': ("Too many requests. Bilibili may be rate limiting. "
+                     "Please wait a few minutes and try again."),
+    'empty': "The Bilibili collection or user space appears to be empty.",
+}
+
+_XIAOHONGSHU_ERROR_RE = re.compile(
+    r'(?=.*?no video formats found)(?P<no_formats>)'
+    r'|(?=.*?unsupported url)(?P<unsupported>)'
+    r'|(?=.*?(?:http error 404|not found))(?P<not_found>)'
+    r'|(?=.*?(?:http error 403|forbidden))(?P<forbidden>)'
+    r'|(?=.*?empty)(?=.*?playlist)(?P<empty>)',
+    re.S | re.I,
+)
+_XIAOHONGSHU_ERROR_MESSAGES = {
+    'no_formats': ("This Xiaohongshu content could not be extracted. "
+                   "It may require authentication or is restricted."),
+    'unsupported': ("The Xiaohongshu URL is not supported or invalid. "
+                    "Please check the URL."),
+    'not_found': "This Xiaohongshu content or user could not be found.",
+    'forbidden': ("Access denied. This Xiaohongshu content may be private or require authentication. "
+                  "Please refer to the documentation for cookie setup."),
+    'empty': "The Xiaohongshu user profile appears to be empty.",
+}
+
+# Download errors caused by a missing or failing FFmpeg
+_FFMPEG_ERROR_RE = re.compile(r'ffmpeg|ffprobe', re.I)
+
+# Platform display name -> (error pattern, messages by group name)
+_PLATFORM_ERROR_RULES = {
+    "Bilibili": (_BILIBILI_ERROR_RE, _BILIBILI_ERROR_MESSAGES),
+    "Xiaohongshu": (_XIAOHONGSHU_ERROR_RE, _XIAOHONGSHU_ERROR_MESSAGES),
+}
+
+# Platform-independent fallbacks; the messages append the original error
+_GENERIC_ERROR_RE = re.compile(
+    r'(?=.*?(?:network|connection))(?P<network>)'
+    r'|(?=.*?(?:invalid|not found))(?P<invalid>)',
+    re.S | re.I,
+)
+_GENERIC_ERROR_MESSAGES = {
+    'network': "Failed to fetch video. Check your internet connection. Details: {details}",
+    'invalid': "Invalid or unavailable video URL. Details: {details}",
+}
+
+# yt-dlp output template for downloaded files, relative to the download folder
+OUTPUT_TEMPLATE = '%(title)s.%(ext)s'
+
+# Number of HLS/DASH fragments the native downloader fetches in parallel
+CONCURRENT_FRAGMENT_DOWNLOADS = 8
+
+# Number of URLs whose detected platform is memoized
+PLATFORM_CACHE_SIZE = 256
+
+# Number of sanitized folder names memoized (platforms, qualities, uploaders)
+FOLDER_NAME_CACHE_SIZE = 128
 
-# Platform detection patterns for folder organization
-# Key: Platform display name, Value: List of URL patterns (regex)
-PLATFORM_PATTERNS = {
-    "YouTube": [r"youtube\.com", r"youtu\.be"],
-    "TikTok": [r"tiktok\.com"],
-    "Facebook": [r"facebook\.com", r"fb\.watch"],
-    "Bilibili": [r"bilibili\.com", r"b23\.tv"],
-    "Xiaohongshu": [r"xiaohongshu\.com", r"xhslink\.com"],
+# Number of (platform, error) pairs whose user-facing message is memoized
+ERROR_MESSAGE_CACHE_SIZE = 512
+
+# Maximum number of fetch results kept in the video info cache
+INFO_CACHE_SIZE = 256
+
+# How long a fetched video's metadata is reused for its download instead of
+# extracting it again; format URLs expire, so this stays short
+DOWNLOAD_INFO_TTL = 300  # seconds
+
+# Platform detection by hostname
+# Key: Host or parent domain, Value: Platform display name
+_HOST_TO_PLATFORM = {
+    "youtube.com": "YouTube",
+    "youtu.be": "YouTube",
+    "tiktok.com": "TikTok",
+    "facebook.com": "Facebook",
+    "fb.watch": "Facebook",
+    "bilibili.com": "Bilibili",
+    "b23.tv": "Bilibili",
+    "xiaohongshu.com": "Xiaohongshu",
+    "xhslink.com": "Xiaohongshu",
 }
 
 # Tooltips for each preset
-DOWNLOAD_PRESET_TOOLTIPS = {
+DOWNLOAD_PRESET_TOOLTIPS = MappingProxyType({
     "High Quality": "Best available quality in MP4 format. Larger file sizes.",
     "Balanced": "1080p resolution in MP4 format. Good balance of quality and size.",
     "Fast Download": "720p resolution in MP4 format. Smaller files, faster downloads.",
     "Audio Only": "Extract audio only in M4A format. No video.",
     "Custom": "Use your own quality and format settings.",
-}
+})
 
 
 def get_format_string(quality: str) -> str:
@@ -161,17 +286,16 @@ def detect_preset_from_settings(quality: str, format_name: str) -> str:
     Returns:
         str: The matching preset name, or "Custom" if no preset matches.
     """
-    for preset_name, config in DOWNLOAD_PRESETS.items():
-        if preset_name == "Custom":
-            continue
-        if config["quality"] == quality and config["format"] == format_name:
-            return preset_name
-    return "Custom"
+    return _PRESET_BY_SETTINGS.get((quality, format_name), "Custom")
 
 
+@functools.lru_cache(maxsize=PLATFORM_CACHE_SIZE)
 def detect_platform(url: str) -> str:
     """Detects the platform name from a video URL.
 
+    Results are memoized: the same URL is checked for cookies, format selection
+    and error messages.
+
     Args:
         url (str): The video URL to analyze.
 
@@ -180,19 +304,30 @@ def detect_platform(url: str) -> str:
     """
     if not url:
         return "Other"
-    
-    url_lower = url.lower()
-    for platform_name, patterns in PLATFORM_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, url_lower):
-                return platform_name
+
+    try:
+        host = urlsplit(url).hostname
+        if host is None:
+            # Tolerate scheme-less input such as "youtube.com/watch?v=..."
+            host = urlsplit('//' + url).hostname
+    except ValueError:
+        return "Other"
+
+    # Walk up the domain labels so subdomains (www., m., space.) resolve too
+    while host:
+        platform = _HOST_TO_PLATFORM.get(host)
+        if platform:
+            return platform
+        _, _, host = host.partition('.')
     return "Other"
 
 
+@functools.lru_cache(maxsize=FOLDER_NAME_CACHE_SIZE)
 def sanitize_folder_name(name: str) -> str:
     """Sanitizes a string for use as a folder name.
 
     Replaces invalid characters with underscores and handles edge cases.
+    Results are memoized since a batch reuses the same few names.
 
     Args:
         name (str): The string to sanitize.
@@ -224,15 +359,128 @@ def sanitize_folder_name(name: str) -> str:
     return result
 
 
+def has_partial_downloads(folder_path: str) -> bool:
+    """Checks whether a folder holds .part files left by an interrupted download.
+
+    Args:
+        folder_path (str): The temp dir of one download; any .part file in it
+            belongs to that download.
+
+    Returns:
+        bool: True if at least one .part file exists, False otherwise or if the
+        folder cannot be read.
+    """
+    try:
+        with os.scandir(folder_path) as entries:
+            return any(entry.name.endswith('.part') and entry.is_file() for entry in entries)
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=64)
+def _output_template_for(folder_path: str) -> str:
+    """Returns the yt-dlp output template for files saved directly into a folder.
+
+    Args:
+        folder_path (str): The download folder.
+
+    Returns:
+        str: The folder joined with OUTPUT_TEMPLATE.
+    """
+    return str(pathlib.Path(folder_path) / OUTPUT_TEMPLATE)
+
+
+@functools.lru_cache(maxsize=ERROR_MESSAGE_CACHE_SIZE)
+def _format_platform_error(platform: str, error_msg: str) -> str:
+    """Maps an error message to a user-friendly message for a platform.
+
+    Memoized because a failing batch tends to repeat the same error.
+
+    Args:
+        platform (str): The platform name from detect_platform().
+        error_msg (str): The original error message.
+
+    Returns:
+        str: A user-friendly error message, or the original one if no pattern matches.
+    """
+    platform_rules = _PLATFORM_ERROR_RULES.get(platform)
+    if platform_rules:
+        pattern, messages = platform_rules
+        match = pattern.match(error_msg)
+        if match:
+            return messages[match.lastgroup]
+
+    # Generic error messages
+    match = _GENERIC_ERROR_RE.match(error_msg)
+    if match:
+        return _GENERIC_ERROR_MESSAGES[match.lastgroup].format(details=error_msg)
+
+    # Return original error if no specific pattern matched
+    return error_msg
+
+
+@functools.lru_cache(maxsize=32)
+def _build_postprocessors(is_audio_only: bool, audio_format: str, embed_subtitles: bool) -> tuple:
+    """Returns the yt-dlp postprocessor definitions for a download configuration.
+
+    yt-dlp copies each definition when it creates the postprocessor, so the
+    cached dictionaries are shared between downloads.
+
+    Args:
+        is_audio_only (bool): Whether the audio is extracted with format conversion.
+        audio_format (str): The desired audio format (mp3, m4a, ogg).
+        embed_subtitles (bool): Whether downloaded subtitles are embedded in the video.
+
+    Returns:
+        tuple: The postprocessor definitions, empty if none are needed.
+    """
+    postprocessors = []
+    if is_audio_only:
+        # Audio extraction with format conversion
+        postprocessors.append({
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': AUDIO_CODEC_MAP.get(audio_format, 'aac'),
+            'preferredquality': '192',
+        })
+    if embed_subtitles:
+        postprocessors.append({
+            'key': 'FFmpegEmbedSubtitle',
+        })
+    return tuple(postprocessors)
+
+
+class VideoInfoError(Exception):
+    """Raised when video information cannot be extracted; the message is user-facing."""
+
+
 class YtDlpService:
     """
     A service class that wraps the yt-dlp library to fetch video information.
     """
+    def __init__(self):
+        # LRU of fetched video lists keyed by (url, cookies_file, cookies mtime, flat)
+        self._info_cache = OrderedDict()
+        self._info_cache_lock = threading.Lock()
+        # Fully extracted single videos for download_video: (url, cookies_file) -> (monotonic time, info)
+        self._download_info = {}
+        # Long-lived YoutubeDL instances for metadata extraction, at most one per thread and
+        # extraction mode, plus a registry of all of them so close() can reach every thread's instances
+        self._local = threading.local()
+        self._info_ydls = set()
+        self._info_ydls_lock = threading.Lock()
+        # Parsed cookies shared by all YoutubeDL instances: cookies_file -> (mtime, jar)
+        self._cookie_jars = {}
+        self._cookie_jars_lock = threading.Lock()
+
     def get_video_info(self, url, cookies_file=None):
         """
         Fetches video information for the given URL using yt-dlp.
         If the URL is a playlist, it returns a list of video information dictionaries.
 
+        Known playlist URLs (collections, user spaces, profiles, YouTube lists) are
+        extracted flat: entries only carry basic fields such as 'id', 'title' and
+        'url'. Use get_single_video_info() to load the full metadata of an entry.
+
         Args:
             url (str): The URL of the video or playlist.
             cookies_file (str, optional): Path to a Netscape-style cookies file. Defaults to None.
@@ -241,29 +489,287 @@ class YtDlpService:
             list: A list of dictionaries containing the video information.
             str: An error message if an error occurs.
         """
+        return self._get_info(url, cookies_file, URLValidator.is_playlist_url(url))
+
+    def iter_video_info(self, url, cookies_file=None):
+        """
+        Yields video information for the given URL as it is extracted.
+
+        Like get_video_info(), but entries of known playlist URLs are yielded while
+        yt-dlp reads the playlist page by page, so callers can show them before the
+        whole playlist is known.
+
+        Args:
+            url (str): The URL of the video or playlist.
+            cookies_file (str, optional): Path to a Netscape-style cookies file. Defaults to None.
+
+        Yields:
+            dict: The information of one video.
+
+        Raises:
+            VideoInfoError: If the information cannot be extracted.
+        """
+        return self._iter_info(url, cookies_file, URLValidator.is_playlist_url(url))
+
+    def get_single_video_info(self, url, cookies_file=None):
+        """
+        Fetches the full metadata of a single video, e.g. a flat playlist entry
+        whose details are needed once it becomes visible.
+
+        Args:
+            url (str): The URL of the video.
+            cookies_file (str, optional): Path to a Netscape-style cookies file. Defaults to None.
+
+        Returns:
+            dict: The video information dictionary, or None if an error occurs.
+            str: An error message if an error occurs.
+        """
+        videos, error = self._get_info(url, cookies_file, extract_flat=False)
+        if error:
+            return None, error
+        return (videos[0] if videos else None), None
+
+    def _get_info(self, url, cookies_file, extract_flat):
+        """
+        Extracts video information through the info cache.
+
+        Args:
+            url (str): The URL of the video or playlist.
+            cookies_file (str): Path to a Netscape-style cookies file, or None.
+            extract_flat (bool): Whether to list playlist entries without resolving them.
+
+        Returns:
+            list: A list of dictionaries containing the video information.
+            str: An error message if an error occurs.
+        """
+        try:
+            return list(self._iter_info(url, cookies_file, extract_flat)), None
+        except VideoInfoError as e:
+            return None, str(e)
+
+    def _iter_info(self, url, cookies_file, extract_flat):
+        """
+        Yields video information through the info cache.
+
+        Flat playlists are extracted without processing so their entries can be
+        yielded as the extractor produces them. The result is cached once all
+        entries have been read.
+
+        Args:
+            url (str): The URL of the video or playlist.
+            cookies_file (str): Path to a Netscape-style cookies file, or None.
+            extract_flat (bool): Whether to list playlist entries without resolving them.
+
+        Yields:
+            dict: The information of one video.
+
+        Raises:
+            VideoInfoError: If the information cannot be extracted.
+        """
+        cookies_mtime = self._get_mtime(cookies_file)
+        cache_key = (url, cookies_file, cookies_mtime, extract_flat)
+        with self._info_cache_lock:
+            cached = self._info_cache.get(cache_key)
+            if cached is not None:
+                self._info_cache.move_to_end(cache_key)
+        if cached is not None:
+            yield from list(cached)
+            return
+
+        # yt-dlp is imported on first use; loading its extractor registry slows startup
+        import yt_dlp
+        entries = []
+        try:
+            ydl = self._get_info_ydl(cookies_file, cookies_mtime, extract_flat)
+            if extract_flat:
+                info = ydl.extract_info(url, download=False, process=False)
+                if 'entries' not in info:
+                    # Redirects and single videos still need yt-dlp's processing
+                    info = ydl.process_ie_result(info, download=False)
+            else:
+                info = ydl.extract_info(url, download=False)
+            if 'entries' in info:
+                # It's a playlist; raw entries arrive lazily, page by page
+                for entry in info['entries']:
+                    if entry:
+                        entries.append(entry)
+                        yield entry
+            else:
+                # It's a single video
+                entries.append(info)
+                yield info
+        except (yt_dlp.utils.DownloadError, yt_dlp.utils.ExtractorError) as e:
+            raise VideoInfoError(self._format_error_message(url, str(e))) from e
+
+        with self._info_cache_lock:
+            self._info_cache[cache_key] = entries
+            self._info_cache.move_to_end(cache_key)
+            if len(self._info_cache) > INFO_CACHE_SIZE:
+                self._info_cache.popitem(last=False)
+            if not extract_flat and 'entries' not in info:
+                self._store_download_info(url, cookies_file, info)
+
+    def _store_download_info(self, url, cookies_file, info):
+        """Keeps a fully extracted video so its download can skip extraction.
+
+        The info is stored under the fetched URL and its webpage_url, which is the
+        URL the UI later downloads. Expired entries are dropped on the way.
+        Must be called with the info cache lock held.
+
+        Args:
+            url (str): The fetched URL.
+            cookies_file (str): Path to the cookies file used for the fetch, or None.
+            info (dict): The extracted video information.
+        """
+        now = time.monotonic()
+        self._download_info = {
+            key: value for key, value in self._download_info.items()
+            if now - value[0] < DOWNLOAD_INFO_TTL
+        }
+        for info_url in {url, info.get('webpage_url')}:
+            if info_url:
+                self._download_info[(info_url, cookies_file)] = (now, info)
+
+    def get_cached_info(self, url, cookies_file=None):
+        """
+        Returns the recently fetched metadata of a single video, if still fresh.
+
+        Args:
+            url (str): The URL of the video.
+            cookies_file (str, optional): Path to a Netscape-style cookies file. Defaults to None.
+
+        Returns:
+            dict: The video information dictionary, or None if it was not fetched
+            within DOWNLOAD_INFO_TTL seconds.
+        """
+        with self._info_cache_lock:
+            cached = self._download_info.get((url, cookies_file))
+        if cached is None or time.monotonic() - cached[0] >= DOWNLOAD_INFO_TTL:
+            return None
+        return cached[1]
+
+    def _drop_download_info(self, url, cookies_file):
+        """Forgets the fetched info of a video, e.g. after its format URLs expired.
+
+        Args:
+            url (str): The URL of the video.
+            cookies_file (str): Path to the cookies file used for the fetch, or None.
+        """
+        with self._info_cache_lock:
+            cached = self._download_info.get((url, cookies_file))
+            if cached is None:
+                return
+            self._download_info = {
+                key: value for key, value in self._download_info.items()
+                if value[1] is not cached[1]
+            }
+
+    def _get_info_ydl(self, cookies_file, cookies_mtime, extract_flat=False):
+        """Returns the calling thread's YoutubeDL instance for metadata extraction.
+
+        Each thread keeps one instance per extraction mode, for the cookies file it
+        was last used with, so the extractor setup and HTTP connections are shared
+        across fetches. Another cookies file, or a changed one (different mtime),
+        replaces the instance and closes the old one.
+
+        Args:
+            cookies_file (str): Path to a Netscape-style cookies file, or None.
+            cookies_mtime (float): Modification time of the cookies file.
+            extract_flat (bool): Whether playlist entries are listed without resolving them.
+
+        Returns:
+            yt_dlp.YoutubeDL: The cached instance.
+        """
+        ydl_by_mode = getattr(self._local, 'ydl_by_mode', None)
+        if ydl_by_mode is None:
+            ydl_by_mode = self._local.ydl_by_mode = {}
+
+        cached = ydl_by_mode.get(extract_flat)
+        if cached is not None and cached[:2] == (cookies_file, cookies_mtime):
+            return cached[2]
+
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
             'skip_download': True,
-            # DO NOT use 'extract_flat' here as it breaks single video metadata
-            # Single videos need full metadata extraction to work properly
         }
+        if extract_flat:
+            # Only for playlists: single videos need full metadata extraction
+            ydl_opts['extract_flat'] = 'in_playlist'
+        import yt_dlp
+        ydl = yt_dlp.YoutubeDL(ydl_opts)
         if cookies_file:
-            ydl_opts['cookiefile'] = cookies_file
+            ydl.cookiejar = self._get_cookie_jar(cookies_file, cookies_mtime)
+        ydl_by_mode[extract_flat] = (cookies_file, cookies_mtime, ydl)
+        with self._info_ydls_lock:
+            if cached is not None:
+                # Superseded by the instance for the other or changed cookies file
+                self._info_ydls.discard(cached[2])
+                cached[2].close()
+            self._info_ydls.add(ydl)
+        return ydl
+
+    def close(self):
+        """
+        Closes the long-lived YoutubeDL instances used for metadata extraction.
+
+        Releases their HTTP connections; call once when the application exits.
+        """
+        with self._info_ydls_lock:
+            ydls, self._info_ydls = self._info_ydls, set()
+        for ydl in ydls:
+            ydl.close()
+
+    def _get_cookie_jar(self, cookies_file, cookies_mtime):
+        """Returns the parsed cookies of a Netscape-style cookies file.
+
+        The file is parsed once and the jar is shared by every YoutubeDL instance
+        until the file changes (different mtime). Instances get the jar assigned
+        instead of a cookiefile option, so yt-dlp never writes cookies back to the file.
+
+        Args:
+            cookies_file (str): Path to the cookies file.
+            cookies_mtime (float): Modification time of the cookies file.
+
+        Returns:
+            yt_dlp.cookies.YoutubeDLCookieJar: The shared cookie jar.
+
+        Raises:
+            yt_dlp.utils.DownloadError: If the cookies file cannot be parsed.
+        """
+        with self._cookie_jars_lock:
+            cached = self._cookie_jars.get(cookies_file)
+            if cached is not None and cached[0] == cookies_mtime:
+                return cached[1]
+
+            import yt_dlp
+            from yt_dlp.cookies import YoutubeDLCookieJar
+            jar = YoutubeDLCookieJar(cookies_file)
+            # Like yt-dlp, a missing or unreadable file means no cookies
+            if os.access(cookies_file, os.R_OK):
+                try:
+                    jar.load()
+                except Exception as e:
+                    raise yt_dlp.utils.DownloadError(f"Failed to load cookies from {cookies_file}: {e}") from e
+            self._cookie_jars[cookies_file] = (cookies_mtime, jar)
+            return jar
+
+    @staticmethod
+    def _get_mtime(path):
+        """Returns the modification time of a file, or 0 if it is unset or missing.
+
+        Args:
+            path (str): Path to the file, may be None or empty.
+
+        Returns:
+            float: The modification timestamp, or 0.
+        """
+        if not path:
+            return 0
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                if 'entries' in info:
-                    # It's a playlist
-                    entries = list(info['entries']) # Convert to list if it's a generator
-                    # Note: Without extract_flat, entries will have full metadata
-                    # No need to propagate from parent playlist
-                    return entries, None
-                else:
-                    # It's a single video
-                    return [info], None
-        except yt_dlp.utils.DownloadError as e:
-            return None, self._format_error_message(url, str(e))
+            return os.path.getmtime(path)
+        except OSError:
+            return 0
     
     def _format_error_message(self, url: str, error_msg: str) -> str:
         """
@@ -276,59 +782,18 @@ class YtDlpService:
         Returns:
             str: A user-friendly error message.
         """
-        error_lower = error_msg.lower()
-        
-        # Detect Bilibili URLs
-        is_bilibili = 'bilibili.com' in url or 'b23.tv' in url
-        
-        if is_bilibili:
-            if 'geo-restrict' in error_lower or 'not available in your region' in error_lower:
-                return "This Bilibili video is not available in your region. You may need to use a VPN or proxy."
-            elif 'deleted' in error_lower:
-                return "This Bilibili video may have been deleted or is no longer available."
-            elif 'private' in error_lower or 'members-only' in error_lower:
-                return ("This Bilibili video or collection requires authentication. "
-                        "Please refer to the documentation for cookie setup.")
-            elif 'too many requests' in error_lower or '412' in error_lower:
-                return ("Too many requests. Bilibili may be rate limiting. "
-                        "Please wait a few minutes and try again.")
-            elif 'empty' in error_lower and 'playlist' in error_lower:
-                return "The Bilibili collection or user space appears to be empty."
-        
-        # Detect Xiaohongshu URLs
-        is_xiaohongshu = 'xiaohongshu.com' in url or 'xhslink.com' in url
-
-        if is_xiaohongshu:
-            if 'no video formats found' in error_lower:
-                return ("This Xiaohongshu content could not be extracted. "
-                        "It may require authentication or is restricted.")
-            elif 'unsupported url' in error_lower:
-                return ("The Xiaohongshu URL is not supported or invalid. "
-                        "Please check the URL.")
-            elif 'http error 404' in error_lower or 'not found' in error_lower:
-                return "This Xiaohongshu content or user could not be found."
-            elif 'http error 403' in error_lower or 'forbidden' in error_lower:
-                return ("Access denied. This Xiaohongshu content may be private or require authentication. "
-                        "Please refer to the documentation for cookie setup.")
-            elif 'empty' in error_lower and 'playlist' in error_lower:
-                return "The Xiaohongshu user profile appears to be empty."
-        
-        # Generic error messages
-        if 'network' in error_lower or 'connection' in error_lower:
-            return f"Failed to fetch video. Check your internet connection. Details: {error_msg}"
-        elif 'invalid' in error_lower or 'not found' in error_lower:
-            return f"Invalid or unavailable video URL. Details: {error_msg}"
-        
-        # Return original error if no specific pattern matched
-        return error_msg
-
+        return _format_platform_error(detect_platform(url), error_msg)
 
     def download_video(self, video_url, download_folder_path, video_resolution="best",
                         video_format="mp4", audio_format="m4a", progress_hook=None, cookies_file=None,
-                        subtitles_enabled=False, subtitle_language="en", embed_subtitles=False):
+                        subtitles_enabled=False, subtitle_language="en", embed_subtitles=False, temp_dir=None,
+                        postprocessor_hook=None):
         """
         Downloads a video to the specified folder using yt-dlp.
 
+        Metadata fetched for the same URL and cookies file within DOWNLOAD_INFO_TTL
+        seconds is reused instead of extracting the video again.
+
         Args:
             video_url (str): The URL of the video to download.
             download_folder_path (str): The path to the folder where the video should be saved.
@@ -340,6 +805,11 @@ class YtDlpService:
             subtitles_enabled (bool): Whether to download subtitles. Defaults to False.
             subtitle_language (str): The yt-dlp language code for subtitles. Defaults to "en".
             embed_subtitles (bool): Whether to embed subtitles in the video. Defaults to False.
+            temp_dir (str, optional): Directory for the download's intermediate files. yt-dlp
+                moves the finished files into download_folder_path and never replaces an
+                existing file there. Defaults to None.
+            postprocessor_hook (callable, optional): A function yt-dlp calls as each
+                postprocessor starts and finishes. Defaults to None.
 
         Returns:
             tuple: (True, subtitle_status, None) on success, (False, None, error_message) on failure.
@@ -348,7 +818,7 @@ class YtDlpService:
         # Handle Bilibili format restrictions
         # Bilibili's "best" quality may require premium membership
         # Use a fallback format string that selects best available non-premium quality
-        is_bilibili = 'bilibili.com' in video_url or 'b23.tv' in video_url
+        is_bilibili = detect_platform(video_url) == "Bilibili"
         
         if is_bilibili and video_resolution == "best":
             # Use format that selects best available format without requiring premium
@@ -357,31 +827,45 @@ class YtDlpService:
         else:
             format_string = video_resolution
         
+        # Set by yt-dlp's first progress event; a failure after it is not caused by
+        # stale fetched metadata and must not download the video again
+        download_started = threading.Event()
+
+        def note_download_started(d):
+            download_started.set()
+
         ydl_opts = {
             'format': format_string,
-            'outtmpl': f'{download_folder_path}/%(title)s.%(ext)s',
+            'outtmpl': _output_template_for(download_folder_path),
             'noplaylist': True,  # Ensure only single video is downloaded
-            'progress_hooks': [progress_hook] if progress_hook else [],
+            'progress_hooks': [note_download_started, progress_hook] if progress_hook else [note_download_started],
+            'postprocessor_hooks': [postprocessor_hook] if postprocessor_hook else [],
+            'concurrent_fragment_downloads': CONCURRENT_FRAGMENT_DOWNLOADS,
         }
-        
+
+        # Keep the intermediate files of this download inside temp_dir. Videos already in
+        # the download folder are recognized and skipped, and existing files are never overwritten
+        if temp_dir:
+            ydl_opts['paths'] = {'home': download_folder_path, 'temp': temp_dir}
+            ydl_opts['outtmpl'] = OUTPUT_TEMPLATE
+            ydl_opts['overwrites'] = False
+
+        # Nothing to resume without partial files in the download's own temp dir, so skip
+        # yt-dlp's resume probing. A shared folder says nothing about this download,
+        # so without a temp dir yt-dlp's default applies
+        if temp_dir and not has_partial_downloads(temp_dir):
+            ydl_opts['continuedl'] = False
+
         # Detect audio-only mode and apply appropriate post-processor
         is_audio_only = video_resolution == "bestaudio/best"
-        postprocessors = []
         
-        if is_audio_only:
-            # Audio extraction with format conversion
-            codec_map = {'mp3': 'mp3', 'm4a': 'aac', 'ogg': 'vorbis'}
-            postprocessors.append({
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': codec_map.get(audio_format, 'aac'),
-                'preferredquality': '192',
-            })
-        else:
+        if not is_audio_only:
             # Video download with container format
             ydl_opts['merge_output_format'] = video_format
         
         # Handle subtitle options
         subtitle_status = None
+        embed_subs = False
         if subtitles_enabled and not is_audio_only:
             ydl_opts['writesubtitles'] = True
             ydl_opts['writeautomaticsub'] = True  # Also try auto-generated subtitles
@@ -389,21 +873,37 @@ class YtDlpService:
                 ydl_opts['allsubtitles'] = True
             else:
                 ydl_opts['subtitleslangs'] = [subtitle_language]
-            
-            if embed_subtitles:
-                postprocessors.append({
-                    'key': 'FFmpegEmbedSubtitle',
-                })
+            embed_subs = embed_subtitles
         
+        postprocessors = _build_postprocessors(is_audio_only, audio_format, embed_subs)
         if postprocessors:
-            ydl_opts['postprocessors'] = postprocessors
-        
-        if cookies_file:
-            ydl_opts['cookiefile'] = cookies_file
+            ydl_opts['postprocessors'] = list(postprocessors)
 
+        # yt-dlp is imported on first use; loading its extractor registry slows startup
+        import yt_dlp
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                result = ydl.extract_info(video_url, download=True)
+                if cookies_file:
+                    ydl.cookiejar = self._get_cookie_jar(cookies_file, self._get_mtime(cookies_file))
+                cached_info = self.get_cached_info(video_url, cookies_file)
+                if cached_info is not None:
+                    # Reuse the metadata from the fetch, as yt-dlp does for --load-info-json.
+                    # process_ie_result mutates nested dicts, so work on a deep copy that
+                    # leaves the cached info intact
+                    try:
+                        result = ydl.process_ie_result(
+                            ydl.sanitize_info(copy.deepcopy(cached_info), remove_private_keys=True),
+                            download=True)
+                    except yt_dlp.utils.DownloadError:
+                        # Failing before any transfer, the fetched format URLs may have
+                        # expired; extract once more. Later failures (merging, disk full)
+                        # would only repeat and are reported as they are
+                        if download_started.is_set():
+                            raise
+                        self._drop_download_info(video_url, cookies_file)
+                        result = ydl.extract_info(video_url, download=True)
+                else:
+                    result = ydl.extract_info(video_url, download=True)
                 
                 # Determine subtitle status
                 if subtitles_enabled and not is_audio_only:
@@ -413,7 +913,7 @@ class YtDlpService:
         except yt_dlp.utils.DownloadError as e:
             error_msg = str(e)
             # Check for FFmpeg-related errors
-            if 'ffmpeg' in error_msg.lower() or 'ffprobe' in error_msg.lower():
+            if _FFMPEG_ERROR_RE.search(error_msg):
                 return False, None, "FFmpeg is required for audio/subtitle processing. Please install FFmpeg and try again."
             return False, None, self._format_error_message(video_url, error_msg)
         except Exception as e:
@@ -433,14 +933,5 @@ class YtDlpService:
             return "no_subs"
         
         has_subtitles = bool(result.get('subtitles') or result.get('automatic_captions'))
-        requested_subtitles = result.get('requested_subtitles')
-        
-        if requested_subtitles:
-            if embed_subtitles:
-                return "subs_embedded"
-            return "with_subs"
-        elif has_subtitles:
-            # Subtitles were available but maybe not in requested language
-            return "with_subs"
-        else:
-            return "no_subs"
+        requested_subtitles = bool(result.get('requested_subtitles'))
+        return _SUBTITLE_STATUS[has_subtitles, requested_subtitles, bool(embed_subtitles)]
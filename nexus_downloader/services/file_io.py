@@ -0,0 +1,48 @@
+"""
+File helpers shared by the persistence services.
+"""
+import os
+import stat
+import tempfile
+
+# The umask can only be read by setting it, which is not thread-safe; read it once
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """Replace the contents of a file atomically.
+
+    The data is written to a temporary file in the same directory, which is
+    then renamed over the target, so a crash mid-write leaves either the old
+    or the new file and never a truncated one. The data is flushed to disk
+    before the rename, and the file keeps the permissions of the file it
+    replaces (or the umask default for a new file) rather than the 0600 of
+    the temporary file.
+
+    Args:
+        path: The file to write.
+        data: The complete new contents.
+
+    Raises:
+        OSError: If the file could not be written or replaced.
+    """
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=name + ".", suffix=".tmp", dir=directory or None)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -1,20 +1,114 @@
 """
-Service for managing download history persistence using JSON.
+Service for managing download history persistence using JSON Lines.
 """
+import atexit
+import bisect
 import json
 import os
-from dataclasses import asdict
-from typing import List
+import threading
+import time
+from collections import deque
+from dataclasses import MISSING, fields
+from operator import attrgetter
+from typing import Dict, List
 import logging
 
 from nexus_downloader.core.data_models import HistoryEntry
+from nexus_downloader.services.file_io import atomic_write_bytes
+
+try:
+    import orjson  # Optional C-backed encoder, several times faster than json
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# The user's home directory, resolved once per process
+_HOME = os.path.expanduser("~")
+
+# Entries added within this many seconds of each other are written together
+SAVE_DEBOUNCE_SECONDS = 0.25
+# Write straight away once this many entries are waiting
+MAX_PENDING_ENTRIES = 64
+# Records allowed on disk beyond MAX_ENTRIES before the file is compacted on load
+HISTORY_COMPACT_SLACK = 500
+# Read buffer for streaming the history file, so large files take few read() calls
+READ_BUFFER_SIZE = 1 << 20
+
+# Separates fields and entries in the search blob; a query containing it
+# falls back to matching each field separately
+_SEARCH_SEPARATOR = "\0"
+
+# HistoryEntry fields in declaration order, and those a stored record must provide
+_ENTRY_FIELD_NAMES = tuple(f.name for f in fields(HistoryEntry))
+_ENTRY_FIELDS = frozenset(_ENTRY_FIELD_NAMES)
+_REQUIRED_ENTRY_FIELDS = frozenset(
+    f.name for f in fields(HistoryEntry)
+    if f.default is MISSING and f.default_factory is MISSING
+)
+# Reused by the json fallback; json.dumps would build a new encoder per call for these options
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+# Reads every field of an entry in one call; the fields are flat scalars, so
+# unlike asdict() nothing needs to be copied recursively
+_entry_values = attrgetter(*_ENTRY_FIELD_NAMES)
+
+
+def _dump_entry(entry: HistoryEntry) -> bytes:
+    """Serialize an entry as one JSON Lines record.
+
+    Args:
+        entry: HistoryEntry to serialize.
+
+    Returns:
+        The UTF-8 encoded JSON object followed by a newline.
+    """
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"  # Serializes dataclasses natively
+    record = dict(zip(_ENTRY_FIELD_NAMES, _entry_values(entry)))
+    return _JSON_ENCODER.encode(record).encode('utf-8') + b"\n"
+
+
+def _loads(buf: bytes):
+    """Parse a JSON document with orjson when available, else the stdlib."""
+    return orjson.loads(buf) if orjson is not None else json.loads(buf)
+
+
+def _search_key(entry: HistoryEntry) -> str:
+    """Build the lowercased, separator-terminated title/URL/platform key of an entry."""
+    return f"{entry.title}{_SEARCH_SEPARATOR}{entry.url}{_SEARCH_SEPARATOR}{entry.platform}{_SEARCH_SEPARATOR}".lower()
+
+
+def _entry_from_record(record) -> HistoryEntry | None:
+    """Build an entry from a decoded record, dropping unknown keys.
+
+    Args:
+        record: The decoded JSON value.
+
+    Returns:
+        HistoryEntry, or None if the record is not an object with all required fields.
+    """
+    if not isinstance(record, dict) or not _REQUIRED_ENTRY_FIELDS <= record.keys():
+        return None
+    if not record.keys() <= _ENTRY_FIELDS:
+        record = {key: value for key, value in record.items() if key in _ENTRY_FIELDS}
+    return HistoryEntry(**record)
+
 
 class HistoryService:
-    """Service for managing download history persistence."""
-    HISTORY_FILE_NAME = "download_history.json"
+    """Service for managing download history persistence.
+
+    History is stored as JSON Lines, oldest entry first, so that adding an
+    entry is a single append rather than a rewrite of the whole file. Appends
+    are done by a background writer thread and batched: entries are written
+    SAVE_DEBOUNCE_SECONDS after the first unsaved one, on flush(), on close()
+    or at interpreter exit. Only the newest MAX_ENTRIES entries are kept; the file
+    is compacted on load once it holds HISTORY_COMPACT_SLACK records more.
+    """
+    HISTORY_FILE_NAME = "download_history.jsonl"
+    # Most entries kept; older ones are dropped
+    MAX_ENTRIES = 5000
+    # JSON array written by earlier versions, migrated on first load
+    LEGACY_HISTORY_FILE_NAME = "download_history.json"
 
     def __init__(self, history_dir: str = None):
         """Initialize the history service.
@@ -25,74 +119,247 @@ class HistoryService:
         if history_dir:
             self.history_dir = history_dir
         else:
-            self.history_dir = os.path.join(os.path.expanduser("~"), ".nexus_downloader")
+            self.history_dir = os.path.join(_HOME, ".nexus_downloader")
         os.makedirs(self.history_dir, exist_ok=True)
         self.history_path = os.path.join(self.history_dir, self.HISTORY_FILE_NAME)
-        self._history: List[HistoryEntry] = []
+        self.legacy_history_path = os.path.join(self.history_dir, self.LEGACY_HISTORY_FILE_NAME)
+        # Most recent first; appendleft is O(1) and the maxlen drops the oldest entry
+        self._history: deque[HistoryEntry] = deque(maxlen=self.MAX_ENTRIES)
+        # Lowercased, separator-terminated title/URL/platform of each entry, parallel to _history
+        self._search_keys: deque[str] = deque(maxlen=self.MAX_ENTRIES)
+        self._by_id: Dict[str, HistoryEntry] = {}
+        # All search keys joined into one string, with the start offset of
+        # each entry; rebuilt lazily after the history changes
+        self._search_blob: str | None = None
+        self._search_offsets: List[int] = []
+        self._pending: List[HistoryEntry] = []  # Added but not yet handed to a write
+        self._unwritten: List[HistoryEntry] = []  # From a failed write, retried with the next
+        self._lock = threading.Lock()  # Guards the two lists above
+        self._pending_added = threading.Condition(self._lock)
+        self._write_lock = threading.Lock()  # Keeps appends in order
+        self._writer: threading.Thread | None = None
+        self._closed = False  # Set by close(); tells the writer thread to exit
         self.load_history()
+        atexit.register(self.flush)
 
     def load_history(self) -> List[HistoryEntry]:
-        """Load history from JSON file.
+        """Load history from the JSON Lines file.
+
+        Unreadable lines, such as one torn by a crash mid-append, are skipped;
+        the original file is then backed up and rewritten without them.
 
         Returns:
-            List of HistoryEntry objects.
+            List of HistoryEntry objects, most recent first.
         """
-        if not os.path.exists(self.history_path):
+        self._read_history_file()
+        self._history = deque(self._history, maxlen=self.MAX_ENTRIES)
+        self._search_keys = deque(map(_search_key, self._history), maxlen=self.MAX_ENTRIES)
+        # Built oldest first so the most recent entry wins on a duplicate ID
+        self._by_id = {entry.id: entry for entry in reversed(self._history)}
+        self._search_blob = None
+        return list(self._history)
+
+    def _read_history_file(self) -> List[HistoryEntry]:
+        """Read the history file, migrating or repairing it as needed.
+
+        Returns:
+            List of HistoryEntry objects, most recent first.
+        """
+        self.flush()
+        history = []
+        skipped = 0
+        try:
+            # Parse line by line so only one raw record is held at a time
+            with open(self.history_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = _loads(line)
+                    except ValueError as e:  # Includes JSONDecodeError
+                        logger.warning(f"Skipping unreadable history entry: {e}")
+                        skipped += 1
+                        continue
+                    entry = _entry_from_record(record)
+                    if entry is None:
+                        logger.warning(f"Skipping invalid history entry: {record!r}")
+                        skipped += 1
+                        continue
+                    history.append(entry)
+        except FileNotFoundError:
+            return self._migrate_legacy_history()
+        except OSError as e:
+            logger.error(f"Error loading history: {e}")
             self._history = []
             return self._history
+        history.reverse()  # File is oldest first, history is most recent first
+        on_disk = len(history)
+        del history[self.MAX_ENTRIES:]
 
-        try:
-            with open(self.history_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        self._history = history
+        if skipped:
+            self._backup(self.history_path)
+        if skipped or on_disk > self.MAX_ENTRIES + HISTORY_COMPACT_SLACK:
+            try:
+                self.save_history()
+            except OSError:
+                pass  # Already logged; the readable entries are still loaded
+        return self._history
 
-            self._history = []
-            for entry_dict in data:
-                try:
-                    entry = HistoryEntry(**entry_dict)
-                    self._history.append(entry)
-                except TypeError as e:
-                    logger.warning(f"Skipping invalid history entry: {e}")
-                    continue
+    def _migrate_legacy_history(self) -> List[HistoryEntry]:
+        """Convert the legacy JSON array file, if there is one, to JSON Lines.
 
-            return self._history
+        Returns:
+            List of HistoryEntry objects, most recent first.
+        """
+        try:
+            with open(self.legacy_history_path, 'rb') as f:
+                data = _loads(f.read())
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in history file: {e}. Starting fresh.")
-            self._backup_and_reset()
+            self._backup_and_reset(self.legacy_history_path)
+            return self._history
+        except FileNotFoundError:
+            self._history = []
             return self._history
         except OSError as e:
             logger.error(f"Error loading history: {e}")
             self._history = []
             return self._history
 
-    def _backup_and_reset(self) -> None:
-        """Backup corrupted history file and start fresh."""
-        backup_path = self.history_path + ".backup"
+        entries = [_entry_from_record(record) for record in data]
+        self._history = [entry for entry in entries if entry is not None]
+        if len(self._history) != len(entries):
+            logger.warning(f"Skipped {len(entries) - len(self._history)} invalid history entries")
+        del self._history[self.MAX_ENTRIES:]
+
+        try:
+            self.save_history()
+            os.remove(self.legacy_history_path)
+            logger.info(f"Migrated history to {self.history_path}")
+        except OSError as e:
+            logger.error(f"Failed to migrate history: {e}")
+        return self._history
+
+    def _backup(self, path: str) -> None:
+        """Move a corrupted history file aside.
+
+        Args:
+            path: The history file to move aside.
+        """
+        backup_path = path + ".backup"
         try:
-            if os.path.exists(self.history_path):
-                os.rename(self.history_path, backup_path)
-                logger.info(f"Corrupted history backed up to {backup_path}")
+            os.replace(path, backup_path)
+            logger.info(f"Corrupted history backed up to {backup_path}")
+        except FileNotFoundError:
+            pass
         except OSError as e:
             logger.error(f"Failed to backup history: {e}")
+
+    def _backup_and_reset(self, path: str) -> None:
+        """Backup a corrupted history file and start fresh.
+
+        Args:
+            path: The history file to move aside.
+        """
+        self._backup(path)
         self._history = []
 
     def save_history(self) -> None:
-        """Save history to JSON file."""
-        try:
-            data = [asdict(entry) for entry in self._history]
-            with open(self.history_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except OSError as e:
-            logger.error(f"Error saving history: {e}")
-            raise
+        """Atomically rewrite the whole history file, oldest entry first.
+
+        This also writes any entries still waiting to be appended.
+        """
+        with self._write_lock:
+            try:
+                payload = b"".join(_dump_entry(entry) for entry in reversed(self._history))
+                atomic_write_bytes(self.history_path, payload)
+            except OSError as e:
+                logger.error(f"Error saving history: {e}")
+                raise
+            with self._lock:
+                self._pending.clear()
+                self._unwritten.clear()
 
     def add_entry(self, entry: HistoryEntry) -> None:
-        """Add entry and persist to file.
+        """Add entry and queue it for the background writer.
 
         Args:
             entry: HistoryEntry to add.
         """
-        self._history.insert(0, entry)  # Add to beginning (most recent first)
-        self.save_history()
+        if len(self._history) == self.MAX_ENTRIES:  # appendleft pushes the oldest out
+            dropped = self._history[-1]
+            if self._by_id.get(dropped.id) is dropped:
+                del self._by_id[dropped.id]
+        self._history.appendleft(entry)  # Add to beginning (most recent first)
+        self._search_keys.appendleft(_search_key(entry))
+        self._by_id[entry.id] = entry
+        self._search_blob = None
+        with self._lock:
+            self._pending.append(entry)
+            closed = self._closed
+            if not closed and self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="HistoryWriter", daemon=True
+                )
+                self._writer.start()
+            self._pending_added.notify()
+        if closed:
+            # No writer thread after close(), so write straight away
+            self.flush()
+
+    def flush(self) -> None:
+        """Append all entries not yet on disk to the history file in a single write.
+
+        Entries that fail to be written are kept and retried with the next write.
+        """
+        with self._write_lock:
+            with self._lock:
+                batch = self._unwritten + self._pending
+                self._unwritten = []
+                self._pending = []
+            if not batch:
+                return
+            try:
+                with open(self.history_path, 'ab') as f:
+                    f.write(b"".join(_dump_entry(entry) for entry in batch))
+            except OSError as e:
+                logger.error(f"Error saving history: {e}")
+                with self._lock:
+                    self._unwritten = batch + self._unwritten
+
+    def close(self) -> None:
+        """Write all pending entries and stop the background writer thread.
+
+        Entries added afterwards are written straight away. Safe to call more than once.
+        """
+        with self._lock:
+            self._closed = True
+            writer, self._writer = self._writer, None
+            self._pending_added.notify_all()
+        if writer is not None:
+            writer.join()
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def _write_loop(self) -> None:
+        """Background writer: waits for new entries, lets a burst collect, then flushes.
+
+        Returns once close() is called, leaving the final write to close().
+        """
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._pending_added.wait()
+                if self._closed:
+                    return
+                deadline = time.monotonic() + SAVE_DEBOUNCE_SECONDS
+                while len(self._pending) < MAX_PENDING_ENTRIES and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._pending_added.wait(remaining)
+            self.flush()
 
     def search(self, query: str) -> List[HistoryEntry]:
         """Filter history by title, URL, or platform (case-insensitive).
@@ -104,15 +371,45 @@ class HistoryService:
             List of matching HistoryEntry objects.
         """
         if not query:
-            return self._history
+            return list(self._history)
 
         query_lower = query.lower()
-        return [
-            entry for entry in self._history
-            if query_lower in entry.title.lower()
-            or query_lower in entry.url.lower()
-            or query_lower in entry.platform.lower()
-        ]
+        if _SEARCH_SEPARATOR in query_lower:
+            return [
+                entry for entry in self._history
+                if query_lower in entry.title.lower()
+                or query_lower in entry.url.lower()
+                or query_lower in entry.platform.lower()
+            ]
+
+        # One C-level scan of the blob; each hit is mapped back to its entry,
+        # and scanning resumes at the next entry so every match is reported once
+        blob, offsets = self._get_search_blob()
+        results = []
+        pos = blob.find(query_lower)
+        while pos >= 0:
+            index = bisect.bisect_right(offsets, pos) - 1
+            results.append(self._history[index])
+            if index + 1 == len(offsets):
+                break
+            pos = blob.find(query_lower, offsets[index + 1])
+        return results
+
+    def _get_search_blob(self) -> tuple[str, List[int]]:
+        """Return the search blob and entry offsets, rebuilding them if stale.
+
+        Returns:
+            Tuple of the joined search keys and the start offset of each entry.
+        """
+        if self._search_blob is None:
+            offsets = []
+            position = 0
+            for key in self._search_keys:
+                offsets.append(position)
+                position += len(key)
+            self._search_blob = "".join(self._search_keys)
+            self._search_offsets = offsets
+        return self._search_blob, self._search_offsets
 
     def get_all(self) -> List[HistoryEntry]:
         """Return all history entries.
@@ -120,7 +417,7 @@ class HistoryService:
         Returns:
             List of all HistoryEntry objects.
         """
-        return self._history
+        return list(self._history)
 
     def get_entry_by_id(self, entry_id: str) -> HistoryEntry | None:
         """Get a specific history entry by ID.
@@ -131,7 +428,4 @@ class HistoryService:
         Returns:
             HistoryEntry if found, None otherwise.
         """
-        for entry in self._history:
-            if entry.id == entry_id:
-                return entry
-        return None
+        return self._by_id.get(entry_id)
@@ -1,14 +1,20 @@
 import json
 import os
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from typing import Dict, Any, List
 import logging
 
+from nexus_downloader.services.file_io import atomic_write_bytes
+
 logger = logging.getLogger(__name__)
 
+# The user's home directory, resolved once per process
+_HOME = os.path.expanduser("~")
+
 @dataclass
 class AppSettings:
-    download_folder_path: str = field(default_factory=lambda: os.path.join(os.path.expanduser("~"), "Downloads"))
+    download_folder_path: str = field(default_factory=lambda: os.path.join(_HOME, "Downloads"))
     concurrent_downloads_limit: int = 2
     facebook_cookies_path: str = ""
     bilibili_cookies_path: str = ""
@@ -29,6 +35,16 @@ class AppSettings:
     organize_by_uploader: bool = False
     date_format: str = "YYYY-MM"
 
+# Keys accepted from the settings file; anything else is ignored on load
+_SETTINGS_KEYS = frozenset(AppSettings.__annotations__)
+# Reads every setting in declaration order in one call, without the deep
+# copy of list and dict values that asdict() makes
+_SETTINGS_FIELD_NAMES = tuple(f.name for f in fields(AppSettings))
+_settings_values = attrgetter(*_SETTINGS_FIELD_NAMES)
+
+# Shared encoder for the settings file; json.dumps(indent=...) would build one per call
+_SETTINGS_ENCODER = json.JSONEncoder(indent=4)
+
 class SettingsService:
     """
     Service for managing application settings persistence using JSON.
@@ -40,55 +56,59 @@ class SettingsService:
             self.settings_dir = settings_dir
         else:
             # Store settings in a user-specific application data directory
-            self.settings_dir = os.path.join(os.path.expanduser("~"), ".nexus_downloader")
+            self.settings_dir = os.path.join(_HOME, ".nexus_downloader")
         
         os.makedirs(self.settings_dir, exist_ok=True)
         self.settings_path = os.path.join(self.settings_dir, self.SETTINGS_FILE_NAME)
+        # JSON text last read from or written to settings_path, to skip no-op saves
+        self._last_payload = None
 
     def load_settings(self) -> AppSettings:
         """Loads application settings from the JSON file. Returns default settings if none are found or an error occurs."""
-        if not os.path.exists(self.settings_path):
-            default_settings = AppSettings()
-            self.save_settings(default_settings)
-            return default_settings
-
         try:
             with open(self.settings_path, 'r') as f:
-                settings_data = json.load(f)
+                payload = f.read()
+            settings_data = json.loads(payload)
+            self._last_payload = payload
             
             # Handle path portability: expand '~' to user home
             if 'download_folder_path' in settings_data:
                 settings_data['download_folder_path'] = os.path.expanduser(settings_data['download_folder_path'])
             
             # Filter out unknown keys and ensure types
-            valid_keys = AppSettings.__annotations__.keys()
-            filtered_data = {k: v for k, v in settings_data.items() if k in valid_keys}
+            filtered_data = {k: v for k, v in settings_data.items() if k in _SETTINGS_KEYS}
             
             # Convert types if necessary (JSON handles basic types well, but just in case)
             if 'concurrent_downloads_limit' in filtered_data:
                 filtered_data['concurrent_downloads_limit'] = int(filtered_data['concurrent_downloads_limit'])
 
             return AppSettings(**filtered_data)
+        except FileNotFoundError:
+            default_settings = AppSettings()
+            self.save_settings(default_settings)
+            return default_settings
         except (json.JSONDecodeError, OSError) as e:
             logger.error(f"Error loading settings from {self.settings_path}: {e}")
             return AppSettings() # Return default settings on error
 
     def save_settings(self, settings: AppSettings):
-        """Saves application settings to the JSON file."""
+        """Saves application settings to the JSON file, unless the file already holds them."""
         try:
-            settings_dict = asdict(settings)
+            settings_dict = dict(zip(_SETTINGS_FIELD_NAMES, _settings_values(settings)))
             
             # Handle path portability: replace user home with '~'
-            user_home = os.path.expanduser("~")
-            if settings_dict['download_folder_path'].startswith(user_home):
-                settings_dict['download_folder_path'] = settings_dict['download_folder_path'].replace(user_home, "~", 1)
+            if settings_dict['download_folder_path'].startswith(_HOME):
+                settings_dict['download_folder_path'] = settings_dict['download_folder_path'].replace(_HOME, "~", 1)
                 # Ensure we use forward slashes for better cross-platform compatibility in JSON, 
                 # though os.path handles separators. 
                 # But '~' expansion relies on os.path.expanduser which handles OS separators.
                 # Let's keep it simple: replace prefix.
 
-            with open(self.settings_path, 'w') as f:
-                json.dump(settings_dict, f, indent=4)
+            payload = _SETTINGS_ENCODER.encode(settings_dict)
+            if payload == self._last_payload:
+                return
+            atomic_write_bytes(self.settings_path, payload.encode('utf-8'))
+            self._last_payload = payload
         except OSError as e:
             logger.error(f"Error saving settings to {self.settings_path}: {e}")
             raise # Re-raise to be handled by the caller
@@ -0,0 +1,107 @@
+"""
+Table model showing the download history.
+"""
+from datetime import datetime
+from typing import List
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from nexus_downloader.core.data_models import HistoryEntry
+
+# Column headers of the history table
+HISTORY_COLUMNS = ("Date", "Title", "Platform", "Size", "Path")
+DATE_COLUMN, TITLE_COLUMN, PLATFORM_COLUMN, SIZE_COLUMN, PATH_COLUMN = range(len(HISTORY_COLUMNS))
+
+
+def format_file_size(size_bytes: int) -> str:
+    """Format bytes to human-readable string."""
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    elif size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    elif size_bytes < 1024 * 1024 * 1024:
+        return f"{size_bytes / (1024 * 1024):.1f} MB"
+    else:
+        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+
+
+def format_date(iso_date: str) -> str:
+    """Format ISO 8601 date to human-readable string."""
+    try:
+        dt = datetime.fromisoformat(iso_date)
+        return dt.strftime("%b %d, %Y %I:%M %p")
+    except ValueError:
+        return iso_date
+
+
+class HistoryTableModel(QAbstractTableModel):
+    """
+    Presents a list of HistoryEntry objects as table rows.
+
+    Cell text is produced on demand for the rows the view paints, so
+    showing a long history allocates no per-cell items.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: List[HistoryEntry] = []
+
+    @property
+    def entries(self) -> List[HistoryEntry]:
+        """The entries shown, in row order."""
+        return self._entries
+
+    def set_entries(self, entries: List[HistoryEntry]) -> None:
+        """Replaces the shown entries.
+
+        Args:
+            entries: The HistoryEntry objects to show, in row order.
+        """
+        self.beginResetModel()
+        self._entries = list(entries)
+        self.endResetModel()
+
+    def entry_at(self, row: int) -> HistoryEntry | None:
+        """Returns the entry shown in a row.
+
+        Args:
+            row: The row index.
+
+        Returns:
+            HistoryEntry if the row exists, None otherwise.
+        """
+        if 0 <= row < len(self._entries):
+            return self._entries[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HISTORY_COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == DATE_COLUMN:
+                return format_date(entry.download_date)
+            if column == TITLE_COLUMN:
+                return entry.title
+            if column == PLATFORM_COLUMN:
+                return entry.platform
+            if column == SIZE_COLUMN:
+                return format_file_size(entry.file_size)
+            return entry.file_path
+        if role == Qt.ToolTipRole and column == PATH_COLUMN:
+            return entry.file_path
+        if role == Qt.UserRole:
+            return entry.id
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return HISTORY_COLUMNS[section]
+        return super().headerData(section, orientation, role)
@@ -1,8 +1,13 @@
 """
 Main application window for the Nexus Downloader.
 """
+import functools
+import re
 import sys
 import os
+import time
+from collections import deque
+from contextlib import contextmanager
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -13,8 +18,10 @@ from PySide6.QtWidgets import (
     QPushButton,
     QTableWidget,
     QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QCheckBox,
+    QButtonGroup,
     QComboBox,
     QLabel,
     QMessageBox,
@@ -27,18 +34,23 @@ from PySide6.QtWidgets import (
     QSpacerItem,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt
-from nexus_downloader.core.download_manager import DownloadManager
+from PySide6.QtCore import Qt, QTimer, QObject, Signal, QRunnable, QThreadPool, QModelIndex, QPersistentModelIndex
+from nexus_downloader.core.download_manager import DownloadManager, COOKIES_SETTING_BY_PLATFORM
 from nexus_downloader.core.yt_dlp_service import (
     QUALITY_OPTIONS_LIST,
+    QUALITY_OPTIONS_SET,
     get_format_string,
     VIDEO_FORMAT_OPTIONS_LIST,
+    VIDEO_FORMAT_OPTIONS_SET,
     AUDIO_FORMAT_OPTIONS_LIST,
+    AUDIO_FORMAT_OPTIONS_SET,
     get_video_format_ext,
     get_audio_format_ext,
     SUBTITLE_LANGUAGE_OPTIONS_LIST,
+    SUBTITLE_LANGUAGE_OPTIONS_SET,
     get_subtitle_lang_code,
     DOWNLOAD_PRESETS_LIST,
+    DOWNLOAD_PRESETS_SET,
     DOWNLOAD_PRESET_TOOLTIPS,
     get_preset_config,
     detect_preset_from_settings,
@@ -48,18 +60,169 @@ from nexus_downloader.core.yt_dlp_service import (
 from datetime import datetime
 from nexus_downloader.ui.settings_dialog import SettingsDialog
 from nexus_downloader.services.settings_service import SettingsService, AppSettings # Import SettingsService and AppSettings
-from nexus_downloader.core.data_models import DownloadStatus, DownloadItem, HistoryEntry
+from nexus_downloader.core.data_models import DownloadStatus, DownloadItem, HistoryEntry, FINISHED_STATES
 from nexus_downloader.core.url_validator import URLValidator
 from nexus_downloader.services.history_service import HistoryService
+from nexus_downloader.ui.history_model import HistoryTableModel, format_date, format_file_size
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Title item data role marking a flat playlist entry whose details are still to be fetched
+DETAILS_PENDING_ROLE = Qt.UserRole + 1
+
+# ANSI color codes yt-dlp puts around the progress percentage
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+# Translation table dropping the percent sign and padding from a progress percentage
+_PERCENT_STRIP = str.maketrans('', '', '% ')
+
+# Interval at which the latest download percentages are drawn into the table
+PROGRESS_REFRESH_INTERVAL_MS = 100
+
+# Quiet period after the last keystroke before the history search runs
+HISTORY_SEARCH_DEBOUNCE_MS = 250
+
+# Quiet period after a finished batch before the tray notification is shown, so
+# batches finishing close together produce a single message
+TRAY_NOTIFICATION_DELAY_MS = 1500
+
+# Delay before settings changed from the main window are written back to disk
+SETTINGS_SAVE_DELAY_MS = 1000
+
+# Bits of MainWindow._org_flags, one per folder organization setting
+ORG_PLATFORM = 1
+ORG_DATE = 2
+ORG_QUALITY = 4
+ORG_UPLOADER = 8
+ORG_ENABLED = 16
+# Organization bits that make the selected quality part of the path preview
+ORG_QUALITY_IN_PATH = ORG_ENABLED | ORG_QUALITY
+
+
+def _org_flags_from_settings(settings: AppSettings) -> int:
+    """Packs the folder organization settings into ORG_* bits.
+
+    Args:
+        settings (AppSettings): The application settings.
+
+    Returns:
+        int: The combined ORG_* bits.
+    """
+    return ((ORG_ENABLED if settings.organization_enabled else 0)
+            | (ORG_PLATFORM if settings.organize_by_platform else 0)
+            | (ORG_DATE if settings.organize_by_date else 0)
+            | (ORG_QUALITY if settings.organize_by_quality else 0)
+            | (ORG_UPLOADER if settings.organize_by_uploader else 0))
+
+
+def _org_flag_property(bit: int) -> property:
+    """Exposes one ORG_* bit of MainWindow._org_flags as a boolean attribute.
+
+    Args:
+        bit (int): The ORG_* bit.
+
+    Returns:
+        property: A read/write property for the bit.
+    """
+    def getter(self) -> bool:
+        return bool(self._org_flags & bit)
+
+    def setter(self, enabled: bool) -> None:
+        self._org_flags = self._org_flags | bit if enabled else self._org_flags & ~bit
+
+    return property(getter, setter)
+
+
+# Number of recently used output folders offered in the folder dropdown
+MAX_RECENT_FOLDERS = 5
+# Folder dropdown index of the most recent folder ("Use Default", separator, recent folders...)
+FIRST_RECENT_FOLDER_INDEX = 2
+
+# Number of normalized folder paths memoized
+NORMALIZED_PATH_CACHE_SIZE = 64
+
+# Date folder setting -> strftime format
+DATE_FOLDER_FORMATS = {
+    "YYYY-MM-DD": "%Y-%m-%d",
+    "YYYY-MM": "%Y-%m",
+    "YYYY": "%Y",
+}
+# Date folder used when the setting holds an unknown value
+DEFAULT_DATE_FORMAT = "YYYY-MM"
+
+@functools.lru_cache(maxsize=NORMALIZED_PATH_CACHE_SIZE)
+def _normalize_path(path: str) -> str:
+    """Returns os.path.normpath of a path, memoized for the few folders a user picks."""
+    return os.path.normpath(path)
+
+
+def validate_folder(folder_path: str) -> tuple:
+    """Validates that a folder exists and is writable, creating it if needed.
+
+    Args:
+        folder_path (str): The folder path to validate.
+
+    Returns:
+        tuple: (is_valid: bool, error_message: str)
+    """
+    if not folder_path:
+        return False, "No folder path specified."
+    
+    # Check if folder exists
+    if not os.path.exists(folder_path):
+        # Try to create it
+        try:
+            os.makedirs(folder_path, exist_ok=True)
+            logger.info(f"Created folder: {folder_path}")
+        except OSError as e:
+            return False, f"Could not create folder: {e}"
+    
+    # Check if it's a directory
+    if not os.path.isdir(folder_path):
+        return False, "The specified path is not a directory."
+    
+    # Check if writable
+    if not os.access(folder_path, os.W_OK):
+        return False, "The folder is not writable."
+    
+    return True, ""
+
+
+class FolderValidationWorker(QRunnable):
+    """
+    A worker that validates an output folder off the UI thread, designed for QThreadPool.
+
+    Probing a network drive can block for a long time.
+    """
+    # QRunnable does not support signals directly, so we'll use a QObject for signals
+    class Signals(QObject):
+        finished = Signal(str, bool, str)  # Emit folder path, is_valid and error message
+
+    def __init__(self, folder_path):
+        super().__init__()
+        self.folder_path = folder_path
+        self.signals = self.Signals()
+
+    def run(self):
+        """
+        Validates the folder and emits the finished signal.
+        """
+        is_valid, error_message = validate_folder(self.folder_path)
+        self.signals.finished.emit(self.folder_path, is_valid, error_message)
+
+
 class MainWindow(QMainWindow):
     """
     The main window of the Nexus Downloader application.
     It provides the basic UI elements for URL input, download controls, and a table view.
     """
+    # Folder organization switches, each backed by one bit of self._org_flags
+    _organization_enabled = _org_flag_property(ORG_ENABLED)
+    _organize_by_platform = _org_flag_property(ORG_PLATFORM)
+    _organize_by_date = _org_flag_property(ORG_DATE)
+    _organize_by_quality = _org_flag_property(ORG_QUALITY)
+    _organize_by_uploader = _org_flag_property(ORG_UPLOADER)
+
     def __init__(self):
         super().__init__()
 
@@ -69,6 +232,12 @@ class MainWindow(QMainWindow):
 
         self.settings_service = SettingsService() # Instantiate SettingsService
         self.app_settings = self._load_initial_settings() # Load settings on startup
+        # Changes made through _set_setting are written back by _flush_settings
+        self._settings_dirty = False
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self._settings_save_timer.timeout.connect(self._flush_settings)
         self.history_service = HistoryService()  # Instantiate HistoryService
 
         self.download_manager = DownloadManager()
@@ -76,6 +245,25 @@ class MainWindow(QMainWindow):
         
         # Flag to prevent race condition in checkbox synchronization
         self._updating_from_select_all = False
+        # Number of checked rows in the download table, kept in step with the row checkboxes
+        self._checked_count = 0
+        # Collects the row checkboxes so one connection reports all of their toggles;
+        # a deleted checkbox leaves the group by itself
+        self._row_checkbox_group = QButtonGroup(self)
+        self._row_checkbox_group.setExclusive(False)
+        self._row_checkbox_group.buttonToggled.connect(self._on_item_toggled)
+        # Row of each video URL in the download table, so signals for a URL find their row directly
+        self._url_to_row = {}
+        # Rows whose download completed, removed by "Clear Completed". Persistent
+        # indexes keep pointing at their row while other rows are removed, and tell
+        # apart rows showing the same URL
+        self._completed_rows = set()
+        # URL -> persistent indexes of the rows queued for download, oldest first. The
+        # download signals carry only the URL, and a video may be in the table twice
+        self._active_rows = {}
+        
+        # Folder each queued video is downloaded to, recorded in the history when it ends
+        self._output_folder_by_url = {}
         
         # Download progress tracking
         self._download_queue_total = 0
@@ -89,17 +277,31 @@ class MainWindow(QMainWindow):
         self.tray_icon.setIcon(self.style().standardIcon(QStyle.SP_ArrowDown))
         self.tray_icon.setVisible(True)
         self.tray_icon.messageClicked.connect(self._on_notification_clicked)
+        # Results of finished batches not yet reported by a notification
+        self._tray_pending_success = 0
+        self._tray_pending_fail = 0
+        self._tray_timer = QTimer(self)
+        self._tray_timer.setSingleShot(True)
+        self._tray_timer.setInterval(TRAY_NOTIFICATION_DELAY_MS)
+        self._tray_timer.timeout.connect(self._show_completion_notification)
+
+        # Latest download percentage per video URL, drawn on the next progress refresh
+        self._pending_progress = {}
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_REFRESH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
         
         # Custom output folder tracking (None means use default)
         self._current_output_folder = None
+        # Browsed folder whose background validation has not reported yet
+        self._pending_folder_validation = None
         
         # Organization settings
-        self._organization_enabled = self.app_settings.organization_enabled
-        self._organize_by_platform = self.app_settings.organize_by_platform
-        self._organize_by_date = self.app_settings.organize_by_date
-        self._organize_by_quality = self.app_settings.organize_by_quality
-        self._organize_by_uploader = self.app_settings.organize_by_uploader
+        self._org_flags = _org_flags_from_settings(self.app_settings)
         self._date_format = self.app_settings.date_format
+        # (minute, {date setting: formatted date}) so folder names are formatted once a minute
+        self._date_cache = (None, {})
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -137,7 +339,7 @@ class MainWindow(QMainWindow):
         self.preset_label = QLabel("Preset:")
         self.preset_combobox = QComboBox()
         self.preset_combobox.addItems(DOWNLOAD_PRESETS_LIST)
-        if self.app_settings.download_preset in DOWNLOAD_PRESETS_LIST:
+        if self.app_settings.download_preset in DOWNLOAD_PRESETS_SET:
             self.preset_combobox.setCurrentText(self.app_settings.download_preset)
         else:
             detected = detect_preset_from_settings(
@@ -145,9 +347,6 @@ class MainWindow(QMainWindow):
                 self.app_settings.video_format
             )
             self.preset_combobox.setCurrentText(detected)
-        for i in range(self.preset_combobox.count()):
-            preset_name = self.preset_combobox.itemText(i)
-            self.preset_combobox.setItemData(i, DOWNLOAD_PRESET_TOOLTIPS.get(preset_name, ""), Qt.ToolTipRole)
         options_row_layout.addWidget(self.preset_label)
         options_row_layout.addWidget(self.preset_combobox)
         options_row_layout.addSpacing(16)
@@ -155,7 +354,7 @@ class MainWindow(QMainWindow):
         self.resolution_label = QLabel("Quality:")
         self.resolution_combobox = QComboBox()
         self.resolution_combobox.addItems(QUALITY_OPTIONS_LIST)
-        if self.app_settings.video_resolution in QUALITY_OPTIONS_LIST:
+        if self.app_settings.video_resolution in QUALITY_OPTIONS_SET:
             self.resolution_combobox.setCurrentText(self.app_settings.video_resolution)
         options_row_layout.addWidget(self.resolution_label)
         options_row_layout.addWidget(self.resolution_combobox)
@@ -164,7 +363,7 @@ class MainWindow(QMainWindow):
         self.format_label = QLabel("Format:")
         self.format_combobox = QComboBox()
         self.format_combobox.addItems(VIDEO_FORMAT_OPTIONS_LIST)
-        if self.app_settings.video_format in VIDEO_FORMAT_OPTIONS_LIST:
+        if self.app_settings.video_format in VIDEO_FORMAT_OPTIONS_SET:
             self.format_combobox.setCurrentText(self.app_settings.video_format)
         options_row_layout.addWidget(self.format_label)
         options_row_layout.addWidget(self.format_combobox)
@@ -181,7 +380,7 @@ class MainWindow(QMainWindow):
         self.subtitle_language_label = QLabel("Language:")
         self.subtitle_language_combobox = QComboBox()
         self.subtitle_language_combobox.addItems(SUBTITLE_LANGUAGE_OPTIONS_LIST)
-        if self.app_settings.subtitle_language in SUBTITLE_LANGUAGE_OPTIONS_LIST:
+        if self.app_settings.subtitle_language in SUBTITLE_LANGUAGE_OPTIONS_SET:
             self.subtitle_language_combobox.setCurrentText(self.app_settings.subtitle_language)
         self.subtitle_language_combobox.setEnabled(self.app_settings.subtitles_enabled)
         subtitle_layout.addWidget(self.subtitle_language_label)
@@ -212,7 +411,6 @@ class MainWindow(QMainWindow):
         self.folder_label = QLabel("Output Folder:")
         self.folder_combobox = QComboBox()
         self.folder_combobox.setMinimumWidth(150)
-        self._populate_folder_combobox()
         self.folder_path_display = QLineEdit()
         self.folder_path_display.setReadOnly(True)
         self.folder_path_display.setText(self.app_settings.download_folder_path)
@@ -232,7 +430,6 @@ class MainWindow(QMainWindow):
         self.path_preview_label = QLabel()
         self.path_preview_label.setStyleSheet("color: gray; font-style: italic;")
         top_bar_zone_layout.addWidget(self.path_preview_label)
-        self._update_path_preview()
 
         main_layout.addWidget(self.top_bar_zone)
 
@@ -266,6 +463,8 @@ class MainWindow(QMainWindow):
         self.download_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.download_table.setSelectionMode(QTableWidget.NoSelection)
         downloads_layout.addWidget(self.download_table)
+        # Entry details are fetched once their rows scroll into view
+        self.download_table.verticalScrollBar().valueChanged.connect(self._request_visible_entry_details)
 
         self.tab_widget.addTab(downloads_tab, "Downloads")
 
@@ -280,13 +479,13 @@ class MainWindow(QMainWindow):
         self.history_search_input.setPlaceholderText("Search history...")
         history_layout.addWidget(self.history_search_input)
 
-        # History table
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(5)
-        self.history_table.setHorizontalHeaderLabels(["Date", "Title", "Platform", "Size", "Path"])
+        # History table, backed by a model so long histories need no per-cell items
+        self.history_model = HistoryTableModel(self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
         self.history_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.history_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.history_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.history_table.setSelectionBehavior(QTableView.SelectRows)
+        self.history_table.setSelectionMode(QTableView.SingleSelection)
         self.history_table.setColumnWidth(0, 150)
         self.history_table.setColumnWidth(2, 100)
         self.history_table.setColumnWidth(3, 80)
@@ -312,6 +511,8 @@ class MainWindow(QMainWindow):
         history_layout.addLayout(history_buttons_layout)
 
         self.tab_widget.addTab(self.history_tab, "History")
+        # History rows are built when the tab is first shown and again after new downloads
+        self._history_loaded = False
 
         main_layout.addWidget(self.center_zone, 1)  # stretch=1 to fill available space
 
@@ -356,8 +557,10 @@ class MainWindow(QMainWindow):
         self.open_folder_button.clicked.connect(self._on_open_download_folder_button_clicked)
         self.clear_completed_button.clicked.connect(self._clear_completed_downloads)
         self.clear_all_button.clicked.connect(self._clear_all_downloads)
+        self.download_manager.fetch_entries.connect(self.on_fetch_entries)
         self.download_manager.fetch_finished.connect(self.on_fetch_finished)
         self.download_manager.fetch_error.connect(self.on_fetch_error)
+        self.download_manager.entry_details_ready.connect(self.on_entry_details_ready)
         self.download_manager.download_progress.connect(self.on_download_progress)
         self.download_manager.download_finished.connect(self.on_download_finished)
         self.download_manager.download_error.connect(self.on_download_error)
@@ -365,13 +568,36 @@ class MainWindow(QMainWindow):
         self.select_all_checkbox.stateChanged.connect(self._on_select_all_checkbox_state_changed)
 
         # History tab signals
+        # A burst of keystrokes restarts the timer, so the table is filtered once per pause
+        self._history_search_timer = QTimer(self)
+        self._history_search_timer.setSingleShot(True)
+        self._history_search_timer.setInterval(HISTORY_SEARCH_DEBOUNCE_MS)
+        self._history_search_timer.timeout.connect(self._run_history_search)
         self.history_search_input.textChanged.connect(self._on_history_search_input_textChanged)
-        self.history_table.itemSelectionChanged.connect(self._on_history_table_selectionChanged)
+        self.history_table.selectionModel().selectionChanged.connect(self._on_history_table_selectionChanged)
         self.open_file_button.clicked.connect(self._on_open_file_button_clicked)
         self.open_history_folder_button.clicked.connect(self._on_open_history_folder_button_clicked)
         self.redownload_button.clicked.connect(self._on_redownload_button_clicked)
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
+        # Fill in the remaining widgets once the event loop runs, so the window paints first
+        QTimer.singleShot(0, self._post_init)
+
+    def _post_init(self):
+        """Fills in widget content that is not needed for the first paint."""
+        # The combobox was filled from DOWNLOAD_PRESETS_LIST, so its names need not be read back
+        set_item_data = self.preset_combobox.setItemData
+        for i, preset_name in enumerate(DOWNLOAD_PRESETS_LIST):
+            set_item_data(i, DOWNLOAD_PRESET_TOOLTIPS.get(preset_name, ""), Qt.ToolTipRole)
+        self._populate_folder_combobox()
+        self._update_path_preview()
+
+    def closeEvent(self, event):
+        """Writes pending settings changes and history entries before the window closes."""
+        self._flush_settings()
+        self.history_service.close()
+        super().closeEvent(event)
+
     def _on_open_download_folder_button_clicked(self):
         """
         Opens the download folder.
@@ -394,63 +620,85 @@ class MainWindow(QMainWindow):
         is_checked = (state == Qt.Checked) or (state == 2)
         
         # Update all individual checkboxes
-        for row in range(self.download_table.rowCount()):
+        row_count = self.download_table.rowCount()
+        for row in range(row_count):
             checkbox_item = self.download_table.cellWidget(row, 0)
             if checkbox_item:
                 checkbox_item.setChecked(is_checked)
+        self._checked_count = row_count if is_checked else 0
         
         # Clear flag after updates complete
         self._updating_from_select_all = False
 
-    def _on_item_state_changed(self, state):
-        """Handles state changes of individual item checkboxes."""
+    def _on_item_toggled(self, checkbox, checked):
+        """Handles toggles of individual item checkboxes.
+
+        Args:
+            checkbox (QCheckBox): The row checkbox that was toggled.
+            checked (bool): Its new checked state.
+        """
         # Don't update during bulk "Select All" operation
         if self._updating_from_select_all:
             return
         
-        # Check if all items are checked
-        all_checked = True
-        for row in range(self.download_table.rowCount()):
-            checkbox = self.download_table.cellWidget(row, 0)
-            if checkbox and not checkbox.isChecked():
-                all_checked = False
-                break
+        self._checked_count += 1 if checked else -1
+        all_checked = self._checked_count == self.download_table.rowCount()
         
         # Update "Select All" checkbox without triggering its signal
-        self.select_all_checkbox.blockSignals(True)
-        self.select_all_checkbox.setChecked(all_checked)
-        self.select_all_checkbox.blockSignals(False)
+        with self._suspend_signals(self.select_all_checkbox):
+            self.select_all_checkbox.setChecked(all_checked)
+
+    @contextmanager
+    def _suspend_signals(self, *widgets):
+        """Blocks the signals of widgets, restoring each one's previous state afterwards.
+
+        Restoring rather than unblocking keeps nested suspensions from
+        re-enabling signals that an outer caller still has blocked.
+
+        Args:
+            *widgets (QObject): The widgets to silence.
+        """
+        previous = [widget.blockSignals(True) for widget in widgets]
+        try:
+            yield
+        finally:
+            for widget, was_blocked in zip(widgets, previous):
+                widget.blockSignals(was_blocked)
+
+    def _refresh_format_options(self, quality: str) -> None:
+        """Fills the format dropdown with the formats available for a quality.
 
-    def _on_quality_changed(self, quality: str):
-        """Updates format dropdown based on quality selection.
-        
         When 'Audio Only' is selected, shows audio format options.
         Otherwise, shows video format options.
-        
+
         Args:
             quality (str): The selected quality option.
         """
         # Block format combobox signal during update to prevent multiple custom detections
-        self.format_combobox.blockSignals(True)
-        
-        if quality == "Audio Only":
-            self.format_combobox.clear()
-            self.format_combobox.addItems(AUDIO_FORMAT_OPTIONS_LIST)
-            if self.app_settings.audio_format in AUDIO_FORMAT_OPTIONS_LIST:
-                self.format_combobox.setCurrentText(self.app_settings.audio_format)
-        else:
+        with self._suspend_signals(self.format_combobox):
             self.format_combobox.clear()
-            self.format_combobox.addItems(VIDEO_FORMAT_OPTIONS_LIST)
-            if self.app_settings.video_format in VIDEO_FORMAT_OPTIONS_LIST:
-                self.format_combobox.setCurrentText(self.app_settings.video_format)
+            if quality == "Audio Only":
+                self.format_combobox.addItems(AUDIO_FORMAT_OPTIONS_LIST)
+                if self.app_settings.audio_format in AUDIO_FORMAT_OPTIONS_SET:
+                    self.format_combobox.setCurrentText(self.app_settings.audio_format)
+            else:
+                self.format_combobox.addItems(VIDEO_FORMAT_OPTIONS_LIST)
+                if self.app_settings.video_format in VIDEO_FORMAT_OPTIONS_SET:
+                    self.format_combobox.setCurrentText(self.app_settings.video_format)
+
+    def _on_quality_changed(self, quality: str):
+        """Updates format dropdown based on quality selection.
         
-        self.format_combobox.blockSignals(False)
+        Args:
+            quality (str): The selected quality option.
+        """
+        self._refresh_format_options(quality)
         
         # Detect if current selection matches a preset
         self._update_preset_from_current_settings()
         
         # Update path preview when quality changes
-        self._update_path_preview()
+        self._update_path_preview_for_quality()
 
     def _on_preset_changed(self, preset_name: str):
         """Applies preset settings when a preset is selected.
@@ -464,18 +712,16 @@ class MainWindow(QMainWindow):
         config = get_preset_config(preset_name)
         if config["quality"] and config["format"]:
             # Block signals to prevent triggering custom detection
-            self.resolution_combobox.blockSignals(True)
-            self.format_combobox.blockSignals(True)
-            
-            # Apply quality
-            self.resolution_combobox.setCurrentText(config["quality"])
-            # Trigger format dropdown update for Audio Only
-            self._on_quality_changed(config["quality"])
-            # Apply format
-            self.format_combobox.setCurrentText(config["format"])
+            with self._suspend_signals(self.resolution_combobox, self.format_combobox):
+                # Apply quality
+                self.resolution_combobox.setCurrentText(config["quality"])
+                # Update format dropdown for Audio Only
+                self._refresh_format_options(config["quality"])
+                # Apply format
+                self.format_combobox.setCurrentText(config["format"])
             
-            self.resolution_combobox.blockSignals(False)
-            self.format_combobox.blockSignals(False)
+            # The preset dropdown already shows the applied preset; only the preview may change
+            self._update_path_preview_for_quality()
 
     def _update_preset_from_current_settings(self):
         """Updates preset dropdown based on current quality/format selection."""
@@ -484,9 +730,8 @@ class MainWindow(QMainWindow):
         detected_preset = detect_preset_from_settings(current_quality, current_format)
         
         # Block signals to prevent recursive calls
-        self.preset_combobox.blockSignals(True)
-        self.preset_combobox.setCurrentText(detected_preset)
-        self.preset_combobox.blockSignals(False)
+        with self._suspend_signals(self.preset_combobox):
+            self.preset_combobox.setCurrentText(detected_preset)
 
     def _on_subtitle_checkbox_changed(self, state):
         """Handles state change of the subtitle checkbox."""
@@ -496,7 +741,11 @@ class MainWindow(QMainWindow):
 
     def _populate_folder_combobox(self) -> None:
         """Populates the folder combobox with default, recent folders, and presets."""
-        self.folder_combobox.blockSignals(True)
+        with self._suspend_signals(self.folder_combobox):
+            self._fill_folder_combobox()
+
+    def _fill_folder_combobox(self) -> None:
+        """Adds the default, recent folder and preset entries to the folder combobox."""
         self.folder_combobox.clear()
         
         # Add "Use Default" as first option
@@ -506,16 +755,13 @@ class MainWindow(QMainWindow):
         if self.app_settings.recent_folders:
             self.folder_combobox.insertSeparator(self.folder_combobox.count())
             for folder in self.app_settings.recent_folders:
-                display_name = os.path.basename(folder) or folder
-                self.folder_combobox.addItem(f"Recent: {display_name}", folder)
+                self.folder_combobox.addItem(self._recent_folder_label(folder), folder)
         
         # Add folder presets
         if self.app_settings.folder_presets:
             self.folder_combobox.insertSeparator(self.folder_combobox.count())
             for name, path in self.app_settings.folder_presets.items():
                 self.folder_combobox.addItem(f"Preset: {name}", path)
-        
-        self.folder_combobox.blockSignals(False)
 
     def _on_folder_combobox_changed(self, index: int) -> None:
         """Handles folder combobox selection change.
@@ -544,13 +790,41 @@ class MainWindow(QMainWindow):
             QFileDialog.ShowDirsOnly
         )
         if folder:
-            folder = os.path.normpath(folder)
+            folder = _normalize_path(folder)
             self._current_output_folder = folder
             self.folder_path_display.setText(folder)
             # Reset combobox to show custom selection
-            self.folder_combobox.blockSignals(True)
-            self.folder_combobox.setCurrentIndex(-1)
-            self.folder_combobox.blockSignals(False)
+            with self._suspend_signals(self.folder_combobox):
+                self.folder_combobox.setCurrentIndex(-1)
+            self._start_folder_validation(folder)
+
+    def _start_folder_validation(self, folder_path: str) -> None:
+        """Validates a chosen folder in the background, holding off downloads until it is checked.
+
+        Args:
+            folder_path (str): The folder path to validate.
+        """
+        self._pending_folder_validation = folder_path
+        self.download_button.setEnabled(False)
+        worker = FolderValidationWorker(folder_path)
+        worker.signals.finished.connect(self._on_folder_validated)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_folder_validated(self, folder_path: str, is_valid: bool, error_message: str) -> None:
+        """Handles the result of a background folder validation.
+
+        Args:
+            folder_path (str): The validated folder path.
+            is_valid (bool): Whether the folder can be downloaded to.
+            error_message (str): Why the folder is unusable, if it is.
+        """
+        if folder_path != self._pending_folder_validation:
+            return  # A newer validation is still running
+        self._pending_folder_validation = None
+        if self.download_manager.is_idle():
+            self.download_button.setEnabled(True)
+        if not is_valid and folder_path == self._current_output_folder:
+            QMessageBox.warning(self, "Folder Error", f"Cannot download to the selected folder:\n{error_message}")
 
     def _validate_folder(self, folder_path: str) -> tuple:
         """Validates that a folder exists and is writable.
@@ -561,88 +835,104 @@ class MainWindow(QMainWindow):
         Returns:
             tuple: (is_valid: bool, error_message: str)
         """
-        if not folder_path:
-            return False, "No folder path specified."
-        
-        # Check if folder exists
-        if not os.path.exists(folder_path):
-            # Try to create it
-            try:
-                os.makedirs(folder_path, exist_ok=True)
-                logger.info(f"Created folder: {folder_path}")
-            except OSError as e:
-                return False, f"Could not create folder: {e}"
-        
-        # Check if it's a directory
-        if not os.path.isdir(folder_path):
-            return False, "The specified path is not a directory."
-        
-        # Check if writable
-        if not os.access(folder_path, os.W_OK):
-            return False, "The folder is not writable."
-        
-        return True, ""
+        return validate_folder(folder_path)
 
     def _add_recent_folder(self, folder_path: str) -> None:
         """Adds a folder to the recent folders list.
         
         Maintains max 5 recent folders. Duplicates are moved to the front.
+        The folder dropdown is updated in place rather than rebuilt.
         
         Args:
             folder_path (str): The folder path to add.
         """
-        folder_path = os.path.normpath(folder_path)
+        folder_path = _normalize_path(folder_path)
         
         # Don't add the default folder to recent
-        default_folder = os.path.normpath(self.app_settings.download_folder_path)
+        default_folder = _normalize_path(self.app_settings.download_folder_path)
         if folder_path == default_folder:
             return
         
-        # Remove if already exists (will re-add at front)
-        if folder_path in self.app_settings.recent_folders:
-            self.app_settings.recent_folders.remove(folder_path)
-        
-        # Add to front
-        self.app_settings.recent_folders.insert(0, folder_path)
-        
-        # Limit to 5 folders
-        self.app_settings.recent_folders = self.app_settings.recent_folders[:5]
-        
-        # Save settings
+        previous_folders = self.app_settings.recent_folders
+        if previous_folders and previous_folders[0] == folder_path:
+            return  # Already the most recent folder
+        
+        # Add to front, dropping an earlier occurrence, and limit to 5 folders
+        recent_folders = [folder_path]
+        recent_folders.extend(f for f in previous_folders if f != folder_path)
+        self._set_setting("recent_folders", recent_folders[:MAX_RECENT_FOLDERS])
+        
+        # Update combobox: move or insert the folder first and drop entries past the limit
+        combobox = self.folder_combobox
+        with self._suspend_signals(combobox):
+            was_current = combobox.currentIndex() >= 0 and combobox.currentData() == folder_path
+            if not previous_folders:
+                combobox.insertSeparator(FIRST_RECENT_FOLDER_INDEX - 1)
+            elif folder_path in previous_folders:
+                combobox.removeItem(FIRST_RECENT_FOLDER_INDEX + previous_folders.index(folder_path))
+            combobox.insertItem(FIRST_RECENT_FOLDER_INDEX, self._recent_folder_label(folder_path), folder_path)
+            for _ in range(len(recent_folders) - MAX_RECENT_FOLDERS):
+                combobox.removeItem(FIRST_RECENT_FOLDER_INDEX + MAX_RECENT_FOLDERS)
+            if was_current:
+                combobox.setCurrentIndex(FIRST_RECENT_FOLDER_INDEX)
+
+    @staticmethod
+    def _recent_folder_label(folder: str) -> str:
+        """Returns the folder dropdown text for a recent folder.
+
+        Args:
+            folder (str): The folder path.
+
+        Returns:
+            str: The dropdown label.
+        """
+        display_name = os.path.basename(folder) or folder
+        return f"Recent: {display_name}"
+
+    def _set_setting(self, name: str, value) -> None:
+        """Updates a cached setting and schedules writing the settings to disk.
+
+        Args:
+            name (str): The AppSettings attribute to update.
+            value: The new value.
+        """
+        setattr(self.app_settings, name, value)
+        self._settings_dirty = True
+        self._settings_save_timer.start()
+
+    def _flush_settings(self) -> None:
+        """Writes the cached settings to disk if they changed since the last write."""
+        self._settings_save_timer.stop()
+        if not self._settings_dirty:
+            return
         try:
             self.settings_service.save_settings(self.app_settings)
-            # Update combobox
-            self._populate_folder_combobox()
+            self._settings_dirty = False
         except Exception as e:
-            logger.error(f"Failed to save recent folders: {e}")
+            logger.error(f"Failed to save settings: {e}")
 
     def _update_path_preview(self) -> None:
         """Updates the path preview label based on organization settings."""
-        if not self._organization_enabled:
+        flags = self._org_flags
+        if not flags & ORG_ENABLED:
             self.path_preview_label.setText("Organization: Disabled")
             return
         
         # Build preview path components
         components = []
         
-        if self._organize_by_platform:
+        if flags & ORG_PLATFORM:
             components.append("{Platform}")
         
-        if self._organize_by_date:
+        if flags & ORG_DATE:
             # Show actual date format preview
-            now = datetime.now()
-            if self._date_format == "YYYY-MM-DD":
-                components.append(now.strftime("%Y-%m-%d"))
-            elif self._date_format == "YYYY-MM":
-                components.append(now.strftime("%Y-%m"))
-            elif self._date_format == "YYYY":
-                components.append(now.strftime("%Y"))
-        
-        if self._organize_by_quality:
+            components.append(self._get_date_folder())
+        
+        if flags & ORG_QUALITY:
             quality = self.resolution_combobox.currentText()
             components.append(quality)
         
-        if self._organize_by_uploader:
+        if flags & ORG_UPLOADER:
             components.append("{Uploader}")
         
         if components:
@@ -651,6 +941,27 @@ class MainWindow(QMainWindow):
         else:
             self.path_preview_label.setText("Organization: Enabled (no rules selected)")
 
+    def _update_path_preview_for_quality(self) -> None:
+        """Updates the path preview after a quality change, if the quality is part of it."""
+        if self._org_flags & ORG_QUALITY_IN_PATH == ORG_QUALITY_IN_PATH:
+            self._update_path_preview()
+
+    def _get_date_folder(self) -> str:
+        """Returns today's date formatted for the current date folder setting.
+
+        The strings are recomputed at most once a minute.
+
+        Returns:
+            str: The date folder name.
+        """
+        minute = int(time.time() // 60)
+        cached_minute, date_folders = self._date_cache
+        if cached_minute != minute:
+            now = datetime.now()
+            date_folders = {name: now.strftime(fmt) for name, fmt in DATE_FOLDER_FORMATS.items()}
+            self._date_cache = (minute, date_folders)
+        return date_folders.get(self._date_format, date_folders[DEFAULT_DATE_FORMAT])
+
     def _generate_organized_path(self, base_folder: str, url: str, uploader: str = None) -> str:
         """Generates an organized folder path based on organization settings.
         
@@ -662,36 +973,29 @@ class MainWindow(QMainWindow):
         Returns:
             str: The organized folder path.
         """
-        if not self._organization_enabled:
+        flags = self._org_flags
+        # Nothing to add unless organization is on and at least one rule is selected
+        if not flags & ORG_ENABLED or flags == ORG_ENABLED:
             return base_folder
         
         components = [base_folder]
         
         # Platform subfolder
-        if self._organize_by_platform:
+        if flags & ORG_PLATFORM:
             platform = detect_platform(url)
             components.append(sanitize_folder_name(platform))
         
         # Date subfolder
-        if self._organize_by_date:
-            now = datetime.now()
-            if self._date_format == "YYYY-MM-DD":
-                date_folder = now.strftime("%Y-%m-%d")
-            elif self._date_format == "YYYY-MM":
-                date_folder = now.strftime("%Y-%m")
-            elif self._date_format == "YYYY":
-                date_folder = now.strftime("%Y")
-            else:
-                date_folder = now.strftime("%Y-%m")  # Default fallback
-            components.append(date_folder)
+        if flags & ORG_DATE:
+            components.append(self._get_date_folder())
         
         # Quality subfolder
-        if self._organize_by_quality:
+        if flags & ORG_QUALITY:
             quality = self.resolution_combobox.currentText()
             components.append(sanitize_folder_name(quality))
         
         # Uploader subfolder
-        if self._organize_by_uploader and uploader:
+        if flags & ORG_UPLOADER and uploader:
             components.append(sanitize_folder_name(uploader))
         
         return os.path.join(*components)
@@ -717,14 +1021,10 @@ class MainWindow(QMainWindow):
         Returns:
             str: Path to the cookies file, or empty string if not configured.
         """
-        url_lower = url.lower()
-        if 'bilibili.com' in url_lower or 'b23.tv' in url_lower:
-            return self.app_settings.bilibili_cookies_path
-        elif 'xiaohongshu.com' in url_lower or 'xhslink.com' in url_lower:
-            return self.app_settings.xiaohongshu_cookies_path
-        elif 'facebook.com' in url_lower or 'fb.watch' in url_lower:
-            return self.app_settings.facebook_cookies_path
-        return ""
+        setting_name = COOKIES_SETTING_BY_PLATFORM.get(detect_platform(url))
+        if setting_name is None:
+            return ""
+        return getattr(self.app_settings, setting_name)
 
     def _open_settings_dialog(self):
         """Opens the settings dialog."""
@@ -753,78 +1053,107 @@ class MainWindow(QMainWindow):
         dialog.settings_saved.connect(self._on_settings_saved)
         dialog.exec()
 
-    def _on_settings_saved(self, new_limit: int, new_download_path: str, new_cookies_path: str,
-                           new_bilibili_cookies_path: str, new_xiaohongshu_cookies_path: str,
-                           new_video_resolution: str, new_video_format: str, new_audio_format: str,
-                           new_subtitles_enabled: bool, new_subtitle_language: str, new_embed_subtitles: bool,
-                           new_download_preset: str, new_folder_presets: dict,
-                           new_organization_enabled: bool, new_organize_by_platform: bool,
-                           new_organize_by_date: bool, new_organize_by_quality: bool,
-                           new_organize_by_uploader: bool, new_date_format: str):
-        """Handles the settings_saved signal from the SettingsDialog."""
-        self.app_settings.concurrent_downloads_limit = new_limit
-        self.app_settings.download_folder_path = new_download_path
-        self.app_settings.facebook_cookies_path = new_cookies_path
-        self.app_settings.bilibili_cookies_path = new_bilibili_cookies_path
-        self.app_settings.xiaohongshu_cookies_path = new_xiaohongshu_cookies_path
-        self.app_settings.video_resolution = new_video_resolution
-        self.app_settings.video_format = new_video_format
-        self.app_settings.audio_format = new_audio_format
-        self.app_settings.subtitles_enabled = new_subtitles_enabled
-        self.app_settings.subtitle_language = new_subtitle_language
-        self.app_settings.embed_subtitles = new_embed_subtitles
-        self.app_settings.download_preset = new_download_preset
-        self.app_settings.folder_presets = new_folder_presets
-        self.app_settings.organization_enabled = new_organization_enabled
-        self.app_settings.organize_by_platform = new_organize_by_platform
-        self.app_settings.organize_by_date = new_organize_by_date
-        self.app_settings.organize_by_quality = new_organize_by_quality
-        self.app_settings.organize_by_uploader = new_organize_by_uploader
-        self.app_settings.date_format = new_date_format
+    def _on_settings_saved(self, new_settings: AppSettings):
+        """Handles the settings_saved signal from the SettingsDialog.
+
+        Args:
+            new_settings (AppSettings): The settings edited in the dialog.
+        """
+        # The dialog does not edit the recent folders
+        new_settings.recent_folders = self.app_settings.recent_folders
+        self.app_settings = new_settings
+        self._sync_ui_from_settings()
         
+        try:
+            self.settings_service.save_settings(self.app_settings)
+            self._settings_dirty = False
+            self.download_manager.update_settings(self.app_settings)
+            QMessageBox.information(self, "Settings Saved", 
+                                    f"Settings saved successfully.")
+            logger.info(f"Settings saved: {self.app_settings}")
+        except Exception as e:
+            logger.error(f"Failed to save settings: {e}")
+            QMessageBox.critical(self, "Save Error", 
+                                 f"Failed to save settings: {e}. Please try again.")
+
+    def _sync_ui_from_settings(self) -> None:
+        """Brings the main window controls in line with self.app_settings."""
+        settings = self.app_settings
         # Update local organization settings
-        self._organization_enabled = new_organization_enabled
-        self._organize_by_platform = new_organize_by_platform
-        self._organize_by_date = new_organize_by_date
-        self._organize_by_quality = new_organize_by_quality
-        self._organize_by_uploader = new_organize_by_uploader
-        self._date_format = new_date_format
+        self._org_flags = _org_flags_from_settings(settings)
+        self._date_format = settings.date_format
         
         # Update subtitle controls in main window
-        self.subtitle_checkbox.setChecked(new_subtitles_enabled)
-        if new_subtitle_language in SUBTITLE_LANGUAGE_OPTIONS_LIST:
-            self.subtitle_language_combobox.setCurrentText(new_subtitle_language)
-        self.embed_subtitles_checkbox.setChecked(new_embed_subtitles)
+        self.subtitle_checkbox.setChecked(settings.subtitles_enabled)
+        if settings.subtitle_language in SUBTITLE_LANGUAGE_OPTIONS_SET:
+            self.subtitle_language_combobox.setCurrentText(settings.subtitle_language)
+        self.embed_subtitles_checkbox.setChecked(settings.embed_subtitles)
         
         # Update preset dropdown in main window
-        if new_download_preset in DOWNLOAD_PRESETS_LIST:
-            self.preset_combobox.setCurrentText(new_download_preset)
+        if settings.download_preset in DOWNLOAD_PRESETS_SET:
+            self.preset_combobox.setCurrentText(settings.download_preset)
         
         # Update folder combobox with new presets and update path display
         self._populate_folder_combobox()
-        self.folder_path_display.setText(self._current_output_folder or new_download_path)
+        self.folder_path_display.setText(self._current_output_folder or settings.download_folder_path)
         
         # Update path preview
         self._update_path_preview()
-        
-        try:
-            self.settings_service.save_settings(self.app_settings)
-            self.download_manager.update_settings(self.app_settings)
-            QMessageBox.information(self, "Settings Saved", 
-                                    f"Settings saved successfully.")
-            logger.info(f"Settings saved: {self.app_settings}")
-        except Exception as e:
-            logger.error(f"Failed to save settings: {e}")
-            QMessageBox.critical(self, "Save Error", 
-                                 f"Failed to save settings: {e}. Please try again.")
 
     def _find_row_by_url(self, video_url):
         """Finds a row in the table by its video URL."""
+        return self._url_to_row.get(video_url, -1)
+
+    def _row_index(self, row):
+        """Returns a persistent index identifying a download table row."""
+        return QPersistentModelIndex(self.download_table.model().index(row, 1))
+
+    def _find_download_row(self, video_url):
+        """Finds the row the download signals of a URL belong to.
+
+        The oldest row queued for the URL that is still in the table, so a video
+        added and downloaded twice updates the row being downloaded. Signals
+        without a queued row fall back to the first unfinished row of the URL.
+        """
+        rows = self._active_rows.get(video_url)
+        while rows:
+            if rows[0].isValid():
+                return rows[0].row()
+            rows.popleft()
+        return self._find_unfinished_row_by_url(video_url)
+
+    def _release_download_row(self, video_url):
+        """Forgets the row of a URL's oldest download once its final signal was handled."""
+        rows = self._active_rows.get(video_url)
+        if rows:
+            rows.popleft()
+            if not rows:
+                del self._active_rows[video_url]
+
+    def _find_unfinished_row_by_url(self, video_url):
+        """Finds the first row of a URL that has not completed.
+
+        The URL's first row, unless it already completed and a later row shows
+        the same URL, as when a video was added and downloaded twice.
+        """
+        row = self._find_row_by_url(video_url)
+        if row == -1 or self._row_index(row) not in self._completed_rows:
+            return row
+        for other_row in range(row + 1, self.download_table.rowCount()):
+            item = self.download_table.item(other_row, 1)
+            if (item and item.data(Qt.UserRole) == video_url
+                    and self._row_index(other_row) not in self._completed_rows):
+                return other_row
+        return row
+
+    def _rebuild_url_index(self):
+        """Rebuilds the URL to row index after rows were removed from the download table."""
+        self._url_to_row = {}
         for row in range(self.download_table.rowCount()):
-            item = self.download_table.item(row, 1) # Title item
-            if item and item.data(Qt.UserRole) == video_url:
-                return row
-        return -1
+            item = self.download_table.item(row, 1)  # Title item
+            if item:
+                # The first row showing a URL wins, as it did for the table scan
+                self._url_to_row.setdefault(item.data(Qt.UserRole), row)
 
     def _update_item_status(self, row, status, text_override=None, progress_value=None):
         """Updates the status and text of a table row."""
@@ -833,15 +1162,10 @@ class MainWindow(QMainWindow):
             if status == DownloadStatus.DOWNLOADING and progress_value is not None:
                 progress_bar.setValue(int(progress_value))
                 progress_bar.setFormat(f"Downloading {progress_value}%")
-            elif status == DownloadStatus.COMPLETED:
-                progress_bar.setValue(100)
-                progress_bar.setFormat("Completed")
-            elif status == DownloadStatus.ERROR:
-                progress_bar.setValue(0)
-                progress_bar.setFormat("Error")
-            elif status == DownloadStatus.CANCELLED:
-                progress_bar.setValue(0)
-                progress_bar.setFormat("Cancelled")
+            elif status in FINISHED_STATES:
+                # Only completed rows show a full bar ("Completed", "Cancelled", "Error")
+                progress_bar.setValue(100 if status == DownloadStatus.COMPLETED else 0)
+                progress_bar.setFormat(status.name.title())
             else:
                 progress_bar.setValue(0)
                 progress_bar.setFormat(status.name.replace('_', ' ').title())
@@ -914,6 +1238,7 @@ class MainWindow(QMainWindow):
             return
         
         video_urls_to_queue = []
+        queued_rows = []
         for row in range(self.download_table.rowCount()):
             checkbox_item = self.download_table.cellWidget(row, 0)
             if checkbox_item and checkbox_item.isChecked():
@@ -921,6 +1246,7 @@ class MainWindow(QMainWindow):
                 video_url = title_item.data(Qt.UserRole)
                 if video_url:
                     video_urls_to_queue.append(video_url)
+                    queued_rows.append(self._row_index(row))
                     self._update_item_status(row, DownloadStatus.QUEUED)
         
         if video_urls_to_queue:
@@ -937,6 +1263,12 @@ class MainWindow(QMainWindow):
                                          f"Cannot create organized folder:\n{error_message}")
                     return
             
+            self._output_folder_by_url.update(dict.fromkeys(video_urls_to_queue, output_folder))
+            # Downloading a completed row again makes it active again
+            self._completed_rows.difference_update(queued_rows)
+            for video_url, row_index in zip(video_urls_to_queue, queued_rows):
+                self._active_rows.setdefault(video_url, deque()).append(row_index)
+
             # Initialize progress tracking
             self._download_queue_total = len(video_urls_to_queue)
             self._download_completed_count = 0
@@ -991,47 +1323,110 @@ class MainWindow(QMainWindow):
         Handles the finished signal from the FetchWorker.
         """
         self._set_fetch_button_loading_state(False)
+        self.on_fetch_entries(videos)
+
+    @contextmanager
+    def _bulk_table_update(self, table):
+        """Suspends repaints, signals and sorting of a table while many rows change.
+
+        Args:
+            table (QTableView): The table being filled.
+        """
+        sorting_enabled = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        try:
+            with self._suspend_signals(table):
+                yield table
+        finally:
+            table.setSortingEnabled(sorting_enabled)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+
+    def on_fetch_entries(self, videos):
+        """
+        Adds fetched videos to the download table, also while a playlist is still being read.
+        """
         if videos:
-            for video_info in videos:
-                row_position = self.download_table.rowCount()
-                self.download_table.insertRow(row_position)
-
-                checkbox = QCheckBox()
-                checkbox.stateChanged.connect(self._on_item_state_changed)
-                self.download_table.setCellWidget(row_position, 0, checkbox)
-                
-                # Update "Select All" checkbox state if a new unchecked item is added
-                if self.select_all_checkbox.isChecked():
-                    self.select_all_checkbox.blockSignals(True)
+            # Update "Select All" checkbox state since new unchecked items are added
+            if self.select_all_checkbox.isChecked():
+                with self._suspend_signals(self.select_all_checkbox):
                     self.select_all_checkbox.setChecked(False)
-                    self.select_all_checkbox.blockSignals(False)
-
-                title = video_info.get('title', 'Unknown Title')
-                # Try multiple field names for video URL
-                # Single videos use 'webpage_url' or 'original_url'
-                # Playlist entries use 'url'
-                video_url = video_info.get('webpage_url') or video_info.get('url') or video_info.get('original_url', '')
-                title_item = QTableWidgetItem(title)
-                title_item.setData(Qt.UserRole, video_url)
-                self.download_table.setItem(row_position, 1, title_item)
-
-                # Quality column
-                resolution = self.resolution_combobox.currentText()
-                resolution_item = QTableWidgetItem(resolution)
-                self.download_table.setItem(row_position, 2, resolution_item)
-
-                # Format column
-                format_text = self.format_combobox.currentText()
-                format_item = QTableWidgetItem(format_text)
-                self.download_table.setItem(row_position, 3, format_item)
-
-                # Use QProgressBar for status (now column 4)
-                progress_bar = QProgressBar()
-                progress_bar.setRange(0, 100)
-                progress_bar.setValue(0)
-                progress_bar.setFormat(DownloadStatus.PENDING.name.replace('_', ' ').title())
-                self.download_table.setCellWidget(row_position, 4, progress_bar)
 
+            with self._bulk_table_update(self.download_table):
+                first_row = self.download_table.rowCount()
+                self.download_table.setRowCount(first_row + len(videos))
+                for row_position, video_info in enumerate(videos, first_row):
+                    self._fill_download_row(row_position, video_info)
+
+            self._request_visible_entry_details()
+
+    def _fill_download_row(self, row_position: int, video_info: dict) -> None:
+        """Fills one download table row from fetched video information.
+
+        Args:
+            row_position (int): The row to fill.
+            video_info (dict): The fetched video information.
+        """
+        checkbox = QCheckBox()
+        self._row_checkbox_group.addButton(checkbox)
+        self.download_table.setCellWidget(row_position, 0, checkbox)
+
+        # Flat playlist entries may carry no title
+        title = video_info.get('title') or 'Unknown Title'
+        # Try multiple field names for video URL
+        # Single videos use 'webpage_url' or 'original_url'
+        # Playlist entries use 'url'
+        video_url = video_info.get('webpage_url') or video_info.get('url') or video_info.get('original_url', '')
+        title_item = QTableWidgetItem(title)
+        title_item.setData(Qt.UserRole, video_url)
+        self._url_to_row.setdefault(video_url, row_position)
+        if not video_info.get('title') and video_url:
+            title_item.setData(DETAILS_PENDING_ROLE, True)
+        self.download_table.setItem(row_position, 1, title_item)
+
+        # Quality column
+        resolution = self.resolution_combobox.currentText()
+        resolution_item = QTableWidgetItem(resolution)
+        self.download_table.setItem(row_position, 2, resolution_item)
+
+        # Format column
+        format_text = self.format_combobox.currentText()
+        format_item = QTableWidgetItem(format_text)
+        self.download_table.setItem(row_position, 3, format_item)
+
+        # Use QProgressBar for status (now column 4)
+        progress_bar = QProgressBar()
+        progress_bar.setRange(0, 100)
+        progress_bar.setValue(0)
+        progress_bar.setFormat(DownloadStatus.PENDING.name.replace('_', ' ').title())
+        self.download_table.setCellWidget(row_position, 4, progress_bar)
+
+    def _request_visible_entry_details(self, *_):
+        """Starts fetching details for the visible rows that only have flat entry info."""
+        table = self.download_table
+        row_count = table.rowCount()
+        if row_count == 0:
+            return
+        first_row = max(table.rowAt(0), 0)
+        last_row = table.rowAt(table.viewport().height() - 1)
+        if last_row == -1:
+            last_row = row_count - 1
+        for row in range(first_row, last_row + 1):
+            item = table.item(row, 1)
+            if item and item.data(DETAILS_PENDING_ROLE):
+                item.setData(DETAILS_PENDING_ROLE, False)
+                url = item.data(Qt.UserRole)
+                self.download_manager.start_details_job(url, self._get_cookies_path_for_url(url))
+
+    def on_entry_details_ready(self, video_url, video_info):
+        """
+        Shows the title fetched for a flat playlist entry.
+        """
+        row = self._find_row_by_url(video_url)
+        title = video_info.get('title')
+        if row != -1 and title:
+            self.download_table.item(row, 1).setText(title)
 
     def on_fetch_error(self, error_message):
         """
@@ -1043,23 +1438,35 @@ class MainWindow(QMainWindow):
     def on_download_progress(self, video_url, progress_data):
         """
         Handles the progress signal from the DownloadWorker for a specific video.
+
+        Only the latest percentage of each video is kept; the progress bars are
+        redrawn together every PROGRESS_REFRESH_INTERVAL_MS.
         """
-        row = self._find_row_by_url(video_url)
+        row = self._find_download_row(video_url)
         if row != -1:
             progress = progress_data.get('_percent_str', '0.0%')
             # Strip ANSI escape codes
-            import re
-            clean_progress = re.sub(r'\x1b\[[0-9;]*m', '', progress)
+            clean_progress = _ANSI_RE.sub('', progress)
             
             try:
                 # Extract number from string like " 45.5%"
-                percent_str = clean_progress.strip().replace('%', '')
-                percent = float(percent_str)
-                self._update_item_status(row, DownloadStatus.DOWNLOADING, progress_value=percent)
+                percent = float(clean_progress.translate(_PERCENT_STRIP))
+                self._pending_progress[video_url] = percent
+                if not self._progress_timer.isActive():
+                    self._progress_timer.start()
             except ValueError:
                 # Fallback if parsing fails
                 self._update_item_status(row, DownloadStatus.DOWNLOADING, text_override=f"{self.download_table.item(row, 1).text()} ({clean_progress})")
 
+    def _flush_progress(self) -> None:
+        """Draws the pending download percentages into their rows."""
+        pending, self._pending_progress = self._pending_progress, {}
+        for video_url, percent in pending.items():
+            # Rows may have been cleared since the percentage arrived
+            row = self._find_download_row(video_url)
+            if row != -1:
+                self._update_item_status(row, DownloadStatus.DOWNLOADING, progress_value=percent)
+
     def _check_and_enable_button(self) -> None:
         """Checks if all downloads are complete and re-enables the download button."""
         if self.download_manager.is_idle():
@@ -1069,16 +1476,28 @@ class MainWindow(QMainWindow):
             
             # Show completion notification if we processed a batch
             if self._download_queue_total > 0:
-                self._show_completion_notification()
+                self._queue_completion_notification()
+
+    def _queue_completion_notification(self):
+        """Adds the finished batch to the next notification and (re)starts its timer."""
+        self._tray_pending_success += self._batch_success_count
+        self._tray_pending_fail += self._batch_fail_count
+        # Each result is reported once, even if the batch is checked again
+        self._batch_success_count = 0
+        self._batch_fail_count = 0
+        if self._tray_pending_success or self._tray_pending_fail:
+            self._tray_timer.start()
 
     def _show_completion_notification(self):
-        """Displays a system notification with download results."""
+        """Displays a system notification with the results of the batches finished since the last one."""
         title = "Downloads Complete"
-        message = f"Successful: {self._batch_success_count}, Failed: {self._batch_fail_count}"
+        message = f"Successful: {self._tray_pending_success}, Failed: {self._tray_pending_fail}"
         
-        if self._batch_fail_count == 0:
+        if self._tray_pending_fail == 0:
             message = "All downloads completed successfully."
         
+        self._tray_pending_success = 0
+        self._tray_pending_fail = 0
         self.tray_icon.showMessage(title, message, QSystemTrayIcon.Information, 10000)
 
     def _on_notification_clicked(self):
@@ -1087,14 +1506,17 @@ class MainWindow(QMainWindow):
         self.activateWindow()
         self.raise_()
 
-    def _record_to_history(self, video_url: str, status: str) -> None:
+    def _record_to_history(self, video_url: str, status: str, row: int = None) -> None:
         """Records a download to history.
 
         Args:
             video_url: The URL of the video.
             status: The status string ("completed", "failed", "cancelled").
+            row: The row of the download; looked up from the URL if not given.
         """
-        row = self._find_row_by_url(video_url)
+        output_folder = self._output_folder_by_url.pop(video_url, None)
+        if row is None:
+            row = self._find_download_row(video_url)
         if row == -1:
             return
 
@@ -1104,10 +1526,12 @@ class MainWindow(QMainWindow):
             format_str = self.download_table.item(row, 3).text() if self.download_table.item(row, 3) else "Unknown"
             platform = detect_platform(video_url)
 
-            # Construct file path
-            base_folder = self._current_output_folder or self.app_settings.download_folder_path
-            if self._organization_enabled:
-                base_folder = self._generate_organized_path(base_folder, video_url)
+            # Construct file path, in the folder the download was started with when known
+            base_folder = output_folder
+            if base_folder is None:
+                base_folder = self._current_output_folder or self.app_settings.download_folder_path
+                if self._organization_enabled:
+                    base_folder = self._generate_organized_path(base_folder, video_url)
 
             # Get format extension
             if quality == "Audio Only":
@@ -1120,9 +1544,9 @@ class MainWindow(QMainWindow):
 
             # Get file size if file exists
             file_size = 0
-            if status == "completed" and os.path.exists(file_path):
+            if status == "completed":
                 try:
-                    file_size = os.path.getsize(file_path)
+                    file_size = os.stat(file_path).st_size
                 except OSError:
                     pass
 
@@ -1138,6 +1562,7 @@ class MainWindow(QMainWindow):
                 status=status
             )
             self.history_service.add_entry(entry)
+            self._history_loaded = False
         except Exception as e:
             logger.error(f"Failed to record download to history: {e}")
 
@@ -1149,7 +1574,9 @@ class MainWindow(QMainWindow):
             video_url (str): The URL of the completed video.
             subtitle_status (str): Status of subtitles: "with_subs", "no_subs", "subs_embedded", or "".
         """
-        row = self._find_row_by_url(video_url)
+        # A percentage still waiting to be drawn must not overwrite the final status
+        self._pending_progress.pop(video_url, None)
+        row = self._find_download_row(video_url)
         if row != -1:
             # Update status based on subtitle result
             progress_bar = self.download_table.cellWidget(row, 4)
@@ -1163,9 +1590,11 @@ class MainWindow(QMainWindow):
                     progress_bar.setFormat("Completed (No Subs)")
                 else:
                     progress_bar.setFormat("Completed")
+            self._completed_rows.add(self._row_index(row))
 
         # Record to history
-        self._record_to_history(video_url, "completed")
+        self._record_to_history(video_url, "completed", row)
+        self._release_download_row(video_url)
         
         # Update progress
         self._download_completed_count += 1
@@ -1179,13 +1608,15 @@ class MainWindow(QMainWindow):
         """
         Handles the error signal from the DownloadWorker for a specific video.
         """
-        row = self._find_row_by_url(video_url)
+        self._pending_progress.pop(video_url, None)
+        row = self._find_download_row(video_url)
         if row != -1:
             self._update_item_status(row, DownloadStatus.ERROR)
         QMessageBox.warning(self, "Download Error", f"Error downloading {video_url}: {error_message}")
 
         # Record to history
-        self._record_to_history(video_url, "failed")
+        self._record_to_history(video_url, "failed", row)
+        self._release_download_row(video_url)
         
         # Update progress (errors count as "completed")
         self._download_completed_count += 1
@@ -1203,12 +1634,14 @@ class MainWindow(QMainWindow):
         Args:
             video_url (str): The URL of the cancelled video.
         """
-        row = self._find_row_by_url(video_url)
+        self._pending_progress.pop(video_url, None)
+        row = self._find_download_row(video_url)
         if row != -1:
             self._update_item_status(row, DownloadStatus.CANCELLED)
 
         # Record to history
-        self._record_to_history(video_url, "cancelled")
+        self._record_to_history(video_url, "cancelled", row)
+        self._release_download_row(video_url)
         
         # Update progress (cancelled downloads count as "completed")
         self._download_completed_count += 1
@@ -1225,22 +1658,11 @@ class MainWindow(QMainWindow):
     # History tab methods
     def _format_file_size(self, size_bytes: int) -> str:
         """Format bytes to human-readable string."""
-        if size_bytes < 1024:
-            return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+        return format_file_size(size_bytes)
 
     def _format_date(self, iso_date: str) -> str:
         """Format ISO 8601 date to human-readable string."""
-        try:
-            dt = datetime.fromisoformat(iso_date)
-            return dt.strftime("%b %d, %Y %I:%M %p")
-        except ValueError:
-            return iso_date
+        return format_date(iso_date)
 
     def _populate_history_table(self, entries=None) -> None:
         """Populates the history table with entries.
@@ -1251,32 +1673,9 @@ class MainWindow(QMainWindow):
         if entries is None:
             entries = self.history_service.get_all()
 
-        self.history_table.setRowCount(0)
-        for entry in entries:
-            row = self.history_table.rowCount()
-            self.history_table.insertRow(row)
-
-            # Date
-            date_item = QTableWidgetItem(self._format_date(entry.download_date))
-            date_item.setData(Qt.UserRole, entry.id)
-            self.history_table.setItem(row, 0, date_item)
-
-            # Title
-            title_item = QTableWidgetItem(entry.title)
-            self.history_table.setItem(row, 1, title_item)
-
-            # Platform
-            platform_item = QTableWidgetItem(entry.platform)
-            self.history_table.setItem(row, 2, platform_item)
-
-            # Size
-            size_item = QTableWidgetItem(self._format_file_size(entry.file_size))
-            self.history_table.setItem(row, 3, size_item)
-
-            # Path
-            path_item = QTableWidgetItem(entry.file_path)
-            path_item.setToolTip(entry.file_path)
-            self.history_table.setItem(row, 4, path_item)
+        self.history_model.set_entries(entries)
+        # The model reset dropped the selection
+        self._on_history_table_selectionChanged()
 
     def _get_history_entry_at_row(self, row: int) -> HistoryEntry | None:
         """Gets the HistoryEntry for a given row.
@@ -1287,34 +1686,59 @@ class MainWindow(QMainWindow):
         Returns:
             HistoryEntry if found, None otherwise.
         """
-        if row < 0 or row >= self.history_table.rowCount():
-            return None
-        date_item = self.history_table.item(row, 0)
-        if date_item:
-            entry_id = date_item.data(Qt.UserRole)
-            return self.history_service.get_entry_by_id(entry_id)
-        return None
+        return self.history_model.entry_at(row)
 
     def _on_tab_changed(self, index: int) -> None:
-        """Handles tab change to refresh history when History tab is selected."""
-        if index == 1:  # History tab
-            self._populate_history_table()
+        """Handles tab change to load history when the History tab is selected.
+
+        The table is only rebuilt if downloads were recorded since it was last filled.
+        """
+        if index == 1 and not self._history_loaded:  # History tab
+            # Keep any search the user typed before leaving the tab
+            self._run_history_search()
 
     def _on_history_search_input_textChanged(self, text: str) -> None:
-        """Handles history search input changes."""
-        entries = self.history_service.search(text)
-        self._populate_history_table(entries)
+        """Handles history search input changes by (re)starting the search timer."""
+        self._history_search_timer.start()
+
+    def _run_history_search(self) -> None:
+        """Filters the history table by the current search text.
+
+        The table holds the whole history; rows that do not match are hidden
+        rather than removed, so searching does not reset the model.
+        """
+        if not self._history_loaded:
+            self._populate_history_table()
+            self._history_loaded = True
+
+        text = self.history_search_input.text()
+        table = self.history_table
+        with self._bulk_table_update(table):
+            if text:
+                matching_ids = {entry.id for entry in self.history_service.search(text)}
+                for row, entry in enumerate(self.history_model.entries):
+                    table.setRowHidden(row, entry.id not in matching_ids)
+            else:
+                for row in range(self.history_model.rowCount()):
+                    table.setRowHidden(row, False)
+
+        # Drop the selection if its row was filtered out
+        current_row = table.currentIndex().row()
+        if current_row >= 0 and table.isRowHidden(current_row):
+            table.clearSelection()
+            table.setCurrentIndex(QModelIndex())
+            self._on_history_table_selectionChanged()
 
     def _on_history_table_selectionChanged(self) -> None:
         """Enables/disables history action buttons based on selection."""
-        has_selection = self.history_table.currentRow() >= 0
+        has_selection = self.history_table.currentIndex().row() >= 0
         self.open_file_button.setEnabled(has_selection)
         self.open_history_folder_button.setEnabled(has_selection)
         self.redownload_button.setEnabled(has_selection)
 
     def _on_open_file_button_clicked(self) -> None:
         """Opens the selected history entry's file."""
-        row = self.history_table.currentRow()
+        row = self.history_table.currentIndex().row()
         entry = self._get_history_entry_at_row(row)
         if entry:
             if os.path.exists(entry.file_path):
@@ -1324,7 +1748,7 @@ class MainWindow(QMainWindow):
 
     def _on_open_history_folder_button_clicked(self) -> None:
         """Opens the folder containing the selected history entry's file."""
-        row = self.history_table.currentRow()
+        row = self.history_table.currentIndex().row()
         entry = self._get_history_entry_at_row(row)
         if entry:
             folder_path = os.path.dirname(entry.file_path)
@@ -1335,7 +1759,7 @@ class MainWindow(QMainWindow):
 
     def _on_redownload_button_clicked(self) -> None:
         """Re-downloads the selected history entry."""
-        row = self.history_table.currentRow()
+        row = self.history_table.currentIndex().row()
         entry = self._get_history_entry_at_row(row)
         if entry:
             self.url_input.setText(entry.url)
@@ -1344,17 +1768,17 @@ class MainWindow(QMainWindow):
 
     def _clear_completed_downloads(self):
         """Removes all completed downloads from the list."""
-        rows_to_remove = []
-        for row in range(self.download_table.rowCount()):
-            # Check status widget (QProgressBar in column 4)
-            progress_bar = self.download_table.cellWidget(row, 4)
-            if isinstance(progress_bar, QProgressBar):
-                if progress_bar.format() == "Completed":
-                    rows_to_remove.append(row)
+        rows_to_remove = [index.row() for index in self._completed_rows if index.isValid()]
+        self._completed_rows.clear()
         
         # Remove in reverse order to maintain indices
         for row in sorted(rows_to_remove, reverse=True):
+            checkbox = self.download_table.cellWidget(row, 0)
+            if checkbox and checkbox.isChecked():
+                self._checked_count -= 1
             self.download_table.removeRow(row)
+        if rows_to_remove:
+            self._rebuild_url_index()
 
     def _clear_all_downloads(self):
         """Removes all downloads from the list. 
@@ -1374,7 +1798,12 @@ class MainWindow(QMainWindow):
             self.stop_download()
             
         self.download_table.setRowCount(0)
+        self._url_to_row.clear()
+        self._completed_rows.clear()
+        self._active_rows.clear()
+        self._pending_progress.clear()
         # Reset counters
+        self._checked_count = 0
         self._download_queue_total = 0
         self._download_completed_count = 0
         self._batch_success_count = 0
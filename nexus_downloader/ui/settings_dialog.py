@@ -13,13 +13,12 @@ from nexus_downloader.core.yt_dlp_service import (
     SUBTITLE_LANGUAGE_OPTIONS_LIST,
     DOWNLOAD_PRESETS_LIST,
 )
+from nexus_downloader.services.settings_service import AppSettings
 
 class SettingsDialog(QDialog):
-    settings_saved = Signal(int, str, str, str, str, str, str, str, bool, str, bool, str, dict,
-                            bool, bool, bool, bool, bool, str)
-    # limit, download_path, fb_cookies, bilibili_cookies, xiaohongshu_cookies, resolution, 
-    # video_format, audio_format, subtitles_enabled, subtitle_language, embed_subtitles, download_preset, folder_presets,
-    # organization_enabled, organize_by_platform, organize_by_date, organize_by_quality, organize_by_uploader, date_format
+    # Carries an AppSettings holding the edited values; settings the dialog does
+    # not show (recent folders) keep their defaults
+    settings_saved = Signal(object)
 
     def __init__(self, current_concurrent_downloads_limit: int, current_download_folder_path: str,
                  current_facebook_cookies_path: str, current_bilibili_cookies_path: str,
@@ -282,32 +281,28 @@ class SettingsDialog(QDialog):
         self.xiaohongshu_cookies_browse_button.clicked.connect(self._on_xiaohongshu_cookies_browse_clicked)
 
     def _on_save_clicked(self):
-        new_limit = self.concurrent_downloads_spinbox.value()
-        new_download_path = self.download_path_lineedit.text()
-        new_cookies_path = self.cookies_path_lineedit.text()
-        new_bilibili_cookies_path = self.bilibili_cookies_lineedit.text()
-        new_xiaohongshu_cookies_path = self.xiaohongshu_cookies_lineedit.text()
-        new_video_resolution = self.video_resolution_combobox.currentText()
-        new_video_format = self.video_format_combobox.currentText()
-        new_audio_format = self.audio_format_combobox.currentText()
-        new_subtitles_enabled = self.subtitles_enabled_checkbox.isChecked()
-        new_subtitle_language = self.subtitle_language_combobox.currentText()
-        new_embed_subtitles = self.embed_subtitles_checkbox.isChecked()
-        new_download_preset = self.preset_combobox.currentText()
-        new_organization_enabled = self.organization_enabled_checkbox.isChecked()
-        new_organize_by_platform = self.organize_by_platform_checkbox.isChecked()
-        new_organize_by_date = self.organize_by_date_checkbox.isChecked()
-        new_organize_by_quality = self.organize_by_quality_checkbox.isChecked()
-        new_organize_by_uploader = self.organize_by_uploader_checkbox.isChecked()
-        new_date_format = self.date_format_combo.currentText()
-        self.settings_saved.emit(
-            new_limit, new_download_path, new_cookies_path, new_bilibili_cookies_path,
-            new_xiaohongshu_cookies_path, new_video_resolution, new_video_format, new_audio_format,
-            new_subtitles_enabled, new_subtitle_language, new_embed_subtitles, new_download_preset,
-            self.current_folder_presets,
-            new_organization_enabled, new_organize_by_platform, new_organize_by_date,
-            new_organize_by_quality, new_organize_by_uploader, new_date_format
+        new_settings = AppSettings(
+            download_folder_path=self.download_path_lineedit.text(),
+            concurrent_downloads_limit=self.concurrent_downloads_spinbox.value(),
+            facebook_cookies_path=self.cookies_path_lineedit.text(),
+            bilibili_cookies_path=self.bilibili_cookies_lineedit.text(),
+            xiaohongshu_cookies_path=self.xiaohongshu_cookies_lineedit.text(),
+            video_resolution=self.video_resolution_combobox.currentText(),
+            video_format=self.video_format_combobox.currentText(),
+            audio_format=self.audio_format_combobox.currentText(),
+            subtitles_enabled=self.subtitles_enabled_checkbox.isChecked(),
+            subtitle_language=self.subtitle_language_combobox.currentText(),
+            embed_subtitles=self.embed_subtitles_checkbox.isChecked(),
+            download_preset=self.preset_combobox.currentText(),
+            folder_presets=self.current_folder_presets,
+            organization_enabled=self.organization_enabled_checkbox.isChecked(),
+            organize_by_platform=self.organize_by_platform_checkbox.isChecked(),
+            organize_by_date=self.organize_by_date_checkbox.isChecked(),
+            organize_by_quality=self.organize_by_quality_checkbox.isChecked(),
+            organize_by_uploader=self.organize_by_uploader_checkbox.isChecked(),
+            date_format=self.date_format_combo.currentText(),
         )
+        self.settings_saved.emit(new_settings)
         self.accept()
 
     def _refresh_presets_list(self) -> None:
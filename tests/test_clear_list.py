@@ -16,22 +16,13 @@ def test_clear_completed_downloads(main_window, qtbot):
     """Verify that 'Clear Completed' removes only completed items."""
     # Add 3 rows: Completed, Downloading, Completed
     # Note: Status column is now index 4 (columns: checkbox, title, quality, format, status)
-    main_window.download_table.setRowCount(3)
+    main_window.on_fetch_entries([{'title': f'Video {i}', 'url': f'url{i}'} for i in range(3)])
+    main_window.download_table.cellWidget(1, 4).setFormat("Downloading 50%")
     
-    # Row 0: Completed
-    pb0 = QProgressBar()
-    pb0.setFormat("Completed")
-    main_window.download_table.setCellWidget(0, 4, pb0)
-    
-    # Row 1: Downloading
-    pb1 = QProgressBar()
-    pb1.setFormat("Downloading 50%")
-    main_window.download_table.setCellWidget(1, 4, pb1)
-    
-    # Row 2: Completed
-    pb2 = QProgressBar()
-    pb2.setFormat("Completed")
-    main_window.download_table.setCellWidget(2, 4, pb2)
+    # Rows 0 and 2: Completed, one of them with subtitles
+    with patch.object(main_window, '_record_to_history'):
+        main_window.on_download_finished('url0')
+        main_window.on_download_finished('url2', "with_subs")
     
     # Click Clear Completed
     main_window._clear_completed_downloads()
@@ -43,6 +34,89 @@ def test_clear_completed_downloads(main_window, qtbot):
     remaining_pb = main_window.download_table.cellWidget(0, 4)
     assert remaining_pb.format() == "Downloading 50%"
 
+def test_clear_completed_keeps_downloads_started_again(main_window, qtbot):
+    """Verify that a completed item downloaded again is no longer cleared as completed."""
+    main_window.on_fetch_entries([{'title': 'Video 0', 'url': 'url0'}])
+    with patch.object(main_window, '_record_to_history'):
+        main_window.on_download_finished('url0')
+    main_window.download_table.cellWidget(0, 0).setChecked(True)
+    main_window.download_manager.start_download_job = MagicMock()
+    with patch.object(main_window, '_validate_folder', return_value=(True, "")):
+        main_window.start_download()
+
+    main_window._clear_completed_downloads()
+
+    assert main_window.download_table.rowCount() == 1
+
+def test_clear_completed_removes_every_row_of_a_repeated_url(main_window, qtbot):
+    """Verify that completing the same URL from two rows clears both rows."""
+    main_window.on_fetch_entries([
+        {'title': 'Video 0', 'url': 'url0'},
+        {'title': 'Video 1', 'url': 'url1'},
+        {'title': 'Video 0 again', 'url': 'url0'},
+    ])
+    with patch.object(main_window, '_record_to_history'):
+        main_window.on_download_finished('url0')
+        main_window.on_download_finished('url0')
+
+    assert main_window.download_table.cellWidget(0, 4).format() == "Completed"
+    assert main_window.download_table.cellWidget(2, 4).format() == "Completed"
+
+    main_window._clear_completed_downloads()
+
+    assert main_window.download_table.rowCount() == 1
+    assert main_window.download_table.item(0, 1).data(Qt.UserRole) == 'url1'
+
+def _download_rows(main_window, rows):
+    """Checks only the given rows and starts their download."""
+    for row in range(main_window.download_table.rowCount()):
+        main_window.download_table.cellWidget(row, 0).setChecked(row in rows)
+    main_window.download_manager.start_download_job = MagicMock()
+    with patch.object(main_window, '_validate_folder', return_value=(True, "")):
+        main_window.start_download()
+
+def test_repeated_url_progress_and_error_reach_the_downloaded_row(main_window, qtbot):
+    """Verify that signals of a URL downloaded again update the row being downloaded."""
+    main_window.on_fetch_entries([
+        {'title': 'Video 0', 'url': 'url0'},
+        {'title': 'Video 1', 'url': 'url1'},
+        {'title': 'Video 0 again', 'url': 'url0'},
+    ])
+    with patch.object(main_window, '_record_to_history'):
+        _download_rows(main_window, {0})
+        main_window.on_download_finished('url0')
+
+        _download_rows(main_window, {2})
+        main_window.on_download_progress('url0', {'_percent_str': ' 40.0%'})
+        main_window._flush_progress()
+        assert main_window.download_table.cellWidget(0, 4).format() == "Completed"
+        assert main_window.download_table.cellWidget(2, 4).format() == "Downloading 40.0%"
+
+        with patch('nexus_downloader.ui.main_window.QMessageBox.warning'):
+            main_window.on_download_error('url0', "HTTP Error 403")
+    assert main_window.download_table.cellWidget(0, 4).format() == "Completed"
+    assert main_window.download_table.cellWidget(2, 4).format() == "Error"
+
+    main_window._clear_completed_downloads()
+
+    assert main_window.download_table.rowCount() == 2
+    assert main_window.download_table.cellWidget(1, 4).format() == "Error"
+
+def test_repeated_url_history_records_the_downloaded_row(main_window, qtbot):
+    """Verify that a cancelled repeated URL is recorded with the title of its own row."""
+    main_window.on_fetch_entries([
+        {'title': 'Video 0', 'url': 'url0'},
+        {'title': 'Video 0 again', 'url': 'url0'},
+    ])
+    _download_rows(main_window, {1})
+    with patch.object(main_window.history_service, 'add_entry') as mock_add:
+        main_window.on_download_cancelled('url0')
+
+    assert mock_add.call_args.args[0].title == 'Video 0 again'
+    assert main_window.download_table.cellWidget(0, 4).format() != "Cancelled"
+    assert main_window.download_table.cellWidget(1, 4).format() == "Cancelled"
+    assert main_window._active_rows == {}
+
 def test_clear_all_downloads_idle(main_window, qtbot):
     """Verify 'Clear List' removes all items when idle."""
     # Mock download manager to be idle
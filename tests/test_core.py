@@ -2,17 +2,24 @@
 Unit tests for the core module.
 """
 import pytest
+import subprocess
+import sys
+import threading
+import time
 from unittest.mock import patch, MagicMock
 from PySide6.QtCore import QCoreApplication, QObject, Signal
 from nexus_downloader.core.yt_dlp_service import (
     YtDlpService,
     QUALITY_OPTIONS,
     QUALITY_OPTIONS_LIST,
+    QUALITY_OPTIONS_SET,
     get_format_string,
     VIDEO_FORMAT_OPTIONS,
     VIDEO_FORMAT_OPTIONS_LIST,
+    VIDEO_FORMAT_OPTIONS_SET,
     AUDIO_FORMAT_OPTIONS,
     AUDIO_FORMAT_OPTIONS_LIST,
+    AUDIO_FORMAT_OPTIONS_SET,
     get_video_format_ext,
     get_audio_format_ext,
     SUBTITLE_LANGUAGE_OPTIONS,
@@ -20,12 +27,26 @@ from nexus_downloader.core.yt_dlp_service import (
     get_subtitle_lang_code,
     detect_platform,
     sanitize_folder_name,
+    DOWNLOAD_INFO_TTL,
+    VideoInfoError,
+)
+from nexus_downloader.core.download_manager import (
+    DownloadManager, FetchWorker, DownloadWorker, EntryDetailsWorker, FETCH_BATCH_SIZE,
+    remove_stale_temp_dirs, temp_dir_name,
 )
-from nexus_downloader.core.download_manager import DownloadManager, FetchWorker, DownloadWorker
 import os
+import pathlib
 
 
 # Tests for quality format string mapping
+def test_option_tables_are_read_only():
+    """Test that the module-level option tables cannot be modified."""
+    with pytest.raises(TypeError):
+        QUALITY_OPTIONS["8K"] = "bestvideo"
+    with pytest.raises(TypeError):
+        VIDEO_FORMAT_OPTIONS["AVI"] = "avi"
+
+
 def test_get_format_string_best():
     """Test 'Best' quality returns correct format string."""
     assert get_format_string("Best") == "bestvideo+bestaudio/best"
@@ -71,6 +92,13 @@ def test_quality_options_list_all_in_dict():
         assert quality in QUALITY_OPTIONS
 
 
+def test_option_sets_match_lists():
+    """Test the membership sets hold exactly the items of their ordered lists."""
+    assert QUALITY_OPTIONS_SET == set(QUALITY_OPTIONS_LIST)
+    assert VIDEO_FORMAT_OPTIONS_SET == set(VIDEO_FORMAT_OPTIONS_LIST)
+    assert AUDIO_FORMAT_OPTIONS_SET == set(AUDIO_FORMAT_OPTIONS_LIST)
+
+
 # Tests for video format helper functions
 def test_get_video_format_ext_mp4():
     """Test 'MP4' format returns correct extension."""
@@ -298,7 +326,7 @@ def test_yt_dlp_service_get_single_video_info_success(mock_youtube_dl):
     """
     mock_ydl_instance = MagicMock()
     mock_ydl_instance.extract_info.return_value = {'title': 'Test Video'}
-    mock_youtube_dl.return_value.__enter__.return_value = mock_ydl_instance
+    mock_youtube_dl.return_value = mock_ydl_instance
 
     service = YtDlpService()
     videos, error = service.get_video_info('some_url')
@@ -315,7 +343,7 @@ def test_yt_dlp_service_get_playlist_info_success(mock_youtube_dl):
     mock_ydl_instance.extract_info.return_value = {
         'entries': [{'title': 'Video 1'}, {'title': 'Video 2'}]
     }
-    mock_youtube_dl.return_value.__enter__.return_value = mock_ydl_instance
+    mock_youtube_dl.return_value = mock_ydl_instance
 
     service = YtDlpService()
     videos, error = service.get_video_info('some_playlist_url')
@@ -323,6 +351,95 @@ def test_yt_dlp_service_get_playlist_info_success(mock_youtube_dl):
     assert videos == [{'title': 'Video 1'}, {'title': 'Video 2'}]
     assert error is None
 
+@patch('yt_dlp.YoutubeDL')
+def test_yt_dlp_service_get_video_info_uses_cache(mock_youtube_dl):
+    """
+    Test that repeated get_video_info calls for the same URL are served from the cache.
+    """
+    mock_ydl_instance = MagicMock()
+    mock_ydl_instance.extract_info.return_value = {'title': 'Test Video'}
+    mock_youtube_dl.return_value = mock_ydl_instance
+
+    service = YtDlpService()
+    first, _ = service.get_video_info('some_url')
+    second, error = service.get_video_info('some_url')
+
+    assert second == first == [{'title': 'Test Video'}]
+    assert error is None
+    mock_ydl_instance.extract_info.assert_called_once()
+
+    service.get_video_info('other_url')
+    assert mock_ydl_instance.extract_info.call_count == 2
+
+@patch('yt_dlp.YoutubeDL')
+def test_yt_dlp_service_reuses_youtube_dl_instance(mock_youtube_dl):
+    """
+    Test that get_video_info reuses its YoutubeDL instance and replaces it, closing the old one,
+    when another cookies file is used.
+    """
+    mock_ydl_instance = MagicMock()
+    mock_ydl_instance.extract_info.return_value = {'title': 'Test Video'}
+    mock_youtube_dl.return_value = mock_ydl_instance
+
+    service = YtDlpService()
+    service.get_video_info('url1')
+    service.get_video_info('url2')
+    assert mock_youtube_dl.call_count == 1
+    assert mock_ydl_instance.extract_info.call_count == 2
+
+    service.get_video_info('url3', cookies_file='cookies.txt')
+    assert mock_youtube_dl.call_count == 2
+    mock_ydl_instance.close.assert_called_once()
+    assert len(service._info_ydls) == 1
+
+@patch('yt_dlp.YoutubeDL')
+def test_yt_dlp_service_close_closes_instances_of_all_threads(mock_youtube_dl, tmp_path):
+    """
+    Test that close() reaches the instances of every fetch thread and replaced instances are closed.
+    """
+    created = []
+    def create(opts):
+        ydl = MagicMock()
+        ydl.extract_info.return_value = {'title': 'Test Video'}
+        created.append(ydl)
+        return ydl
+    mock_youtube_dl.side_effect = create
+    cookies_file = tmp_path / "cookies.txt"
+    cookies_file.write_text("# Netscape HTTP Cookie File\n")
+
+    service = YtDlpService()
+    service.get_video_info('url1', cookies_file=str(cookies_file))
+    os.utime(cookies_file, (0, 0))
+    service.get_video_info('url2', cookies_file=str(cookies_file))
+    created[0].close.assert_called_once()
+
+    thread = threading.Thread(target=service.get_video_info, args=('url3',))
+    thread.start()
+    thread.join()
+
+    service.close()
+    assert len(created) == 3
+    assert all(ydl.close.call_count == 1 for ydl in created)
+
+@patch('yt_dlp.YoutubeDL')
+def test_yt_dlp_service_get_playlist_info_uses_flat_extraction(mock_youtube_dl):
+    """
+    Test that known playlist URLs are extracted flat and single videos are not.
+    """
+    mock_ydl_instance = MagicMock()
+    mock_ydl_instance.extract_info.return_value = {'entries': [{'title': 'Video 1', 'url': 'u1'}]}
+    mock_youtube_dl.return_value = mock_ydl_instance
+
+    service = YtDlpService()
+    service.get_video_info('https://www.youtube.com/playlist?list=PL123')
+    assert mock_youtube_dl.call_args.args[0]['extract_flat'] == 'in_playlist'
+
+    mock_ydl_instance.extract_info.return_value = {'title': 'Video 1'}
+    info, error = service.get_single_video_info('https://www.youtube.com/watch?v=abc')
+    assert 'extract_flat' not in mock_youtube_dl.call_args.args[0]
+    assert info == {'title': 'Video 1'}
+    assert error is None
+
 @patch('yt_dlp.YoutubeDL')
 def test_yt_dlp_service_get_video_info_error(mock_youtube_dl):
     """
@@ -331,7 +448,7 @@ def test_yt_dlp_service_get_video_info_error(mock_youtube_dl):
     from yt_dlp.utils import DownloadError
     mock_ydl_instance = MagicMock()
     mock_ydl_instance.extract_info.side_effect = DownloadError('Test Error')
-    mock_youtube_dl.return_value.__enter__.return_value = mock_ydl_instance
+    mock_youtube_dl.return_value = mock_ydl_instance
 
     service = YtDlpService()
     videos, error = service.get_video_info('some_url')
@@ -365,28 +482,225 @@ def test_yt_dlp_service_download_video_success(mock_youtube_dl):
     if call_args.kwargs:
         ydl_opts.update(call_args.kwargs)
 
-    assert ydl_opts['outtmpl'] == f'{test_path}/%(title)s.%(ext)s'
+    assert ydl_opts['outtmpl'] == os.path.join(test_path, '%(title)s.%(ext)s')
     mock_ydl_instance.extract_info.assert_called_once_with(test_url, download=True)
 
+def test_yt_dlp_service_check_subtitle_result():
+    """
+    Test that the subtitle status reflects available, requested and embedded subtitles.
+    """
+    service = YtDlpService()
+    subs = {'en': [{'ext': 'vtt'}]}
+
+    assert service._check_subtitle_result(None, True) == "no_subs"
+    assert service._check_subtitle_result({}, True) == "no_subs"
+    assert service._check_subtitle_result({'automatic_captions': subs}, True) == "with_subs"
+    assert service._check_subtitle_result({'requested_subtitles': subs}, False) == "with_subs"
+    assert service._check_subtitle_result({'subtitles': subs, 'requested_subtitles': subs}, True) == "subs_embedded"
+
+@patch('yt_dlp.YoutubeDL')
+def test_yt_dlp_service_download_video_uses_native_downloader(mock_youtube_dl):
+    """
+    Test that download_video keeps yt-dlp's native downloader, whose progress hooks drive
+    the progress bar and cancellation, with parallel fragment downloads.
+    """
+    mock_ydl_instance = MagicMock()
+    mock_ydl_instance.extract_info.return_value = {'title': 'Test Video'}
+    mock_youtube_dl.return_value.__enter__.return_value = mock_ydl_instance
+
+    with patch('shutil.which', return_value='/usr/bin/aria2c'):
+        service = YtDlpService()
+    service.download_video("http://example.com/video", "/tmp/downloads")
+
+    ydl_opts = mock_youtube_dl.call_args.args[0]
+    assert 'external_downloader' not in ydl_opts
+    assert ydl_opts['concurrent_fragment_downloads'] == 8
+
+@patch('yt_dlp.YoutubeDL')
+def test_yt_dlp_service_download_video_resume_only_with_partial_files(mock_youtube_dl, tmp_path):
+    """
+    Test that resuming is disabled unless the download's temp dir holds partial files from an
+    earlier run, and that partial files of other downloads in the shared folder are ignored.
+    """
+    mock_youtube_dl.return_value.__enter__.return_value.extract_info.return_value = {'title': 'Test Video'}
+    service = YtDlpService()
+    temp_dir = tmp_path / "ndl_video"
+    temp_dir.mkdir()
+    (tmp_path / "Other.mp4.part").write_bytes(b"data")
+
+    service.download_video("http://example.com/video", str(tmp_path), temp_dir=str(temp_dir))
+    assert mock_youtube_dl.call_args.args[0]['continuedl'] is False
+
+    (temp_dir / "Interrupted.mp4.part").write_bytes(b"data")
+    service.download_video("http://example.com/video", str(tmp_path), temp_dir=str(temp_dir))
+    assert 'continuedl' not in mock_youtube_dl.call_args.args[0]
+
+    service.download_video("http://example.com/video", str(tmp_path))
+    assert 'continuedl' not in mock_youtube_dl.call_args.args[0]
+
+@patch('yt_dlp.YoutubeDL')
+def test_yt_dlp_service_download_video_into_temp_dir(mock_youtube_dl, tmp_path):
+    """
+    Test that a temp dir becomes yt-dlp's temp path, next to the download folder as home,
+    and that existing files are not overwritten.
+    """
+    mock_youtube_dl.return_value.__enter__.return_value.extract_info.return_value = {'title': 'Test Video'}
+    service = YtDlpService()
+
+    service.download_video("http://example.com/video", "/tmp/downloads", temp_dir=str(tmp_path))
+
+    ydl_opts = mock_youtube_dl.call_args.args[0]
+    assert ydl_opts['paths'] == {'home': "/tmp/downloads", 'temp': str(tmp_path)}
+    assert ydl_opts['outtmpl'] == '%(title)s.%(ext)s'
+    assert ydl_opts['overwrites'] is False
+    assert ydl_opts['continuedl'] is False
+
+@patch('yt_dlp.YoutubeDL')
+def test_yt_dlp_service_download_reuses_fetched_info(mock_youtube_dl, tmp_path):
+    """
+    Test that a download right after a fetch processes the fetched info instead of extracting again.
+    """
+    mock_ydl_instance = MagicMock()
+    mock_ydl_instance.__enter__.return_value = mock_ydl_instance
+    info = {'title': 'Test Video', 'webpage_url': 'https://www.youtube.com/watch?v=abc'}
+    mock_ydl_instance.extract_info.return_value = info
+    mock_youtube_dl.return_value = mock_ydl_instance
+
+    service = YtDlpService()
+    service.get_video_info('https://youtu.be/abc')
+    success, _, _ = service.download_video('https://www.youtube.com/watch?v=abc', str(tmp_path))
+
+    assert success
+    mock_ydl_instance.extract_info.assert_called_once_with('https://youtu.be/abc', download=False)
+    mock_ydl_instance.sanitize_info.assert_called_once_with(info, remove_private_keys=True)
+    assert mock_ydl_instance.sanitize_info.call_args.args[0] is not info
+    mock_ydl_instance.process_ie_result.assert_called_once_with(
+        mock_ydl_instance.sanitize_info.return_value, download=True)
+
+@patch('yt_dlp.YoutubeDL')
+def test_yt_dlp_service_download_extracts_again_when_fetched_info_fails(mock_youtube_dl, tmp_path):
+    """
+    Test that a download from stale fetched info is retried once with a fresh extraction.
+    """
+    import yt_dlp
+    mock_ydl_instance = MagicMock()
+    mock_ydl_instance.__enter__.return_value = mock_ydl_instance
+    info = {'title': 'Test Video', 'webpage_url': 'https://www.youtube.com/watch?v=abc'}
+    mock_ydl_instance.extract_info.return_value = info
+    mock_ydl_instance.process_ie_result.side_effect = yt_dlp.utils.DownloadError("HTTP Error 403: Forbidden")
+    mock_youtube_dl.return_value = mock_ydl_instance
+
+    service = YtDlpService()
+    service.get_video_info('https://youtu.be/abc')
+    success, _, _ = service.download_video('https://www.youtube.com/watch?v=abc', str(tmp_path))
+
+    assert success
+    mock_ydl_instance.process_ie_result.assert_called_once()
+    mock_ydl_instance.extract_info.assert_called_with('https://www.youtube.com/watch?v=abc', download=True)
+    assert service.get_cached_info('https://www.youtube.com/watch?v=abc') is None
+    assert service.get_cached_info('https://youtu.be/abc') is None
+
+@patch('yt_dlp.YoutubeDL')
+def test_yt_dlp_service_download_keeps_postprocessing_errors_of_fetched_info(mock_youtube_dl, tmp_path):
+    """
+    Test that a download from fetched info failing after the transfer is not repeated.
+    """
+    import yt_dlp
+    mock_ydl_instance = MagicMock()
+    mock_ydl_instance.__enter__.return_value = mock_ydl_instance
+    info = {'title': 'Test Video', 'webpage_url': 'https://www.youtube.com/watch?v=abc'}
+    mock_ydl_instance.extract_info.return_value = info
+
+    def fail_after_download(*args, **kwargs):
+        for hook in mock_youtube_dl.call_args.args[0]['progress_hooks']:
+            hook({'status': 'finished'})
+        raise yt_dlp.utils.DownloadError("ERROR: Postprocessing: Conversion failed!")
+    mock_ydl_instance.process_ie_result.side_effect = fail_after_download
+    mock_youtube_dl.return_value = mock_ydl_instance
+
+    service = YtDlpService()
+    service.get_video_info('https://youtu.be/abc')
+    mock_ydl_instance.extract_info.reset_mock()
+    success, _, error = service.download_video('https://www.youtube.com/watch?v=abc', str(tmp_path),
+                                               progress_hook=MagicMock())
+
+    assert not success
+    assert "Conversion failed" in error
+    mock_ydl_instance.extract_info.assert_not_called()
+
+@patch('yt_dlp.YoutubeDL')
+def test_yt_dlp_service_download_extracts_again_after_ttl(mock_youtube_dl, tmp_path):
+    """
+    Test that fetched info older than the TTL is not reused for the download.
+    """
+    mock_ydl_instance = MagicMock()
+    mock_ydl_instance.__enter__.return_value = mock_ydl_instance
+    mock_ydl_instance.extract_info.return_value = {'title': 'Test Video'}
+    mock_youtube_dl.return_value = mock_ydl_instance
+
+    service = YtDlpService()
+    with patch('nexus_downloader.core.yt_dlp_service.time.monotonic', return_value=1000.0):
+        service.get_video_info('https://www.youtube.com/watch?v=abc')
+    with patch('nexus_downloader.core.yt_dlp_service.time.monotonic',
+               return_value=1000.0 + DOWNLOAD_INFO_TTL):
+        assert service.get_cached_info('https://www.youtube.com/watch?v=abc') is None
+        service.download_video('https://www.youtube.com/watch?v=abc', str(tmp_path))
+
+    mock_ydl_instance.process_ie_result.assert_not_called()
+    mock_ydl_instance.extract_info.assert_called_with('https://www.youtube.com/watch?v=abc', download=True)
+
+def test_yt_dlp_is_not_imported_at_startup():
+    """
+    Test that importing the app modules does not load yt-dlp until it is first used.
+    """
+    code = ("import sys, nexus_downloader.core.download_manager, nexus_downloader.ui.main_window; "
+            "print('yt_dlp' in sys.modules)")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            env=dict(os.environ, QT_QPA_PLATFORM='offscreen'))
+    assert result.stdout.strip() == 'False'
+
 def test_fetch_worker_single_video(qtbot, app):
     """
     Test the FetchWorker with a single video.
     """
-    with patch('nexus_downloader.core.yt_dlp_service.YtDlpService.get_video_info') as mock_get_video_info:
-        mock_get_video_info.return_value = ([{'title': 'Test Video'}], None)
+    with patch('nexus_downloader.core.yt_dlp_service.YtDlpService.iter_video_info') as mock_iter_video_info:
+        mock_iter_video_info.return_value = iter([{'title': 'Test Video'}])
         worker = FetchWorker('some_url')
-        with qtbot.waitSignal(worker.finished) as blocker:
+        with qtbot.waitSignal(worker.signals.finished) as blocker:
             worker.run()
         assert blocker.args == [[{'title': 'Test Video'}]]
 
+def test_entry_details_worker_emits_full_info(qtbot, app):
+    """
+    Test that the EntryDetailsWorker emits the entry URL with its full metadata.
+    """
+    service = MagicMock()
+    service.get_single_video_info.return_value = ({'title': 'Video 1'}, None)
+    worker = EntryDetailsWorker('u1', 'cookies.txt', service)
+    with qtbot.waitSignal(worker.signals.finished) as blocker:
+        worker.run()
+    service.get_single_video_info.assert_called_once_with('u1', 'cookies.txt')
+    assert blocker.args == ['u1', {'title': 'Video 1'}]
+
+def test_download_manager_start_details_job_uses_fetch_pool(app):
+    """
+    Test that entry details are fetched on the fetch pool and forwarded by the manager.
+    """
+    manager = DownloadManager()
+    with patch('nexus_downloader.core.download_manager.EntryDetailsWorker') as MockWorker, \
+         patch.object(manager.fetch_pool, 'start') as mock_start:
+        manager.start_details_job('u1', 'cookies.txt')
+    MockWorker.assert_called_once_with('u1', 'cookies.txt', manager.yt_dlp_service)
+    mock_start.assert_called_once_with(MockWorker.return_value)
+
 def test_fetch_worker_playlist(qtbot, app):
     """
     Test the FetchWorker with a playlist.
     """
-    with patch('nexus_downloader.core.yt_dlp_service.YtDlpService.get_video_info') as mock_get_video_info:
-        mock_get_video_info.return_value = ([{'title': 'Video 1'}, {'title': 'Video 2'}], None)
+    with patch('nexus_downloader.core.yt_dlp_service.YtDlpService.iter_video_info') as mock_iter_video_info:
+        mock_iter_video_info.return_value = iter([{'title': 'Video 1'}, {'title': 'Video 2'}])
         worker = FetchWorker('some_playlist_url')
-        with qtbot.waitSignal(worker.finished) as blocker:
+        with qtbot.waitSignal(worker.signals.finished) as blocker:
             worker.run()
         assert blocker.args == [[{'title': 'Video 1'}, {'title': 'Video 2'}]]
 
@@ -394,24 +708,74 @@ def test_fetch_worker_error(qtbot, app):
     """
     Test the FetchWorker when an error occurs.
     """
-    with patch('nexus_downloader.core.yt_dlp_service.YtDlpService.get_video_info') as mock_get_video_info:
-        mock_get_video_info.return_value = (None, 'Test Error')
+    with patch('nexus_downloader.core.yt_dlp_service.YtDlpService.iter_video_info') as mock_iter_video_info:
+        mock_iter_video_info.side_effect = VideoInfoError('Test Error')
         worker = FetchWorker('some_url')
-        with qtbot.waitSignal(worker.error) as blocker:
+        with qtbot.waitSignal(worker.signals.error) as blocker:
             worker.run()
         assert blocker.args == ['Test Error']
 
+def test_fetch_worker_emits_playlist_in_batches(qtbot, app):
+    """
+    Test that a long playlist reaches the UI in batches while it is being read.
+    """
+    service = MagicMock()
+    videos = [{'title': f'Video {i}'} for i in range(FETCH_BATCH_SIZE + 1)]
+    service.iter_video_info.return_value = iter(videos)
+    worker = FetchWorker('some_playlist_url', None, service)
+    batches = []
+    worker.signals.entries_found.connect(batches.append)
+    with qtbot.waitSignal(worker.signals.finished) as blocker:
+        worker.run()
+    assert batches == [videos[:FETCH_BATCH_SIZE]]
+    assert blocker.args == [videos[FETCH_BATCH_SIZE:]]
+
+@patch('yt_dlp.YoutubeDL')
+def test_yt_dlp_service_iter_video_info_streams_flat_playlist(mock_youtube_dl):
+    """
+    Test that flat playlist entries are yielded from the unprocessed result and cached once read.
+    """
+    def entries():
+        yield {'title': 'Video 1', 'url': 'u1'}
+        yield None
+        yield {'title': 'Video 2', 'url': 'u2'}
+    mock_ydl_instance = MagicMock()
+    mock_ydl_instance.extract_info.return_value = {'_type': 'playlist', 'entries': entries()}
+    mock_youtube_dl.return_value = mock_ydl_instance
+    url = 'https://www.youtube.com/playlist?list=PL123'
+
+    service = YtDlpService()
+    stream = service.iter_video_info(url)
+    assert next(stream) == {'title': 'Video 1', 'url': 'u1'}
+    mock_ydl_instance.extract_info.assert_called_once_with(url, download=False, process=False)
+    assert list(stream) == [{'title': 'Video 2', 'url': 'u2'}]
+
+    videos, error = service.get_video_info(url)
+    assert [video['title'] for video in videos] == ['Video 1', 'Video 2']
+    assert mock_ydl_instance.extract_info.call_count == 1
+
 @patch('nexus_downloader.core.download_manager.FetchWorker')
 def test_download_manager_starts_fetch_job(MockFetchWorker, app):
     """
     Test that the DownloadManager starts a fetch job.
     """
     manager = DownloadManager()
-    manager.start_fetch_job('some_url')
-    assert manager.fetch_thread is not None
-    assert manager.fetch_worker is not None
-    manager.fetch_thread.quit()
-    manager.fetch_thread.wait()
+    with patch.object(manager.fetch_pool, 'start') as mock_start:
+        manager.start_fetch_job('some_url')
+    MockFetchWorker.assert_called_once_with('some_url', None, manager.yt_dlp_service)
+    mock_start.assert_called_once_with(MockFetchWorker.return_value)
+
+
+def test_download_manager_fetch_job_emits_fetch_finished(qtbot, app):
+    """
+    Test that a pooled fetch job reports its result through the manager's fetch_finished signal.
+    """
+    with patch('nexus_downloader.core.yt_dlp_service.YtDlpService.iter_video_info') as mock_iter_video_info:
+        mock_iter_video_info.return_value = iter([{'title': 'Test Video'}])
+        manager = DownloadManager()
+        with qtbot.waitSignal(manager.fetch_finished, timeout=5000) as blocker:
+            manager.start_fetch_job('some_url')
+    assert blocker.args == [[{'title': 'Test Video'}]]
 
 
 def test_download_manager_get_cookies_path_for_bilibili(app):
@@ -479,10 +843,184 @@ def test_download_worker(qtbot, app, mocker):
     assert blocker.args == [test_url, ""]
     mock_yt_dlp_service_instance.download_video.assert_called_once_with(
         test_url, test_path, test_resolution, test_video_format, test_audio_format,
-        progress_hook=worker.progress_hook, cookies_file=test_cookies,
-        subtitles_enabled=False, subtitle_language='en', embed_subtitles=False
+        progress_hook=worker.progress_hook, postprocessor_hook=worker.postprocessor_hook,
+        cookies_file=test_cookies,
+        subtitles_enabled=False, subtitle_language='en', embed_subtitles=False,
+        temp_dir=worker._temp_dir
     )
 
+def test_download_worker_throttles_progress(app):
+    """
+    Test that progress is emitted at most every interval, reduced to the forwarded fields.
+    """
+    worker = DownloadWorker(
+        'some_url', '/tmp/downloads', 'best', 'mp4', 'm4a', None, MagicMock()
+    )
+    received = []
+    worker.signals.progress.connect(lambda url, data: received.append(data))
+    progress = {'status': 'downloading', '_percent_str': ' 10.0%', 'downloaded_bytes': 10,
+                'total_bytes': 100, 'info_dict': {'title': 'Large info dict'}}
+
+    worker.progress_hook(progress)
+    worker.progress_hook(dict(progress, _percent_str=' 20.0%', downloaded_bytes=20))
+    worker.progress_hook(dict(progress, _percent_str='100.0%', downloaded_bytes=100))
+
+    assert [data['_percent_str'] for data in received] == [' 10.0%', '100.0%']
+    assert 'info_dict' not in received[0]
+
+def test_download_worker_progress_hook_raises_download_cancelled(app):
+    """
+    Test that the progress hook aborts a cancelled download with yt-dlp's DownloadCancelled.
+    """
+    from yt_dlp.utils import DownloadCancelled
+    event = threading.Event()
+    worker = DownloadWorker(
+        'some_url', '/tmp/downloads', 'best', 'mp4', 'm4a', None, MagicMock(), event
+    )
+    worker.progress_hook({'status': 'downloading'})
+    event.set()
+    with pytest.raises(DownloadCancelled):
+        worker.progress_hook({'status': 'downloading'})
+
+def test_download_worker_keeps_existing_files_and_removes_temp_dir(app, tmp_path):
+    """
+    Test that a finished file left in the temp dir gets a free name instead of replacing
+    an existing file, that files of earlier attempts are not moved, and that the temp dir
+    is removed after success.
+    """
+    (tmp_path / "Video.mp4").write_bytes(b"existing")
+
+    def fake_download(*args, temp_dir=None, postprocessor_hook=None, **kwargs):
+        (tmp_path / "stale.mp4.part").write_bytes(b"other download")
+        video_path = os.path.join(temp_dir, "Video.mp4")
+        with open(video_path, "wb") as f:
+            f.write(b"video")
+        with open(os.path.join(temp_dir, "Video.f137.mp4.part"), "wb") as f:
+            f.write(b"leftover")
+        with open(os.path.join(temp_dir, "Video.f140.m4a"), "wb") as f:
+            f.write(b"earlier attempt")
+        postprocessor_hook({'status': 'finished', 'postprocessor': 'MoveFiles',
+                            'info_dict': {'__files_to_move': {video_path: ''}}})
+        return True, None, None
+
+    service = MagicMock()
+    service.download_video.side_effect = fake_download
+    worker = DownloadWorker('some_url', str(tmp_path), 'best', 'mp4', 'm4a', None, service)
+    worker.run()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["Video (1).mp4", "Video.mp4", "stale.mp4.part"]
+    assert (tmp_path / "Video.mp4").read_bytes() == b"existing"
+    assert (tmp_path / "Video (1).mp4").read_bytes() == b"video"
+
+def test_download_worker_cancel_keeps_partial_files_for_resume(app, tmp_path):
+    """
+    Test that cancellation keeps the URL's temp dir, which a retry of the URL uses again,
+    and leaves other files alone.
+    """
+    other_part = tmp_path / "other.mp4.part"
+    other_part.write_bytes(b"data")
+    event = threading.Event()
+
+    def fake_download(*args, temp_dir=None, **kwargs):
+        with open(os.path.join(temp_dir, "Video.mp4.part"), "wb") as f:
+            f.write(b"partial")
+        event.set()
+        raise Exception("Download cancelled by user")
+
+    service = MagicMock()
+    service.download_video.side_effect = fake_download
+    worker = DownloadWorker('some_url', str(tmp_path), 'best', 'mp4', 'm4a', None, service, event)
+    cancelled = []
+    worker.signals.cancelled.connect(cancelled.append)
+    worker.run()
+
+    assert cancelled == ['some_url']
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([other_part.name, temp_dir_name('some_url')])
+    assert (pathlib.Path(worker._temp_dir) / "Video.mp4.part").read_bytes() == b"partial"
+
+    retry = DownloadWorker('some_url', str(tmp_path), 'best', 'mp4', 'm4a', None, service)
+    assert retry._temp_dir == worker._temp_dir
+
+def test_download_worker_without_resume_removes_temp_dir_on_error(app, tmp_path):
+    """
+    Test that a download with a temp dir of its own removes it after a failure.
+    """
+    def fake_download(*args, temp_dir=None, **kwargs):
+        with open(os.path.join(temp_dir, "Video.mp4.part"), "wb") as f:
+            f.write(b"partial")
+        return False, None, "HTTP Error 404"
+
+    service = MagicMock()
+    service.download_video.side_effect = fake_download
+    worker = DownloadWorker('some_url', str(tmp_path), 'best', 'mp4', 'm4a', None, service,
+                            download_id=7, resumable=False)
+    worker.run()
+
+    assert worker._temp_dir == str(tmp_path / temp_dir_name('some_url', 7))
+    assert list(tmp_path.iterdir()) == []
+
+def test_remove_stale_temp_dirs(tmp_path):
+    """
+    Test that only temp dirs untouched for the maximum age and not kept are removed.
+    """
+    old = time.time() - 100
+    stale_dir = tmp_path / "ndl_stale"
+    stale_dir.mkdir()
+    (stale_dir / "Video.mp4.part").write_bytes(b"partial")
+    os.utime(stale_dir / "Video.mp4.part", (old, old))
+    os.utime(stale_dir, (old, old))
+    recent_dir = tmp_path / "ndl_recent"
+    recent_dir.mkdir()
+    (recent_dir / "Video.mp4.part").write_bytes(b"partial")
+    os.utime(recent_dir, (old, old))
+    other_dir = tmp_path / "Music"
+    other_dir.mkdir()
+    os.utime(other_dir, (old, old))
+    resumed_dir = tmp_path / "ndl_resumed"
+    resumed_dir.mkdir()
+    os.utime(resumed_dir, (old, old))
+
+    remove_stale_temp_dirs(str(tmp_path), max_age=50, keep={"ndl_resumed"})
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["Music", "ndl_recent", "ndl_resumed"]
+
+@patch('nexus_downloader.core.download_manager.remove_stale_temp_dirs')
+@patch('nexus_downloader.core.download_manager.YtDlpService')
+def test_download_manager_sweeps_each_download_folder_once(mock_yt_dlp_service, mock_remove, qtbot, app, tmp_path):
+    """
+    Test that every folder a download runs in is scanned for stale temp dirs once,
+    sparing the temp dirs of the downloads being started.
+    """
+    mock_yt_dlp_service.return_value.download_video.return_value = (True, None, None)
+    manager = DownloadManager()
+    manager.fetch_pool.waitForDone()
+    mock_remove.reset_mock()
+    subfolder = str(tmp_path / "YouTube")
+
+    manager.start_download_job(['url1'], output_folder=subfolder)
+    manager.start_download_job(['url2'], output_folder=subfolder)
+    manager.fetch_pool.waitForDone()
+
+    mock_remove.assert_called_once_with(subfolder, keep=frozenset({temp_dir_name('url1')}))
+    qtbot.waitUntil(manager.is_idle, timeout=5000)
+
+def test_download_worker_cleanup_retries_with_backoff(app, tmp_path):
+    """
+    Test that cleanup retries a locked temp dir with exponentially growing delays.
+    """
+    worker = DownloadWorker(
+        'some_url', str(tmp_path), 'best', 'mp4', 'm4a', None, MagicMock()
+    )
+    worker._temp_dir = str(tmp_path / "ndl_locked")
+
+    with patch('nexus_downloader.core.download_manager.shutil.rmtree',
+               side_effect=[PermissionError(), PermissionError(), None]) as mock_rmtree, \
+         patch('nexus_downloader.core.download_manager.time.sleep') as mock_sleep:
+        worker._remove_temp_dir()
+
+    assert mock_rmtree.call_count == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.05, 0.1]
+
 @pytest.mark.integration
 def test_fetch_worker_tiktok_profile(qtbot, app):
     """
@@ -491,7 +1029,7 @@ def test_fetch_worker_tiktok_profile(qtbot, app):
     # Using a real TikTok profile URL to test the integration
     tiktok_url = "https://www.tiktok.com/@google"
     worker = FetchWorker(tiktok_url)
-    with qtbot.waitSignal(worker.finished, timeout=30000) as blocker:
+    with qtbot.waitSignal(worker.signals.finished, timeout=30000) as blocker:
         worker.run()
     
     # We expect a list of videos, so the list should not be empty
@@ -506,7 +1044,7 @@ def test_fetch_worker_invalid_tiktok_url(qtbot, app):
     """
     invalid_url = "https://www.tiktok.com/@invaliduser123456789"
     worker = FetchWorker(invalid_url)
-    with qtbot.waitSignal(worker.error, timeout=30000) as blocker:
+    with qtbot.waitSignal(worker.signals.error, timeout=30000) as blocker:
         worker.run()
     
     assert blocker.args
@@ -522,7 +1060,7 @@ def test_fetch_worker_invalid_tiktok_url(qtbot, app):
         facebook_url = "https://www.facebook.com/Google"
         cookies_file_path = os.path.join(os.path.dirname(__file__), 'facebook_cookies.txt')
         worker = FetchWorker(facebook_url, cookies_file=cookies_file_path)
-        with qtbot.waitSignal(worker.finished, timeout=30000) as blocker:
+        with qtbot.waitSignal(worker.signals.finished, timeout=30000) as blocker:
             worker.run()
         
         # We expect a list of videos, so the list should not be empty
@@ -536,7 +1074,7 @@ def test_fetch_worker_invalid_facebook_url(qtbot, app):
     """
     invalid_url = "https://www.facebook.com/invaliduser123456789"
     worker = FetchWorker(invalid_url)
-    with qtbot.waitSignal(worker.error, timeout=30000) as blocker:
+    with qtbot.waitSignal(worker.signals.error, timeout=30000) as blocker:
         worker.run()
     
     assert blocker.args
@@ -575,6 +1113,102 @@ def test_download_manager_concurrency_limit(mock_yt_dlp_service, qtbot, app):
 
     assert mock_yt_dlp_service_instance.download_video.call_count == 4
 
+@patch('nexus_downloader.core.download_manager.YtDlpService')
+def test_download_manager_cancel_queued_download(mock_yt_dlp_service, qtbot, app):
+    """
+    Test that cancelling a queued download takes it out of the pool and reports it as cancelled.
+    """
+    release = threading.Event()
+    mock_yt_dlp_service_instance = mock_yt_dlp_service.return_value
+    mock_yt_dlp_service_instance.download_video.side_effect = lambda *args, **kwargs: (
+        release.wait(5), (True, None, None))[1]
+
+    manager = DownloadManager()
+    manager.thread_pool.setMaxThreadCount(1)
+    manager.start_download_job(['url1', 'url2'])
+
+    with qtbot.waitSignal(manager.download_cancelled) as blocker:
+        manager.cancel_download('url2')
+    assert blocker.args == ['url2']
+
+    release.set()
+    qtbot.waitUntil(manager.is_idle, timeout=5000)
+    assert mock_yt_dlp_service_instance.download_video.call_count == 1
+
+@patch('nexus_downloader.core.download_manager.YtDlpService')
+def test_download_manager_stop_all_sets_every_event(mock_yt_dlp_service, qtbot, app, tmp_path):
+    """
+    Test that stop_all_downloads signals active downloads and drops queued ones.
+    """
+    started = threading.Event()
+    mock_yt_dlp_service_instance = mock_yt_dlp_service.return_value
+    def fake_download(*args, progress_hook=None, **kwargs):
+        started.set()
+        while True:
+            progress_hook({'status': 'downloading'})  # Raises once cancelled
+            time.sleep(0.01)
+    mock_yt_dlp_service_instance.download_video.side_effect = fake_download
+
+    manager = DownloadManager()
+    manager.thread_pool.setMaxThreadCount(1)
+    manager.start_download_job(['url1', 'url2', 'url3'], output_folder=str(tmp_path))
+    active_event = manager._cancellation_events[0]
+    assert started.wait(5)
+
+    cancelled = []
+    manager.download_cancelled.connect(cancelled.append)
+    manager.stop_all_downloads()
+    assert active_event.is_set()
+    qtbot.waitUntil(lambda: len(cancelled) == 3, timeout=5000)
+    assert sorted(cancelled) == ['url1', 'url2', 'url3']
+    qtbot.waitUntil(manager.is_idle, timeout=5000)
+    assert mock_yt_dlp_service_instance.download_video.call_count == 1
+
+@patch('nexus_downloader.core.download_manager.YtDlpService')
+def test_download_manager_tracks_repeated_url_separately(mock_yt_dlp_service, qtbot, app, tmp_path):
+    """
+    Test that a URL queued twice keeps the second download reachable after the first finishes.
+    """
+    calls = []
+    def fake_download(*args, progress_hook=None, **kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            return True, None, None
+        while True:
+            progress_hook({'status': 'downloading'})  # Raises once cancelled
+            time.sleep(0.01)
+    mock_yt_dlp_service.return_value.download_video.side_effect = fake_download
+
+    manager = DownloadManager()
+    manager.thread_pool.setMaxThreadCount(1)
+    with qtbot.waitSignal(manager.download_finished):
+        manager.start_download_job(['url1', 'url1'], output_folder=str(tmp_path))
+    qtbot.waitUntil(lambda: len(calls) == 2, timeout=5000)
+    assert list(manager._workers) == [1]
+
+    with qtbot.waitSignal(manager.download_cancelled) as blocker:
+        manager.stop_all_downloads()
+    assert blocker.args == ['url1']
+    qtbot.waitUntil(manager.is_idle, timeout=5000)
+    assert manager._cancellation_events == {}
+
+@patch('nexus_downloader.core.download_manager.YtDlpService')
+def test_download_manager_gives_repeated_url_its_own_temp_dir(mock_yt_dlp_service, qtbot, app, tmp_path):
+    """
+    Test that a URL queued while it is downloading gets a temp dir of its own, and that
+    the stable temp dir is free again once the download using it ends.
+    """
+    mock_yt_dlp_service.return_value.download_video.return_value = (False, None, "failed")
+    manager = DownloadManager()
+    manager.start_download_job(['url1', 'url1'], output_folder=str(tmp_path))
+
+    first, second = manager._workers.values()
+    assert first._temp_dir == str(tmp_path / temp_dir_name('url1'))
+    assert second._temp_dir == str(tmp_path / temp_dir_name('url1', second.download_id))
+
+    qtbot.waitUntil(manager.is_idle, timeout=5000)
+    assert manager._temp_dir_owners == {}
+
 def test_download_manager_set_concurrent_downloads(app):
     """
     Test that DownloadManager's set_concurrent_downloads method correctly updates the thread pool limit.
@@ -586,6 +1220,13 @@ def test_download_manager_set_concurrent_downloads(app):
 
     assert manager.thread_pool.maxThreadCount() == new_limit
 
+def test_download_manager_fetch_threads_never_expire(app):
+    """
+    Test that fetch threads, which own YoutubeDL instances, are kept instead of being replaced.
+    """
+    manager = DownloadManager()
+    assert manager.fetch_pool.expiryTimeout() == -1
+
 @patch('nexus_downloader.core.download_manager.DownloadWorker')
 @patch('nexus_downloader.core.download_manager.SettingsService') # Patch SettingsService where it's used in DownloadManager
 def test_download_manager_uses_settings_download_path(MockSettingsService, MockDownloadWorker, app):
@@ -617,10 +1258,10 @@ def test_download_manager_uses_settings_download_path(MockSettingsService, MockD
 @patch('yt_dlp.YoutubeDL')
 def test_yt_dlp_service_get_video_info_with_cookies(mock_youtube_dl):
     """
-    Test that get_video_info passes the cookies file to yt-dlp.
+    Test that get_video_info passes the cookies file to yt-dlp as a shared cookie jar.
     """
     mock_ydl_instance = MagicMock()
-    mock_youtube_dl.return_value.__enter__.return_value = mock_ydl_instance
+    mock_youtube_dl.return_value = mock_ydl_instance
 
     service = YtDlpService()
     test_url = "https://www.facebook.com/reel/12345"
@@ -628,16 +1269,41 @@ def test_yt_dlp_service_get_video_info_with_cookies(mock_youtube_dl):
     service.get_video_info(test_url, cookies_file=cookies_file)
 
     mock_youtube_dl.assert_called_once()
-    
-    # Check both positional and keyword arguments for ydl_opts
-    call_args = mock_youtube_dl.call_args
-    ydl_opts = {}
-    if call_args.args:
-        ydl_opts.update(call_args.args[0])
-    if call_args.kwargs:
-        ydl_opts.update(call_args.kwargs)
+    ydl_opts = mock_youtube_dl.call_args.args[0]
+    assert 'cookiefile' not in ydl_opts
+    assert mock_ydl_instance.cookiejar.filename == cookies_file
+
+NETSCAPE_COOKIES = (
+    "# Netscape HTTP Cookie File\n"
+    ".example.com\tTRUE\t/\tFALSE\t2147483647\tsession\tabc\n"
+)
+
+@patch('yt_dlp.YoutubeDL')
+def test_yt_dlp_service_download_video_reuses_parsed_cookies(mock_youtube_dl, tmp_path):
+    """
+    Test that downloads share one parsed cookie jar until the cookies file changes.
+    """
+    cookies_file = tmp_path / "cookies.txt"
+    cookies_file.write_text(NETSCAPE_COOKIES)
+    jars = []
 
-    assert ydl_opts['cookiefile'] == cookies_file
+    def capture(opts):
+        ydl = MagicMock()
+        ydl.__enter__.return_value = ydl
+        ydl.extract_info.side_effect = lambda *a, **k: jars.append(ydl.cookiejar) or {'title': 'Video'}
+        return ydl
+    mock_youtube_dl.side_effect = capture
+
+    service = YtDlpService()
+    service.download_video("http://example.com/1", str(tmp_path), cookies_file=str(cookies_file))
+    service.download_video("http://example.com/2", str(tmp_path), cookies_file=str(cookies_file))
+    assert 'cookiefile' not in mock_youtube_dl.call_args.args[0]
+    assert jars[0] is jars[1]
+    assert [cookie.name for cookie in jars[0]] == ['session']
+
+    os.utime(cookies_file, (0, 0))
+    service.download_video("http://example.com/3", str(tmp_path), cookies_file=str(cookies_file))
+    assert jars[2] is not jars[0]
 
 @pytest.mark.integration
 def test_fetch_worker_facebook_reel(qtbot, app):
@@ -652,7 +1318,7 @@ def test_fetch_worker_facebook_reel(qtbot, app):
         pytest.skip("Facebook cookies file not found. Skipping test.")
 
     worker = FetchWorker(facebook_url, cookies_file=cookies_file_path)
-    with qtbot.waitSignal(worker.finished, timeout=30000) as blocker:
+    with qtbot.waitSignal(worker.signals.finished, timeout=30000) as blocker:
         worker.run()
     
     assert blocker.args
@@ -707,6 +1373,15 @@ def test_detect_platform_unknown():
     assert detect_platform(None) == "Other"
 
 
+def test_detect_platform_by_hostname():
+    """Test detection uses the URL host, including subdomains and scheme-less URLs."""
+    assert detect_platform("https://m.youtube.com/watch?v=abc123") == "YouTube"
+    assert detect_platform("https://space.bilibili.com/123456") == "Bilibili"
+    assert detect_platform("HTTPS://WWW.TIKTOK.COM/@user") == "TikTok"
+    assert detect_platform("youtube.com/watch?v=abc123") == "YouTube"
+    assert detect_platform("https://example.com/?next=youtube.com") == "Other"
+
+
 # Tests for folder name sanitization (Story 8.2)
 def test_sanitize_folder_name_special_chars():
     """Test that special characters are replaced with underscores."""
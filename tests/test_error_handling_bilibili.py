@@ -37,6 +37,12 @@ class TestBilibiliErrorHandling:
         formatted = self.service._format_error_message(self.bilibili_url, error_msg)
         assert "collection or user space appears to be empty" in formatted
 
+    def test_format_error_keeps_check_order(self):
+        """Test that the earlier check wins when several keywords appear."""
+        error_msg = "Video was deleted; private playlist is empty"
+        formatted = self.service._format_error_message(self.bilibili_url, error_msg)
+        assert "may have been deleted" in formatted
+
     def test_format_error_generic_network(self):
         """Test generic network error on Bilibili URL."""
         error_msg = "Network is unreachable"
@@ -0,0 +1,73 @@
+"""
+Unit tests for the file_io helpers.
+"""
+import os
+import stat
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from nexus_downloader.services.file_io import atomic_write_bytes
+
+
+def test_atomic_write_bytes_replaces_contents(tmp_path):
+    """Test that the target is replaced and no temporary file is left behind."""
+    target = tmp_path / "data.json"
+    target.write_bytes(b"old")
+
+    atomic_write_bytes(str(target), b"new")
+
+    assert target.read_bytes() == b"new"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_atomic_write_bytes_keeps_original_on_failure(tmp_path):
+    """Test that a failed replace leaves the original file intact and cleans up."""
+    target = tmp_path / "data.json"
+    target.write_bytes(b"old")
+
+    with patch("nexus_downloader.services.file_io.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            atomic_write_bytes(str(target), b"new")
+
+    assert target.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_atomic_write_bytes_syncs_before_replace(tmp_path):
+    """Test that the data is fsynced before the temporary file is renamed."""
+    target = tmp_path / "data.json"
+    calls = []
+    real_fsync, real_replace = os.fsync, os.replace
+
+    def fsync(fd):
+        calls.append("fsync")
+        real_fsync(fd)
+
+    def replace(src, dst):
+        calls.append("replace")
+        real_replace(src, dst)
+
+    with patch("nexus_downloader.services.file_io.os.fsync", side_effect=fsync), \
+            patch("nexus_downloader.services.file_io.os.replace", side_effect=replace):
+        atomic_write_bytes(str(target), b"new")
+
+    assert calls == ["fsync", "replace"]
+    assert target.read_bytes() == b"new"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_atomic_write_bytes_keeps_file_mode(tmp_path):
+    """Test that a replaced file keeps its mode and a new file gets the umask default."""
+    target = tmp_path / "data.json"
+    target.write_bytes(b"old")
+    os.chmod(target, 0o644)
+
+    atomic_write_bytes(str(target), b"new")
+    assert stat.S_IMODE(os.stat(target).st_mode) == 0o644
+
+    new_target = tmp_path / "new.json"
+    with patch("nexus_downloader.services.file_io._UMASK", 0o022):
+        atomic_write_bytes(str(new_target), b"new")
+    assert stat.S_IMODE(os.stat(new_target).st_mode) == 0o644
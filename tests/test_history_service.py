@@ -1,10 +1,15 @@
 """
 Unit tests for the HistoryService module.
 """
+import gc
 import os
 import json
+import time
 import pytest
 import tempfile
+import weakref
+from dataclasses import asdict
+from nexus_downloader.services import history_service as history_service_module
 from nexus_downloader.services.history_service import HistoryService
 from nexus_downloader.core.data_models import HistoryEntry
 
@@ -19,7 +24,23 @@ def temp_history_dir():
 @pytest.fixture
 def history_service(temp_history_dir):
     """Create a HistoryService instance with a temporary directory."""
-    return HistoryService(history_dir=temp_history_dir)
+    service = HistoryService(history_dir=temp_history_dir)
+    yield service
+    service.close()  # Write pending entries before the directory is removed
+
+
+@pytest.fixture
+def open_history_service(temp_history_dir):
+    """Open further HistoryService instances on the temporary directory, closed after the test."""
+    services = []
+
+    def open_service():
+        service = HistoryService(history_dir=temp_history_dir)
+        services.append(service)
+        return service
+    yield open_service
+    for service in services:
+        service.close()
 
 
 # HistoryEntry tests
@@ -69,6 +90,17 @@ def test_history_entry_create_timestamp():
     assert "T" in timestamp  # ISO 8601 format has T separator
 
 
+def test_history_entry_slots_round_trip():
+    """Test that HistoryEntry has no per-instance __dict__ and round-trips through JSON."""
+    entry = HistoryEntry(
+        url="url1", title="Video 1", platform="YouTube",
+        download_date="2025-12-13T10:00:00", file_path="/test1.mp4",
+        file_size=100, quality="720p", format="MP4", status="completed"
+    )
+    assert not hasattr(entry, "__dict__")
+    assert HistoryEntry(**json.loads(json.dumps(asdict(entry)))) == entry
+
+
 # HistoryService tests
 def test_load_empty_history(history_service):
     """Test loading history when no file exists returns empty list."""
@@ -95,7 +127,7 @@ def test_add_entry_to_history(history_service):
     assert history_service.get_all()[0].url == "https://youtube.com/watch?v=test"
 
 
-def test_history_persistence(history_service, temp_history_dir):
+def test_history_persistence(history_service, temp_history_dir, open_history_service):
     """Test that history persists to JSON file and can be reloaded."""
     entry = HistoryEntry(
         url="https://youtube.com/watch?v=persist",
@@ -109,9 +141,10 @@ def test_history_persistence(history_service, temp_history_dir):
         status="completed"
     )
     history_service.add_entry(entry)
+    history_service.flush()
     
     # Create new service to reload from file
-    new_service = HistoryService(history_dir=temp_history_dir)
+    new_service = open_history_service()
     loaded = new_service.get_all()
     
     assert len(loaded) == 1
@@ -119,7 +152,7 @@ def test_history_persistence(history_service, temp_history_dir):
     assert loaded[0].title == "Persistent Video"
 
 
-def test_load_existing_history(history_service, temp_history_dir):
+def test_load_existing_history(history_service, temp_history_dir, open_history_service):
     """Test loading history entries from file."""
     # Add multiple entries
     for i in range(3):
@@ -135,9 +168,10 @@ def test_load_existing_history(history_service, temp_history_dir):
             status="completed"
         )
         history_service.add_entry(entry)
+    history_service.flush()
     
     # Reload
-    new_service = HistoryService(history_dir=temp_history_dir)
+    new_service = open_history_service()
     loaded = new_service.get_all()
     
     assert len(loaded) == 3
@@ -271,7 +305,7 @@ def test_entries_ordered_most_recent_first(history_service):
     assert entries[1].title == "First Entry"
 
 
-def test_invalid_json_backup_and_reset(temp_history_dir):
+def test_invalid_json_backup_and_reset(temp_history_dir, open_history_service):
     """Test that corrupted JSON file is backed up and service starts fresh."""
     # Create corrupted JSON file
     history_path = os.path.join(temp_history_dir, "download_history.json")
@@ -279,7 +313,7 @@ def test_invalid_json_backup_and_reset(temp_history_dir):
         f.write("{ invalid json }")
     
     # Create service - should handle corrupted file
-    service = HistoryService(history_dir=temp_history_dir)
+    service = open_history_service()
     
     # Should start with empty history
     assert len(service.get_all()) == 0
@@ -287,3 +321,228 @@ def test_invalid_json_backup_and_reset(temp_history_dir):
     # Backup file should exist
     backup_path = history_path + ".backup"
     assert os.path.exists(backup_path)
+
+
+def test_history_persistence_without_orjson(temp_history_dir, monkeypatch, open_history_service):
+    """Test that history round-trips through the stdlib json fallback."""
+    monkeypatch.setattr(history_service_module, "orjson", None)
+    service = open_history_service()
+    service.add_entry(HistoryEntry(
+        url="url1", title="Vidéo 1", platform="YouTube",
+        download_date="2025-12-13T10:00:00", file_path="/test1.mp4",
+        file_size=100, quality="720p", format="MP4", status="completed"
+    ))
+    service.flush()
+
+    with open(service.history_path, encoding='utf-8') as f:
+        assert json.loads(f.readline())["title"] == "Vidéo 1"
+    loaded = open_history_service().get_all()
+    assert [entry.title for entry in loaded] == ["Vidéo 1"]
+
+
+def test_add_entry_appends_one_line(history_service):
+    """Test that adding an entry appends a line instead of rewriting the file."""
+    for i in range(2):
+        history_service.add_entry(HistoryEntry(
+            url=f"url{i}", title=f"Video {i}", platform="YouTube",
+            download_date="2025-12-13T10:00:00", file_path=f"/test{i}.mp4",
+            file_size=100, quality="720p", format="MP4", status="completed"
+        ))
+    history_service.flush()
+    with open(history_service.history_path, 'rb') as f:
+        first_line = f.readline()
+    history_service.add_entry(HistoryEntry(
+        url="url2", title="Video 2", platform="YouTube",
+        download_date="2025-12-13T10:00:00", file_path="/test2.mp4",
+        file_size=100, quality="720p", format="MP4", status="completed"
+    ))
+    history_service.flush()
+
+    with open(history_service.history_path, 'rb') as f:
+        lines = f.read().splitlines()
+    assert lines[0] == first_line.rstrip(b"\n")
+    assert [json.loads(line)["title"] for line in lines] == ["Video 0", "Video 1", "Video 2"]
+
+
+def test_legacy_json_history_migrated(temp_history_dir, open_history_service):
+    """Test that a legacy JSON array history is converted to JSON Lines."""
+    legacy_path = os.path.join(temp_history_dir, "download_history.json")
+    entries = [
+        {"url": f"url{i}", "title": f"Video {i}", "platform": "YouTube",
+         "download_date": "2025-12-13T10:00:00", "file_path": f"/test{i}.mp4",
+         "file_size": 100, "quality": "720p", "format": "MP4",
+         "status": "completed", "id": f"id{i}"}
+        for i in (2, 1)  # Most recent first
+    ]
+    with open(legacy_path, 'w') as f:
+        json.dump(entries, f)
+
+    service = open_history_service()
+
+    assert [entry.id for entry in service.get_all()] == ["id2", "id1"]
+    assert not os.path.exists(legacy_path)
+    reloaded = open_history_service()
+    assert [entry.id for entry in reloaded.get_all()] == ["id2", "id1"]
+
+
+def test_corrupt_history_line_skipped_and_compacted(history_service, temp_history_dir, open_history_service):
+    """Test that a torn line is skipped, backed up and dropped from the file."""
+    history_service.add_entry(HistoryEntry(
+        url="url1", title="Video 1", platform="YouTube",
+        download_date="2025-12-13T10:00:00", file_path="/test1.mp4",
+        file_size=100, quality="720p", format="MP4", status="completed"
+    ))
+    history_service.flush()
+    with open(history_service.history_path, 'ab') as f:
+        f.write(b'{"url": "url2", "tit')
+
+    service = open_history_service()
+
+    assert [entry.title for entry in service.get_all()] == ["Video 1"]
+    assert os.path.exists(service.history_path + ".backup")
+    with open(service.history_path, 'rb') as f:
+        assert len(f.read().splitlines()) == 1
+
+
+def test_rapid_adds_written_together(history_service, monkeypatch):
+    """Test that entries added in quick succession are appended in one write."""
+    monkeypatch.setattr(history_service_module, "SAVE_DEBOUNCE_SECONDS", 0.05)
+    for i in range(3):
+        history_service.add_entry(HistoryEntry(
+            url=f"url{i}", title=f"Video {i}", platform="YouTube",
+            download_date="2025-12-13T10:00:00", file_path=f"/test{i}.mp4",
+            file_size=100, quality="720p", format="MP4", status="completed"
+        ))
+    assert not os.path.exists(history_service.history_path)
+
+    def written_lines():
+        try:
+            with open(history_service.history_path, 'rb') as f:
+                return len(f.read().splitlines())
+        except FileNotFoundError:
+            return 0
+
+    deadline = time.monotonic() + 5
+    while written_lines() < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert written_lines() == 3
+
+
+def test_search_after_reload(history_service, temp_history_dir, open_history_service):
+    """Test that entries loaded from disk are searchable alongside new ones."""
+    history_service.add_entry(HistoryEntry(
+        url="url1", title="Loaded Video", platform="Bilibili",
+        download_date="2025-12-13T10:00:00", file_path="/test1.mp4",
+        file_size=100, quality="720p", format="MP4", status="completed"
+    ))
+    history_service.flush()
+
+    service = open_history_service()
+    service.add_entry(HistoryEntry(
+        url="url2", title="New Video", platform="YouTube",
+        download_date="2025-12-13T11:00:00", file_path="/test2.mp4",
+        file_size=200, quality="720p", format="MP4", status="completed"
+    ))
+    service.flush()
+
+    assert [entry.title for entry in service.search("BILIBILI")] == ["Loaded Video"]
+    assert [entry.title for entry in service.search("video")] == ["New Video", "Loaded Video"]
+
+
+def test_get_entry_by_id_after_reload(history_service, temp_history_dir, open_history_service):
+    """Test that entries loaded from disk can be looked up by ID."""
+    entry = HistoryEntry(
+        url="url1", title="Video 1", platform="YouTube",
+        download_date="2025-12-13T10:00:00", file_path="/test1.mp4",
+        file_size=100, quality="720p", format="MP4", status="completed"
+    )
+    history_service.add_entry(entry)
+    history_service.flush()
+
+    found = open_history_service().get_entry_by_id(entry.id)
+    assert found is not None
+    assert found.title == "Video 1"
+
+
+def test_load_history_validates_record_fields(temp_history_dir, open_history_service):
+    """Test that unknown keys are dropped and records missing fields are skipped."""
+    base = {"url": "url1", "title": "Video 1", "platform": "YouTube",
+            "download_date": "2025-12-13T10:00:00", "file_path": "/test1.mp4",
+            "file_size": 100, "quality": "720p", "format": "MP4",
+            "status": "completed", "id": "id1"}
+    records = [dict(base, thumbnail="t.jpg"), {"url": "url2"}, ["not", "a", "record"]]
+    with open(os.path.join(temp_history_dir, "download_history.jsonl"), 'w') as f:
+        f.write("".join(json.dumps(record) + "\n" for record in records))
+
+    service = open_history_service()
+
+    assert [entry.id for entry in service.get_all()] == ["id1"]
+
+
+def test_search_matches_within_single_field(history_service):
+    """Test that a query never matches across the end of one field and the start of the next."""
+    history_service.add_entry(HistoryEntry(
+        url="https://example.com/ab", title="Video cd", platform="YouTube",
+        download_date="2025-12-13T10:00:00", file_path="/test1.mp4",
+        file_size=100, quality="720p", format="MP4", status="completed"
+    ))
+    history_service.add_entry(HistoryEntry(
+        url="https://example.com/ef", title="Video ab", platform="TikTok",
+        download_date="2025-12-13T11:00:00", file_path="/test2.mp4",
+        file_size=200, quality="720p", format="MP4", status="completed"
+    ))
+
+    assert history_service.search("cdhttps") == []
+    assert [entry.platform for entry in history_service.search("AB")] == ["TikTok", "YouTube"]
+    assert [entry.platform for entry in history_service.search("video")] == ["TikTok", "YouTube"]
+
+
+def test_history_capped_at_max_entries(temp_history_dir, monkeypatch, open_history_service):
+    """Test that only the newest MAX_ENTRIES entries are kept and the file is compacted."""
+    monkeypatch.setattr(HistoryService, "MAX_ENTRIES", 3)
+    monkeypatch.setattr(history_service_module, "HISTORY_COMPACT_SLACK", 1)
+    service = open_history_service()
+    for i in range(6):
+        service.add_entry(HistoryEntry(
+            url=f"url{i}", title=f"Video {i}", platform="YouTube",
+            download_date="2025-12-13T10:00:00", file_path=f"/test{i}.mp4",
+            file_size=100, quality="720p", format="MP4", status="completed"
+        ))
+    service.flush()
+
+    assert [entry.url for entry in service.get_all()] == ["url5", "url4", "url3"]
+    assert service.search("url0") == []
+
+    reloaded = open_history_service()
+    assert [entry.url for entry in reloaded.get_all()] == ["url5", "url4", "url3"]
+    with open(reloaded.history_path, 'rb') as f:
+        assert len(f.read().splitlines()) == 3
+
+
+def test_close_stops_writer_and_releases_service(temp_history_dir):
+    """Test that close() writes pending entries, ends the writer thread and lets the service be collected."""
+    service = HistoryService(history_dir=temp_history_dir)
+    service.add_entry(HistoryEntry(
+        url="url1", title="Video 1", platform="YouTube",
+        download_date="2025-12-13T10:00:00", file_path="/test1.mp4",
+        file_size=100, quality="720p", format="MP4", status="completed"
+    ))
+    writer = service._writer
+    service.close()
+
+    assert not writer.is_alive()
+    with open(service.history_path, 'rb') as f:
+        assert len(f.read().splitlines()) == 1
+
+    service.add_entry(HistoryEntry(
+        url="url2", title="Video 2", platform="YouTube",
+        download_date="2025-12-13T10:01:00", file_path="/test2.mp4",
+        file_size=100, quality="720p", format="MP4", status="completed"
+    ))
+    with open(service.history_path, 'rb') as f:
+        assert len(f.read().splitlines()) == 2
+
+    service_ref = weakref.ref(service)
+    del service
+    gc.collect()
+    assert service_ref() is None
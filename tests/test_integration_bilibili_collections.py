@@ -39,7 +39,7 @@ class TestBilibiliCollectionsIntegration:
             '_type': 'playlist'
         }
         
-        with patch('nexus_downloader.core.yt_dlp_service.yt_dlp.YoutubeDL') as mock_ydl_cls:
+        with patch('yt_dlp.YoutubeDL') as mock_ydl_cls:
             mock_instance = mock_ydl_cls.return_value
             mock_instance.__enter__.return_value = mock_instance
             mock_instance.extract_info.return_value = mock_info
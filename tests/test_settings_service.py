@@ -57,6 +57,21 @@ def test_save_and_load_settings(settings_service):
     assert loaded_settings.video_resolution == "1080p"
 
 
+def test_save_settings_skips_unchanged_write(settings_service):
+    """Test that saving settings identical to the file on disk does not rewrite it."""
+    settings = settings_service.load_settings()
+    settings_path = settings_service.settings_path
+    os.utime(settings_path, ns=(0, 0))
+
+    settings_service.save_settings(settings)
+    assert os.stat(settings_path).st_mtime_ns == 0
+
+    settings.concurrent_downloads_limit = 4
+    settings_service.save_settings(settings)
+    assert os.stat(settings_path).st_mtime_ns != 0
+    assert settings_service.load_settings().concurrent_downloads_limit == 4
+
+
 def test_save_and_load_bilibili_cookies(settings_service):
     """Test saving and loading Bilibili cookies path."""
     settings = AppSettings(bilibili_cookies_path="/cookies/bilibili.txt")
@@ -1,6 +1,7 @@
 """
 Unit tests for the UI module.
 """
+import dataclasses
 import pytest
 from unittest.mock import patch, MagicMock
 from PySide6.QtWidgets import QApplication, QTableWidgetItem, QCheckBox
@@ -11,8 +12,10 @@ class MockDownloadManager(QObject):
     """
     A mock DownloadManager for testing purposes.
     """
+    fetch_entries = Signal(list)
     fetch_finished = Signal(list)
     fetch_error = Signal(str)
+    entry_details_ready = Signal(str, dict)
     download_progress = Signal(str, dict)
     download_finished = Signal(str)
     download_error = Signal(str, str)
@@ -29,6 +32,12 @@ class MockDownloadManager(QObject):
         """
         pass
 
+    def start_details_job(self, url, cookies_file=None):
+        """
+        A mock method to start fetching the details of a playlist entry.
+        """
+        pass
+
     def start_download_job(self, video_urls, video_resolution="best", video_format="mp4", audio_format="m4a",
                            subtitles_enabled=False, subtitle_language="en", embed_subtitles=False,
                            output_folder=None):
@@ -78,6 +87,20 @@ def test_main_window_creation(app):
     window = MainWindow()
     assert window is not None
 
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_main_window_fills_secondary_widgets_after_init(qtbot, app):
+    """Test that folder choices, preset tooltips and the path preview are filled once the event loop runs."""
+    window = MainWindow()
+    assert window.folder_combobox.count() == 0
+
+    qtbot.waitUntil(lambda: window.folder_combobox.count() > 0)
+    assert window.folder_combobox.itemData(0) == "default"
+    from nexus_downloader.core.yt_dlp_service import DOWNLOAD_PRESET_TOOLTIPS
+    for i in range(window.preset_combobox.count()):
+        preset_name = window.preset_combobox.itemText(i)
+        assert window.preset_combobox.itemData(i, Qt.ToolTipRole) == DOWNLOAD_PRESET_TOOLTIPS.get(preset_name, "")
+    assert window.path_preview_label.text()
+
 @patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
 def test_main_window_fetch(qtbot, app):
     """Test the fetch functionality of the main window."""
@@ -210,20 +233,145 @@ def test_select_all_sync_with_items(qtbot, app):
         checkbox = window.download_table.cellWidget(row, 0)
         assert checkbox.isChecked()
 
-    # Uncheck one item - this should trigger _on_item_state_changed
+    # Uncheck one item - this should trigger _on_item_toggled
     checkbox = window.download_table.cellWidget(0, 0)
     checkbox.setChecked(False)
 
     # Verify "Select All" is unchecked
     assert not window.select_all_checkbox.isChecked()
 
-    # Check the item back - this should trigger _on_item_state_changed
+    # Check the item back - this should trigger _on_item_toggled
     checkbox.setChecked(True)
 
     # Verify "Select All" is checked again
     assert window.select_all_checkbox.isChecked()
 
 
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_select_all_sync_after_rows_change(qtbot, app):
+    """Test that "Select All" follows the checked rows as rows are added and cleared."""
+    window = MainWindow()
+    window.on_fetch_finished([{'title': 'Video 1', 'url': 'url1'}])
+    window.select_all_checkbox.setChecked(True)
+
+    window.on_fetch_finished([{'title': 'Video 2', 'url': 'url2'}])
+    assert not window.select_all_checkbox.isChecked()
+
+    window.download_table.cellWidget(1, 0).setChecked(True)
+    assert window.select_all_checkbox.isChecked()
+
+    with patch.object(window, '_record_to_history'):
+        window.on_download_finished('url1')
+    window._clear_completed_downloads()
+    window.on_fetch_finished([{'title': 'Video 3', 'url': 'url3'}])
+    window.download_table.cellWidget(1, 0).setChecked(True)
+    assert window.select_all_checkbox.isChecked()
+
+def test_find_row_by_url_follows_row_changes(qtbot, app):
+    """Test that rows are found by URL as rows are added and cleared."""
+    window = MainWindow()
+    window.on_fetch_finished([{'title': 'Video 1', 'url': 'url1'}, {'title': 'Video 2', 'url': 'url2'}])
+    assert window._find_row_by_url('url1') == 0
+    assert window._find_row_by_url('url2') == 1
+    assert window._find_row_by_url('missing') == -1
+
+    with patch.object(window, '_record_to_history'):
+        window.on_download_finished('url1')
+    window._clear_completed_downloads()
+    assert window._find_row_by_url('url1') == -1
+    assert window._find_row_by_url('url2') == 0
+
+    window.download_manager.is_idle = MagicMock(return_value=True)
+    window._clear_all_downloads()
+    assert window._find_row_by_url('url2') == -1
+
+def test_download_progress_parses_colored_percentage(qtbot, app):
+    """Test that a percentage wrapped in ANSI color codes updates the row's progress bar."""
+    window = MainWindow()
+    window.on_fetch_finished([{'title': 'Video 1', 'url': 'url1'}])
+    window.on_download_progress('url1', {'_percent_str': '\x1b[0;94m 45.5%\x1b[0m'})
+    window._flush_progress()
+    assert window.download_table.cellWidget(0, 4).value() == 45
+
+def test_download_progress_is_coalesced(qtbot, app):
+    """Test that progress ticks are drawn together and never overwrite a finished row."""
+    window = MainWindow()
+    window.on_fetch_finished([{'title': 'Video 1', 'url': 'url1'}, {'title': 'Video 2', 'url': 'url2'}])
+    window.on_download_progress('url1', {'_percent_str': '10.0%'})
+    window.on_download_progress('url1', {'_percent_str': '20.0%'})
+    window.on_download_progress('url2', {'_percent_str': '30.0%'})
+    assert window.download_table.cellWidget(0, 4).value() == 0
+    assert window._progress_timer.isActive()
+
+    qtbot.waitUntil(lambda: window.download_table.cellWidget(1, 4).value() == 30)
+    assert window.download_table.cellWidget(0, 4).format() == "Downloading 20.0%"
+
+    window.on_download_progress('url1', {'_percent_str': '90.0%'})
+    with patch.object(window, '_record_to_history'):
+        window.on_download_finished('url1')
+    window._flush_progress()
+    assert window.download_table.cellWidget(0, 4).format() == "Completed"
+
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_browse_folder_validates_in_background(qtbot, app, tmp_path):
+    """Test that a browsed folder is validated off the UI thread while downloads are held off."""
+    window = MainWindow()
+    target = tmp_path / "new_folder"
+    with patch('nexus_downloader.ui.main_window.QFileDialog.getExistingDirectory', return_value=str(target)), \
+            patch('nexus_downloader.ui.main_window.QMessageBox.warning') as mock_warning:
+        window._on_browse_folder_clicked()
+        assert window._current_output_folder == str(target)
+        assert not window.download_button.isEnabled()
+        qtbot.waitUntil(window.download_button.isEnabled)
+
+    assert target.is_dir()
+    mock_warning.assert_not_called()
+
+
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_folder_validation_failure_warns(qtbot, app):
+    """Test that an unusable browsed folder is reported and downloads are allowed again."""
+    window = MainWindow()
+    window._current_output_folder = "/bad"
+    window._pending_folder_validation = "/bad"
+    window.download_button.setEnabled(False)
+    with patch('nexus_downloader.ui.main_window.QMessageBox.warning') as mock_warning:
+        window._on_folder_validated("/old", False, "stale")
+        assert not window.download_button.isEnabled()
+        window._on_folder_validated("/bad", False, "The folder is not writable.")
+
+    assert window.download_button.isEnabled()
+    mock_warning.assert_called_once()
+
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_preset_applies_without_cascade(qtbot, app):
+    """Test that choosing a preset applies its quality and format without re-detecting the preset."""
+    window = MainWindow()
+    window.preset_combobox.setCurrentText("Balanced")
+    with patch.object(window, '_update_preset_from_current_settings') as mock_detect:
+        window.preset_combobox.setCurrentText("Audio Only")
+
+    mock_detect.assert_not_called()
+    assert window.resolution_combobox.currentText() == "Audio Only"
+    assert window.format_combobox.currentText() == "M4A"
+    assert window.preset_combobox.currentText() == "Audio Only"
+    assert not window.format_combobox.signalsBlocked()
+
+    window.resolution_combobox.setCurrentText("480p")
+    assert window.preset_combobox.currentText() == "Custom"
+
+
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_suspend_signals_restores_previous_state(qtbot, app):
+    """Test that nested signal suspension leaves an outer block in place."""
+    window = MainWindow()
+    with window._suspend_signals(window.format_combobox):
+        with window._suspend_signals(window.format_combobox, window.preset_combobox):
+            assert window.preset_combobox.signalsBlocked()
+        assert window.format_combobox.signalsBlocked()
+        assert not window.preset_combobox.signalsBlocked()
+    assert not window.format_combobox.signalsBlocked()
+
 @patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
 def test_fetch_button_loading_state(qtbot, app):
     """Test that fetch button shows loading state during fetch operation."""
@@ -344,6 +492,32 @@ def test_download_button_mixed_results(qtbot, app):
     assert window.download_button.text() == "Download"
 
 
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_completion_notifications_are_combined(qtbot, app):
+    """Test that batches finishing close together produce one tray notification."""
+    window = MainWindow()
+    window.on_fetch_finished([{'title': 'Video 1', 'url': 'url1'}, {'title': 'Video 2', 'url': 'url2'}])
+    with patch.object(window.tray_icon, 'showMessage') as mock_show, \
+            patch('nexus_downloader.ui.main_window.QMessageBox.warning'):
+        for row, url in enumerate(['url1', 'url2']):
+            window.download_table.cellWidget(0, 0).setChecked(False)
+            window.download_table.cellWidget(1, 0).setChecked(False)
+            window.download_table.cellWidget(row, 0).setChecked(True)
+            window.start_download()
+            window.download_manager._mark_download_complete(url)
+            if url == 'url1':
+                window.download_manager.download_finished.emit(url)
+            else:
+                window.download_manager.download_error.emit(url, 'Test error')
+        mock_show.assert_not_called()
+
+        qtbot.waitUntil(lambda: mock_show.call_count == 1)
+        assert mock_show.call_args[0][1] == "Successful: 1, Failed: 1"
+
+        window._check_and_enable_button()
+        qtbot.wait(window._tray_timer.interval() + 100)
+        assert mock_show.call_count == 1
+
 # Tests for path preview and organized path generation (Story 8.2)
 @patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
 def test_path_preview_disabled(qtbot, app):
@@ -394,6 +568,20 @@ def test_path_preview_quality_only(qtbot, app):
     assert window.path_preview_label.text() == "Preview: 1080p/"
 
 
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_path_preview_follows_quality_only_when_used(qtbot, app):
+    """Test that quality changes refresh the preview only when quality is an organization rule."""
+    window = MainWindow()
+    window._organization_enabled = True
+    window._organize_by_quality = False
+    with patch.object(window, '_update_path_preview') as mock_preview:
+        window.resolution_combobox.setCurrentText("480p")
+    mock_preview.assert_not_called()
+
+    window._organize_by_quality = True
+    window.resolution_combobox.setCurrentText("720p")
+    assert "720p/" in window.path_preview_label.text()
+
 @patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
 def test_path_preview_multiple_rules(qtbot, app):
     """Test path preview shows combined rules in correct order."""
@@ -486,6 +674,83 @@ def test_generate_organized_path_combined(qtbot, app):
     assert result == os.path.join("/downloads", "TikTok", "720p", "MyChannel")
 
 
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_organization_flags_follow_settings(qtbot, app):
+    """Test that the organization switches are packed into bits and updated from saved settings."""
+    from nexus_downloader.ui.main_window import ORG_ENABLED, ORG_PLATFORM, ORG_QUALITY
+    window = MainWindow()
+    window._org_flags = 0
+    window._organization_enabled = True
+    window._organize_by_quality = True
+    assert window._org_flags == ORG_ENABLED | ORG_QUALITY
+    window._organize_by_quality = False
+    assert window._org_flags == ORG_ENABLED
+    assert window._generate_organized_path("/downloads", "https://youtube.com/watch?v=1") == "/downloads"
+
+    settings = dataclasses.replace(window.app_settings, organization_enabled=True, organize_by_platform=True,
+                                   organize_by_date=False, organize_by_quality=False, organize_by_uploader=False)
+    with patch.object(window.settings_service, 'save_settings'), \
+            patch('nexus_downloader.ui.main_window.QMessageBox.information'):
+        window._on_settings_saved(settings)
+    assert window._org_flags == ORG_ENABLED | ORG_PLATFORM
+    assert window._organize_by_platform and not window._organize_by_date
+
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_settings_dialog_saves_app_settings(qtbot, app):
+    """Test that settings saved in the dialog replace the window's settings and keep its recent folders."""
+    from nexus_downloader.ui.settings_dialog import SettingsDialog
+    window = MainWindow()
+    window.app_settings.recent_folders = ["/recent"]
+    dialog = SettingsDialog(3, "/downloads", "", "", "", "720p", "MP4", "M4A", True, "English", False,
+                            "Balanced", {"Music": "/music"}, current_organization_enabled=True,
+                            current_organize_by_date=True, current_date_format="YYYY")
+    qtbot.addWidget(dialog)
+    dialog.settings_saved.connect(window._on_settings_saved)
+    with patch.object(window.settings_service, 'save_settings') as mock_save, \
+            patch('nexus_downloader.ui.main_window.QMessageBox.information'):
+        dialog._on_save_clicked()
+
+    settings = window.app_settings
+    mock_save.assert_called_once_with(settings)
+    assert settings.concurrent_downloads_limit == 3
+    assert settings.download_folder_path == "/downloads"
+    assert settings.folder_presets == {"Music": "/music"}
+    assert settings.recent_folders == ["/recent"]
+    assert window._organize_by_date and window._date_format == "YYYY"
+    assert window.subtitle_checkbox.isChecked()
+
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_generate_organized_path_date(qtbot, app):
+    """Test that the date folder follows the setting and is reformatted when the minute changes."""
+    import os
+    from datetime import datetime as real_datetime
+    window = MainWindow()
+    window._organization_enabled = True
+    window._organize_by_platform = False
+    window._organize_by_date = True
+    window._organize_by_quality = False
+    window._organize_by_uploader = False
+    window._date_format = "YYYY-MM-DD"
+
+    with patch('nexus_downloader.ui.main_window.time.time', return_value=60.0), \
+            patch('nexus_downloader.ui.main_window.datetime') as mock_datetime:
+        mock_datetime.now.return_value = real_datetime(2025, 12, 13, 15, 30)
+        assert window._generate_organized_path("/downloads", "url") == os.path.join("/downloads", "2025-12-13")
+        window._date_format = "YYYY"
+        assert window._generate_organized_path("/downloads", "url") == os.path.join("/downloads", "2025")
+        assert mock_datetime.now.call_count == 1
+
+    with patch('nexus_downloader.ui.main_window.time.time', return_value=120.0), \
+            patch('nexus_downloader.ui.main_window.datetime') as mock_datetime:
+        mock_datetime.now.return_value = real_datetime(2026, 1, 1, 0, 0)
+        assert window._generate_organized_path("/downloads", "url") == os.path.join("/downloads", "2026")
+
+        # Unknown settings fall back to year and month, in the preview too
+        window._date_format = "bogus"
+        assert window._generate_organized_path("/downloads", "url") == os.path.join("/downloads", "2026-01")
+        window._update_path_preview()
+        assert window.path_preview_label.text() == "Preview: 2026-01/"
+
 @patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
 def test_generate_organized_path_uploader_none(qtbot, app):
     """Test _generate_organized_path skips uploader when None provided."""
@@ -518,8 +783,9 @@ def test_history_tab_exists(qtbot, app):
 def test_history_table_columns(qtbot, app):
     """Test that history table has correct columns."""
     window = MainWindow()
-    assert window.history_table.columnCount() == 5
-    headers = [window.history_table.horizontalHeaderItem(i).text() for i in range(5)]
+    model = window.history_table.model()
+    assert model.columnCount() == 5
+    headers = [model.headerData(i, Qt.Horizontal) for i in range(5)]
     assert headers == ["Date", "Title", "Platform", "Size", "Path"]
 
 
@@ -531,6 +797,18 @@ def test_history_search_input_exists(qtbot, app):
     assert window.history_search_input.placeholderText() == "Search history..."
 
 
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_history_search_is_debounced(qtbot, app):
+    """Test that a burst of keystrokes runs a single history search for the final text."""
+    window = MainWindow()
+    with patch.object(window.history_service, 'search', return_value=[]) as mock_search:
+        for text in ("a", "ab", "abc"):
+            window.history_search_input.setText(text)
+        assert mock_search.call_count == 0
+        qtbot.waitUntil(lambda: mock_search.call_count == 1)
+        mock_search.assert_called_once_with("abc")
+
+
 @patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
 def test_history_action_buttons_exist(qtbot, app):
     """Test that history action buttons are present."""
@@ -549,6 +827,101 @@ def test_history_buttons_disabled_by_default(qtbot, app):
     assert not window.redownload_button.isEnabled()
 
 
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_populate_history_table(qtbot, app):
+    """Test that the history table shows one row per entry and is refilled on repopulate."""
+    from nexus_downloader.core.data_models import HistoryEntry
+    window = MainWindow()
+    entries = [
+        HistoryEntry(url=f"https://youtube.com/watch?v={i}", title=f"Video {i}", platform="YouTube",
+                     download_date="2025-12-13T15:30:00", file_path=f"/downloads/video{i}.mp4",
+                     file_size=2048, quality="1080p", format="MP4", status="completed")
+        for i in range(3)
+    ]
+    window._populate_history_table(entries)
+    model = window.history_table.model()
+    assert model.rowCount() == 3
+    assert model.index(2, 1).data() == "Video 2"
+    assert model.index(0, 0).data(Qt.UserRole) == entries[0].id
+    assert model.index(0, 3).data() == "2.0 KB"
+    assert model.index(1, 4).data(Qt.ToolTipRole) == "/downloads/video1.mp4"
+    assert window._get_history_entry_at_row(2) is entries[2]
+    assert window._get_history_entry_at_row(3) is None
+
+    window._populate_history_table(entries[:1])
+    assert model.rowCount() == 1
+
+
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_history_search_hides_rows(qtbot, app):
+    """Test that searching hides non-matching history rows instead of rebuilding the table."""
+    from nexus_downloader.core.data_models import HistoryEntry
+    window = MainWindow()
+    entries = [
+        HistoryEntry(url=f"https://youtube.com/watch?v={i}", title=title, platform="YouTube",
+                     download_date="2025-12-13T15:30:00", file_path=f"/downloads/video{i}.mp4",
+                     file_size=2048, quality="1080p", format="MP4", status="completed")
+        for i, title in enumerate(["Cats", "Dogs", "More cats"])
+    ]
+    with patch.object(window.history_service, 'get_all', return_value=entries), \
+            patch.object(window.history_service, 'search', return_value=[entries[0], entries[2]]):
+        window.tab_widget.setCurrentIndex(1)
+        window.history_table.selectRow(1)
+        assert window.redownload_button.isEnabled()
+
+        with patch.object(window.history_model, 'set_entries') as mock_set_entries:
+            window.history_search_input.setText("cats")
+            window._run_history_search()
+        mock_set_entries.assert_not_called()
+
+    assert window.history_table.model().rowCount() == 3
+    assert [window.history_table.isRowHidden(row) for row in range(3)] == [False, True, False]
+    assert not window.redownload_button.isEnabled()
+
+    window.history_search_input.setText("")
+    window._run_history_search()
+    assert not any(window.history_table.isRowHidden(row) for row in range(3))
+
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_history_tab_loads_lazily(qtbot, app):
+    """Test that history is read when the History tab is first shown and after new downloads only."""
+    window = MainWindow()
+    with patch.object(window.history_service, 'get_all', return_value=[]) as mock_get_all, \
+            patch.object(window.history_service, 'add_entry'):
+        mock_get_all.assert_not_called()
+        window.tab_widget.setCurrentIndex(1)
+        window.tab_widget.setCurrentIndex(0)
+        window.tab_widget.setCurrentIndex(1)
+        assert mock_get_all.call_count == 1
+
+        window.tab_widget.setCurrentIndex(0)
+        window.on_fetch_finished([{'title': 'Video 1', 'url': 'url1'}])
+        window._record_to_history('url1', 'completed')
+        window.tab_widget.setCurrentIndex(1)
+        assert mock_get_all.call_count == 2
+
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_history_records_the_download_folder(qtbot, app, tmp_path):
+    """Test that history records the folder a download was started with and the file's size."""
+    window = MainWindow()
+    window._organization_enabled = False
+    window._current_output_folder = str(tmp_path)
+    window.on_fetch_finished([{'title': 'Test Video', 'url': 'url1'}])
+    window.download_table.item(0, 2).setText("720p")
+    window.download_table.item(0, 3).setText("MP4")
+    window.download_table.cellWidget(0, 0).setChecked(True)
+    with patch.object(window, '_add_recent_folder'):
+        window.start_download()
+    (tmp_path / "Test Video.mp4").write_bytes(b"12345")
+    window._current_output_folder = str(tmp_path / "other")
+
+    with patch.object(window.history_service, 'add_entry') as mock_add_entry:
+        window._record_to_history('url1', 'completed')
+    entry = mock_add_entry.call_args.args[0]
+    assert entry.file_path == str(tmp_path / "Test Video.mp4")
+    assert entry.file_size == 5
+    assert 'url1' not in window._output_folder_by_url
+
 @patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
 def test_format_file_size(qtbot, app):
     """Test file size formatting helper."""
@@ -569,6 +942,83 @@ def test_format_date(qtbot, app):
     assert "PM" in result
 
 
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_flat_entries_get_details_on_demand(qtbot, app):
+    """Test that untitled playlist entries request their details and show the fetched title."""
+    window = MainWindow()
+    with patch.object(window.download_manager, 'start_details_job') as mock_details:
+        window.on_fetch_finished([{'url': 'url1'}, {'title': 'Video 2', 'url': 'url2'}])
+        window._request_visible_entry_details()
+
+    mock_details.assert_called_once_with('url1', '')
+    assert window.download_table.item(0, 1).text() == 'Unknown Title'
+
+    window.download_manager.entry_details_ready.emit('url1', {'title': 'Video 1'})
+    assert window.download_table.item(0, 1).text() == 'Video 1'
+
+
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_get_cookies_path_for_url(qtbot, app):
+    """Test that cookies are picked by the URL's host, case-insensitively."""
+    window = MainWindow()
+    window.app_settings.bilibili_cookies_path = "/path/to/bilibili.txt"
+    window.app_settings.facebook_cookies_path = "/path/to/fb.txt"
+
+    assert window._get_cookies_path_for_url("https://WWW.Bilibili.com/video/BV1xx") == "/path/to/bilibili.txt"
+    assert window._get_cookies_path_for_url("https://fb.watch/abc") == "/path/to/fb.txt"
+    assert window._get_cookies_path_for_url("https://www.youtube.com/watch?v=bilibili.com") == ""
+
+
+
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_recent_folder_save_is_deferred(qtbot, app, tmp_path):
+    """Test that recent folders are kept in memory and written to disk once, later."""
+    window = MainWindow()
+    window.app_settings.recent_folders = []
+    with patch.object(window.settings_service, 'save_settings') as mock_save:
+        window._add_recent_folder(str(tmp_path / "a"))
+        window._add_recent_folder(str(tmp_path / "b"))
+        window._add_recent_folder(str(tmp_path / "a"))
+
+        assert window.app_settings.recent_folders == [str(tmp_path / "a"), str(tmp_path / "b")]
+        mock_save.assert_not_called()
+
+        window._flush_settings()
+        window._flush_settings()
+        mock_save.assert_called_once_with(window.app_settings)
+
+
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_close_event_closes_history_service(qtbot, app):
+    """Test that closing the window stops the history writer."""
+    window = MainWindow()
+    with patch.object(window.history_service, 'close') as mock_close:
+        window.close()
+        mock_close.assert_called_once()
+
+
+@patch('nexus_downloader.ui.main_window.DownloadManager', new=MockDownloadManager)
+def test_recent_folder_updates_combobox_in_place(qtbot, app, tmp_path):
+    """Test that adding recent folders leaves the dropdown as a full rebuild would."""
+    window = MainWindow()
+    window.app_settings.recent_folders = []
+    window.app_settings.folder_presets = {"Music": str(tmp_path / "music")}
+    window._populate_folder_combobox()
+
+    def combobox_items():
+        return [(window.folder_combobox.itemText(i), window.folder_combobox.itemData(i))
+                for i in range(window.folder_combobox.count())]
+
+    with patch.object(window.settings_service, 'save_settings'):
+        for name in ["a", "b", "c", "d", "e", "f", "c", "c"]:
+            window._add_recent_folder(str(tmp_path / name))
+            incremental = combobox_items()
+            window._populate_folder_combobox()
+            assert incremental == combobox_items()
+
+    assert window.folder_combobox.itemText(2) == "Recent: c"
+    assert len(window.app_settings.recent_folders) == 5
+
 # Tests for Main Window Layout Zones (Story 9.2)
 class TestMainWindowLayout:
     """Tests for the three-zone layout structure."""
@@ -74,3 +74,19 @@ class TestURLValidator:
         """Test is_valid_url with Xiaohongshu URL."""
         url = "https://www.xiaohongshu.com/explore/64a123bc000000000b000000"
         assert URLValidator.is_valid_url(url) is True
+
+    def test_is_playlist_url(self):
+        """Test playlist, collection and profile URLs are detected as playlists."""
+        assert URLValidator.is_playlist_url("https://space.bilibili.com/1234567") is True
+        assert URLValidator.is_playlist_url("https://www.bilibili.com/medialist/play/123456") is True
+        assert URLValidator.is_playlist_url(
+            "https://www.xiaohongshu.com/user/profile/5b6e7f8g0000000001000000") is True
+        assert URLValidator.is_playlist_url("https://www.youtube.com/playlist?list=PL123") is True
+        assert URLValidator.is_playlist_url("https://www.youtube.com/watch?v=abc&list=PL123") is True
+
+    def test_is_playlist_url_single_video(self):
+        """Test single video URLs are not detected as playlists."""
+        assert URLValidator.is_playlist_url("https://www.bilibili.com/video/BV1xx411c7mD") is False
+        assert URLValidator.is_playlist_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ") is False
+        assert URLValidator.is_playlist_url(
+            "https://www.xiaohongshu.com/explore/64a123bc000000000b000000") is False